@@ -0,0 +1,71 @@
+"""Speed of building request bodies: ``json.dumps`` of the whole body against ``request_body``.
+
+Run with ``python benchmarks/bench_body.py``.
+"""
+
+import json
+import timeit
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.body import _dumps, request_body
+
+var_first = Variable(name="first", type="Int!")
+
+
+def make_operation(n_queries: int) -> Operation:
+    return Operation(
+        name="Feed",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{i}",
+                arguments=[Argument(name="id", value=f'"{i}"')],
+                fields=[
+                    "id",
+                    "title",
+                    "body",
+                    Field(
+                        name="comments",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["id", "body", Field(name="author", fields=["id", "login", "name"])],
+                    ),
+                ],
+            )
+            for i in range(n_queries)
+        ],
+    )
+
+
+def dumps_body(operation: Operation, variables: dict) -> bytes:
+    body = {"query": operation.render(), "variables": variables, "operationName": operation.name}
+    return json.dumps(body).encode("utf-8")
+
+
+def main() -> None:
+    print(f"encoder: {_dumps.__name__}")
+
+    for n_queries in (1, 10, 100):
+        operation = make_operation(n_queries)
+        document = operation.render()
+        size = len(document.encode("utf-8"))
+        request_body(operation, {"first": 10})
+
+        number = max(10, 10000 // n_queries)
+        render_seconds = timeit.timeit(lambda: dumps_body(operation, {"first": 10}), number=number) / number
+        dumps_seconds = (
+            timeit.timeit(
+                lambda: json.dumps({"query": document, "variables": {"first": 10}}).encode("utf-8"), number=number
+            )
+            / number
+        )
+        body_seconds = timeit.timeit(lambda: request_body(operation, {"first": 10}), number=number) / number
+
+        print(
+            f"queries={n_queries:4d}  document={size:7d} B  render + dumps={render_seconds * 1e6:9.1f} us  "
+            f"dumps={dumps_seconds * 1e6:7.1f} us  request_body={body_seconds * 1e6:6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
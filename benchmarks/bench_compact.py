@@ -0,0 +1,78 @@
+"""Sending node trees to worker processes: pickled nodes against the compact form, and ``render_bulk``.
+
+Run with ``python benchmarks/bench_compact.py``.
+"""
+
+import pickle
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.compact import from_compact, to_compact
+from graphql_query.render import render_bulk, render_many
+
+var_first = Variable(name="first", type="Int!")
+
+
+def make_operation(i: int) -> Operation:
+    return Operation(
+        name=f"Feed{i}",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{j}",
+                arguments=[Argument(name="id", value=f'"{i}-{j}"')],
+                fields=[
+                    "id",
+                    "title",
+                    Field(
+                        name="comments",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["id", "body", Field(name="author", fields=["id", "login"])],
+                    ),
+                ],
+            )
+            for j in range(5)
+        ],
+    )
+
+
+def best(function, number: int = 5, repeat: int = 7) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    operations = [make_operation(i) for i in range(1000)]
+    compacts = [to_compact(operation) for operation in operations]
+    pickled = pickle.dumps(operations)
+    pickled_compacts = pickle.dumps(compacts)
+
+    print(f"pickled nodes:        {len(pickled) / len(operations):7.0f} B/operation")
+    print(f"pickled compact form: {len(pickled_compacts) / len(operations):7.0f} B/operation")
+
+    dumps = best(lambda: pickle.dumps(operations))
+    loads = best(lambda: pickle.loads(pickled))
+    compact_dumps = best(lambda: pickle.dumps([to_compact(operation) for operation in operations]))
+    compact_loads = best(lambda: [from_compact(compact) for compact in pickle.loads(pickled_compacts)])
+    print(f"parent (dumps):  nodes {dumps * 1e3:7.2f} ms  compact {compact_dumps * 1e3:7.2f} ms")
+    print(f"worker (loads):  nodes {loads * 1e3:7.2f} ms  compact {compact_loads * 1e3:7.2f} ms")
+
+    render = best(lambda: [operation.render() for operation in operations], number=1, repeat=3)
+    print(f"rendering:             {render * 1e3:7.2f} ms")
+
+    with ProcessPoolExecutor() as executor:
+        render_many(operations[:100], executor)
+
+        start = time.perf_counter()
+        render_many(operations, executor)
+        print(f"render_many (processes): {len(operations) / (time.perf_counter() - start):9.0f} operations/s")
+
+        start = time.perf_counter()
+        count = sum(1 for _ in render_bulk(make_operation, range(len(operations)), executor))
+        print(f"render_bulk (processes): {count / (time.perf_counter() - start):9.0f} operations/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Requests per second of building request bodies with and without ``Operation.compile()``.
+
+Run with ``python benchmarks/bench_compiled.py``.
+"""
+
+import json
+import timeit
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+
+var_owner = Variable(name="owner", type="String!")
+var_name = Variable(name="name", type="String!")
+var_first = Variable(name="first", type="Int")
+
+
+def make_operation() -> Operation:
+    author = Field(
+        name="author", fields=["login", "name", Field(name="avatarUrl", arguments=[Argument(name="size", value=64)])]
+    )
+
+    return Operation(
+        name="Repository",
+        variables=[var_owner, var_name, var_first],
+        queries=[
+            Query(
+                name="repository",
+                arguments=[Argument(name="owner", value=var_owner), Argument(name="name", value=var_name)],
+                fields=[
+                    "id",
+                    "name",
+                    "description",
+                    Field(
+                        name="issues",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["totalCount", Field(name="nodes", fields=["id", "title", "createdAt", author])],
+                    ),
+                ],
+            )
+        ],
+    )
+
+
+def render_request(owner: str, name: str, first: int) -> bytes:
+    operation = make_operation()
+    body = {
+        "query": operation.render(),
+        "operationName": operation.name,
+        "variables": {"owner": owner, "name": name, "first": first},
+    }
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def main() -> None:
+    compiled = make_operation().compile()
+    assert json.loads(compiled.bind(owner="denisart", name="graphql-query", first=10)) == json.loads(
+        render_request("denisart", "graphql-query", 10)
+    )
+
+    number = 2000
+    render_seconds = timeit.timeit(lambda: render_request("denisart", "graphql-query", 10), number=number) / number
+    bind_seconds = timeit.timeit(
+        lambda: compiled.bind(owner="denisart", name="graphql-query", first=10), number=number * 50
+    ) / (number * 50)
+
+    print(f"build + render + dumps: {1 / render_seconds:12.0f} req/s")
+    print(f"compiled.bind:          {1 / bind_seconds:12.0f} req/s  ({render_seconds / bind_seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Speed of compiled response decoders against ``model_validate`` and memory of streaming decoding.
+
+Run with ``python benchmarks/bench_decoder.py``.
+"""
+
+import io
+import json
+import timeit
+import tracemalloc
+from typing import Any, List, Union
+
+from pydantic import Field as PydanticField
+
+from graphql_query import Field, GraphQLQueryBaseModel, InlineFragment
+from graphql_query.decoder import compile_decoder, iter_decode
+
+
+class Author(GraphQLQueryBaseModel):
+    id: str
+    login: str
+    name: str
+
+
+class Comment(GraphQLQueryBaseModel):
+    id: str
+    body: str
+    author: Author
+
+
+class Post(GraphQLQueryBaseModel):
+    id: str
+    title: str
+    body: str
+    comments: List[Comment]
+
+
+class Feed(GraphQLQueryBaseModel):
+    posts: List[Post]
+
+
+class AliasedPost(GraphQLQueryBaseModel):
+    id: str
+    title: str
+    text: str = PydanticField(json_schema_extra={"graphql_alias": "body"})
+    comments: List[Comment]
+
+
+class AliasedFeed(GraphQLQueryBaseModel):
+    posts: List[AliasedPost]
+
+
+def rename(data: Any, fields: List[Union[str, Field, InlineFragment]]) -> Any:
+    """Rename response keys to attribute names by the selection set (the generic way without a decoder)."""
+    if isinstance(data, list):
+        return [rename(item, fields) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    renamed = {}
+    for field in fields:
+        if isinstance(field, Field) and (field.alias or field.name) in data:
+            renamed[field.name] = rename(data[field.alias or field.name], field.fields)  # type: ignore
+    return renamed
+
+
+def make_response(n_posts: int) -> dict:
+    author = {"id": "1", "login": "denisart", "name": "Denis"}
+    comments = [{"id": str(i), "body": "comment " * 10, "author": author} for i in range(5)]
+    posts = [{"id": str(i), "title": f"post {i}", "body": "text " * 50, "comments": comments} for i in range(n_posts)]
+    return {"data": {"posts": posts}}
+
+
+def main() -> None:
+    decode = compile_decoder(Feed)
+
+    for n_posts in (10, 1000):
+        data = make_response(n_posts)["data"]
+        assert decode(data) == Feed.model_validate(data)
+
+        number = max(5, 5000 // n_posts)
+        validate_seconds = timeit.timeit(lambda: Feed.model_validate(data), number=number) / number
+        decode_seconds = timeit.timeit(lambda: decode(data), number=number) / number
+
+        print(
+            f"posts={n_posts:5d}  model_validate={validate_seconds * 1000:8.3f} ms  "
+            f"compiled={decode_seconds * 1000:8.3f} ms  ({validate_seconds / decode_seconds:4.1f}x)"
+        )
+
+    decode_aliased = compile_decoder(AliasedFeed)
+    fields = AliasedFeed.graphql_fields()
+
+    for n_posts in (10, 1000):
+        data = make_response(n_posts)["data"]
+        assert decode_aliased(data) == AliasedFeed.model_validate(rename(data, fields))  # type: ignore
+
+        number = max(5, 5000 // n_posts)
+        rename_seconds = (
+            timeit.timeit(lambda: AliasedFeed.model_validate(rename(data, fields)), number=number)  # type: ignore
+            / number
+        )
+        decode_seconds = timeit.timeit(lambda: decode_aliased(data), number=number) / number
+
+        print(
+            f"aliases posts={n_posts:5d}  rename + model_validate={rename_seconds * 1000:8.3f} ms  "
+            f"compiled={decode_seconds * 1000:8.3f} ms  ({rename_seconds / decode_seconds:4.1f}x)"
+        )
+
+    body = json.dumps(make_response(20000)).encode("utf-8")
+
+    tracemalloc.start()
+    count = sum(1 for _ in iter_decode(io.BytesIO(body), Post, "data.posts"))
+    _, streaming_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    posts = decode(json.loads(body)["data"]).posts
+    _, loading_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == len(posts)
+    print(
+        f"response={len(body) / 1e6:.1f} MB  posts={count}  peak memory: iter_decode={streaming_peak / 1e6:6.1f} MB  "
+        f"json.loads + decode={loading_peak / 1e6:6.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""graphql-core ``DocumentNode`` building: render and parse against direct conversion.
+
+Run with ``python benchmarks/bench_document_node.py``, graphql-core must be installed.
+"""
+
+import timeit
+
+from graphql import parse
+
+from graphql_query import Argument, Field, Fragment, Operation, Query, Variable
+
+
+def make_operation(n_queries: int) -> Operation:
+    var_first = Variable(name="first", type="Int!")
+    fragment = Fragment(name="userFields", type="User", fields=["id", "login", "name"])
+    return Operation(
+        name="Repositories",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="repository",
+                alias=f"repository{i}",
+                arguments=[Argument(name="name", value=f'"repo{i}"')],
+                fields=[
+                    "id",
+                    Field(name="owner", fields=[fragment]),
+                    Field(
+                        name="issues",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["totalCount", Field(name="nodes", fields=["title", "createdAt"])],
+                    ),
+                ],
+            )
+            for i in range(n_queries)
+        ],
+        fragments=[fragment],
+    )
+
+
+def main() -> None:
+    for n_queries in (1, 10, 100):
+        operation = make_operation(n_queries)
+        number = max(10, 2000 // n_queries)
+
+        render_parse = timeit.timeit(lambda: parse(operation.render(), no_location=True), number=number) / number
+        direct = timeit.timeit(lambda: operation.to_document_node(), number=number) / number
+        cached = timeit.timeit(lambda: operation.to_document_node(cached=True), number=number) / number
+
+        print(
+            f"queries={n_queries:4d}  render+parse={render_parse * 1e6:9.1f} us  "
+            f"to_document_node={direct * 1e6:9.1f} us ({render_parse / direct:4.1f}x)  "
+            f"cached={cached * 1e6:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Document size reduction and speed of automatic fragment extraction.
+
+Run with ``python benchmarks/bench_extract.py``.
+"""
+
+import timeit
+
+from graphql_query import Argument, Field, Operation, Query
+from graphql_query.extract import extract_fragments
+
+TYPES = {"author": "User", "comments": "Comment", "avatar": "Image"}
+
+
+def make_operation(n_queries: int) -> Operation:
+    avatar = Field(name="avatar", arguments=[Argument(name="size", value=64)], fields=["url", "width", "height"])
+    author = Field(name="author", fields=["id", "login", "name", "bio", avatar])
+    comments = Field(
+        name="comments",
+        arguments=[Argument(name="first", value=10)],
+        fields=["id", "body", "createdAt", author],
+    )
+
+    return Operation(
+        name="Feed",
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{i}",
+                arguments=[Argument(name="id", value=f'"{i}"')],
+                fields=["id", "title", "body", author, comments],
+            )
+            for i in range(n_queries)
+        ],
+    )
+
+
+def main() -> None:
+    for n_queries in (10, 100, 1000):
+        operation = make_operation(n_queries)
+        compressed = extract_fragments(operation, TYPES)
+
+        size = len(operation.render().encode("utf-8"))
+        compressed_size = len(compressed.render().encode("utf-8"))
+
+        number = max(1, 1000 // n_queries)
+        seconds = timeit.timeit(lambda: extract_fragments(operation, TYPES), number=number) / number
+
+        print(
+            f"queries={n_queries:5d}  size={size:9d} B  compressed={compressed_size:8d} B  "
+            f"reduction={100 * (1 - compressed_size / size):5.1f}%  extract={seconds * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
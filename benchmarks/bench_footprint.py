@@ -0,0 +1,96 @@
+"""Memory of nodes measured with ``tracemalloc`` and estimated by ``footprint``.
+
+The bytes per node of every class are printed with the version of the package, so they can be compared across
+releases.
+
+Run with ``python benchmarks/bench_footprint.py``.
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable, __version__
+from graphql_query.footprint import footprint
+
+var_first = Variable(name="first", type="Int!")
+
+NODES: List[Callable[[int], Any]] = [
+    lambda i: Variable(name=f"var{i}", type="Int!"),
+    lambda i: Argument(name="first", value=i),
+    lambda i: Directive(name="include", arguments=[Argument(name="if", value=var_first)]),
+    lambda i: Field(name=f"field{i}"),
+    lambda i: InlineFragment(type=f"Type{i}", fields=["id"]),
+    lambda i: Fragment(name=f"Fragment{i}", type="User", fields=["id"]),
+    lambda i: Query(name="user", alias=f"user{i}", fields=["id"]),
+    lambda i: Operation(name=f"Operation{i}"),
+]
+
+
+def make_operation(i: int) -> Operation:
+    return Operation(
+        name=f"Feed{i}",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{j}",
+                arguments=[Argument(name="id", value=f'"{i}-{j}"')],
+                fields=[
+                    "id",
+                    "title",
+                    Field(
+                        name="comments",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["id", "body", Field(name="author", fields=["id", "login"])],
+                    ),
+                ],
+            )
+            for j in range(5)
+        ],
+    )
+
+
+def traced(build: Callable[[int], Any], count: int) -> int:
+    """Return bytes allocated by ``count`` calls of ``build`` which stay alive."""
+    build(0)  # validators and caches of the class are built on the first call
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # the list holding the objects is not a part of them
+    return after - before - len(objects) * 8
+
+
+def main() -> None:
+    count = 10000
+    print(f"graphql_query {__version__}")
+
+    print("bytes per node (tracemalloc / footprint):")
+    for build in NODES:
+        node = build(1)
+        name = type(node).__name__
+        estimate = footprint(node, render=False).size
+        print(f"  {name:15s} {traced(build, count) / count:7.0f} B  {estimate:7d} B")
+
+    catalog = [make_operation(i) for i in range(1000)]
+    reports = [footprint(operation) for operation in catalog]
+    size = sum(report.size for report in reports)
+    duplicate_size = sum(report.duplicate_size for report in reports)
+    rendered_size = sum(report.rendered_size for report in reports)
+    nodes = sum(sum(report.nodes.values()) for report in reports)
+
+    print(f"catalog of {len(catalog)} operations, {nodes} nodes:")
+    print(f"  tracemalloc:    {traced(make_operation, len(catalog)) / 1e6:7.2f} MB")
+    print(f"  footprint:      {size / 1e6:7.2f} MB ({size / nodes:.0f} B/node)")
+    print(f"  duplicates:     {duplicate_size / 1e6:7.2f} MB")
+    print(f"  rendered text:  {rendered_size / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
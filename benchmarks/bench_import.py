@@ -0,0 +1,51 @@
+"""Import time of ``graphql_query`` measured with ``python -X importtime``.
+
+Run with ``python benchmarks/bench_import.py``.
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+def import_times(module: str = "graphql_query") -> List[Tuple[str, int, int]]:
+    """Import the module in a new interpreter and return (module, self time, cumulative time) in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        times.append((name.strip(), int(self_time), int(cumulative)))
+
+    return times
+
+
+def main() -> None:
+    runs = [import_times() for _ in range(15)]
+
+    totals = [next(cumulative for name, _, cumulative in run if name == "graphql_query") for run in runs]
+    own = [sum(self_time for name, self_time, _ in run if name.startswith("graphql_query")) for run in runs]
+
+    print(f"import graphql_query: {statistics.median(totals) / 1000:6.1f} ms (median of {len(runs)})")
+    print(f"graphql_query modules: {statistics.median(own) / 1000:6.1f} ms")
+
+    self_times: Dict[str, List[int]] = {}
+    for run in runs:
+        for name, self_time, _ in run:
+            self_times.setdefault(name, []).append(self_time)
+
+    print("slowest modules:")
+    for name, times in sorted(self_times.items(), key=lambda item: -statistics.median(item[1]))[:10]:
+        print(f"  {name:50s} {statistics.median(times) / 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Overhead of ``RenderProfiler``: rendering without a profiler, after a profiler was disabled and with it enabled.
+
+Run with ``python benchmarks/bench_instrumentation.py``.
+"""
+
+import timeit
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.instrumentation import RenderProfiler
+
+var_first = Variable(name="first", type="Int!")
+
+
+def make_operation() -> Operation:
+    return Operation(
+        name="Feed",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{i}",
+                arguments=[Argument(name="id", value=f'"{i}"')],
+                fields=[
+                    "id",
+                    "title",
+                    Field(
+                        name="comments",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["id", "body", Field(name="author", fields=["id", "login"])],
+                    ),
+                ],
+            )
+            for i in range(20)
+        ],
+    )
+
+
+def best(operation: Operation) -> float:
+    return min(timeit.repeat(operation.render, number=20, repeat=7)) / 20
+
+
+def main() -> None:
+    operation = make_operation()
+    operation.render()
+
+    baseline = best(operation)
+
+    profiler = RenderProfiler()
+    profiler.enable()
+    enabled = best(operation)
+    profiler.disable()
+
+    disabled = best(operation)
+
+    print(f"no profiler:       {baseline * 1e6:8.1f} us")
+    print(f"disabled profiler: {disabled * 1e6:8.1f} us ({disabled / baseline - 1:+.1%})")
+    print(f"enabled profiler:  {enabled * 1e6:8.1f} us ({enabled / baseline - 1:+.1%})")
+
+    snapshot = profiler.snapshot()
+    for name, stats in sorted(snapshot.nodes.items(), key=lambda item: -item[1].self_time):
+        print(f"  {name:15s} calls={stats.calls:6d}  self={stats.self_time * 1e3:7.2f} ms  size={stats.size:9d}")
+
+
+if __name__ == "__main__":
+    main()
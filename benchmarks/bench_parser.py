@@ -0,0 +1,73 @@
+"""Throughput of the GraphQL document parser in MB/s.
+
+Run with ``python benchmarks/bench_parser.py``. If graphql-core is installed, its parser is measured too.
+"""
+
+import timeit
+
+from graphql_query import Argument, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.parser import parse
+
+
+def make_document(n_queries: int) -> str:
+    var_first = Variable(name="first", type="Int!", default="10")
+    fragment = Fragment(name="userFields", type="User", fields=["id", "login", "name", "avatarUrl"])
+    queries = [
+        Query(
+            name="repository",
+            alias=f"repository{i}",
+            arguments=[Argument(name="owner", value='"denisart"'), Argument(name="name", value=f'"repo{i}"')],
+            fields=[
+                "id",
+                "description",
+                Field(name="owner", fields=[fragment]),
+                Field(
+                    name="issues",
+                    arguments=[
+                        Argument(name="first", value=var_first),
+                        Argument(name="states", value="[OPEN, CLOSED]"),
+                        Argument(name="orderBy", value=[Argument(name="field", value="CREATED_AT")]),
+                    ],
+                    fields=[
+                        "totalCount",
+                        Field(
+                            name="nodes",
+                            fields=[
+                                "title",
+                                "createdAt",
+                                Field(name="author", fields=[InlineFragment(type="User", fields=[fragment])]),
+                            ],
+                        ),
+                    ],
+                ),
+            ],
+        )
+        for i in range(n_queries)
+    ]
+
+    return Operation(name="Repositories", variables=[var_first], queries=queries, fragments=[fragment]).render()
+
+
+def main() -> None:
+    try:
+        from graphql import parse as graphql_core_parse
+    except ImportError:  # pragma: no cover
+        graphql_core_parse = None
+
+    for n_queries in (10, 100, 1000):
+        document = make_document(n_queries)
+        megabytes = len(document.encode("utf-8")) / 1_000_000
+        number = max(1, 2000 // n_queries)
+
+        seconds = timeit.timeit(lambda: parse(document), number=number) / number
+        line = f"size={megabytes * 1000:8.1f} KB  graphql_query.parser={megabytes / seconds:6.2f} MB/s"
+
+        if graphql_core_parse is not None:
+            seconds = timeit.timeit(lambda: graphql_core_parse(document), number=number) / number
+            line += f"  graphql-core={megabytes / seconds:6.2f} MB/s"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Throughput of ``render_many`` with 1..N workers of thread and process pools.
+
+Threads render in parallel only on free-threaded builds of Python (``python3.13t`` and later); with the GIL
+the throughput of a thread pool stays flat and a process pool gives parallelism.
+
+Run with ``python benchmarks/bench_render_many.py``.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.render import render_many
+
+var_first = Variable(name="first", type="Int!")
+
+
+def make_operation(i: int) -> Operation:
+    return Operation(
+        name=f"Feed{i}",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="post",
+                alias=f"post{j}",
+                arguments=[Argument(name="id", value=f'"{i}-{j}"')],
+                fields=[
+                    "id",
+                    "title",
+                    Field(
+                        name="comments",
+                        arguments=[Argument(name="first", value=var_first)],
+                        fields=["id", "body", Field(name="author", fields=["id", "login"])],
+                    ),
+                ],
+            )
+            for j in range(5)
+        ],
+    )
+
+
+def throughput(operations: List[Operation], executor: Optional[Executor], repeat: int = 3) -> float:
+    render_many(operations[:64], executor)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_many(operations, executor)
+        best = min(best, time.perf_counter() - start)
+
+    return len(operations) / best
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}  GIL {'enabled' if gil else 'disabled'}")
+
+    operations = [make_operation(i) for i in range(2000)]
+    pools: List[Callable[[int], Executor]] = [ThreadPoolExecutor, ProcessPoolExecutor]
+
+    print(f"{'sequential':31s}: {throughput(operations, None):9.0f} operations/s")
+
+    for pool in pools:
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            with pool(workers) as executor:
+                print(f"{pool.__name__:20s} workers={workers:3d}: {throughput(operations, executor):9.0f} operations/s")
+
+
+if __name__ == "__main__":
+    main()
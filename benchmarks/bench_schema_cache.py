@@ -0,0 +1,82 @@
+"""Schema loading at startup: parsing of an introspection JSON file against the binary cache.
+
+Run with ``python benchmarks/bench_schema_cache.py``.
+"""
+
+import json
+import os
+import tempfile
+import timeit
+from typing import Any, Dict
+
+from graphql_query.schema import Schema
+
+
+def _ref(kind: str, name: str) -> Dict[str, Any]:
+    return {"kind": kind, "name": name, "ofType": None}
+
+
+def _non_null(ref: Dict[str, Any]) -> Dict[str, Any]:
+    return {"kind": "NON_NULL", "name": None, "ofType": ref}
+
+
+def make_introspection(n_types: int, n_fields: int) -> Dict[str, Any]:
+    types = [
+        {
+            "kind": "OBJECT",
+            "name": f"Type{i}",
+            "fields": [
+                {
+                    "name": f"field{j}",
+                    "description": f"The field {j} of the type {i}.",
+                    "args": [
+                        {"name": "first", "type": _ref("SCALAR", "Int"), "defaultValue": "10"},
+                        {"name": "after", "type": _ref("SCALAR", "String"), "defaultValue": None},
+                    ],
+                    "type": _non_null(_ref("OBJECT", f"Type{(i + j) % n_types}")),
+                    "isDeprecated": False,
+                    "deprecationReason": None,
+                }
+                for j in range(n_fields)
+            ],
+            "inputFields": None,
+            "interfaces": [],
+            "enumValues": None,
+            "possibleTypes": None,
+        }
+        for i in range(n_types)
+    ]
+    types.append(
+        {
+            "kind": "OBJECT",
+            "name": "Query",
+            "fields": [{"name": f"type{i}", "args": [], "type": _ref("OBJECT", f"Type{i}")} for i in range(n_types)],
+        }
+    )
+    return {"data": {"__schema": {"queryType": {"name": "Query"}, "types": types, "directives": []}}}
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "schema.json")
+        cache_path = os.path.join(directory, "schema.cache")
+
+        for n_types in (100, 1000, 2000):
+            with open(path, "w") as file:
+                json.dump(make_introspection(n_types, 20), file)
+
+            Schema.load(path, cache_path)
+
+            number = 5
+            parse = timeit.timeit(lambda: Schema.load(path), number=number) / number
+            cached = timeit.timeit(lambda: Schema.load(path, cache_path), number=number) / number
+
+            print(
+                f"types={n_types:5d}  json={os.path.getsize(path) / 1e6:5.1f} MB  "
+                f"cache={os.path.getsize(cache_path) / 1e6:5.1f} MB  "
+                f"parse={parse * 1e3:8.1f} ms  cached={cached * 1e3:7.1f} ms ({parse / cached:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Fixtures of the benchmark suite, trees are built once per session, so benchmarks measure only the code under test.
+
+Run with ``make benchmark``, see ``CONTRIBUTING.md``.
+"""
+
+from typing import Type
+
+import pytest
+from trees import deep_operation, fragment_operation, model_graph, wide_operation
+
+from graphql_query import GraphQLQueryBaseModel, Operation
+
+
+@pytest.fixture(scope="session")
+def wide() -> Operation:
+    return wide_operation()
+
+
+@pytest.fixture(scope="session")
+def deep() -> Operation:
+    return deep_operation()
+
+
+@pytest.fixture(scope="session")
+def fragments() -> Operation:
+    return fragment_operation()
+
+
+@pytest.fixture(scope="session")
+def model() -> Type[GraphQLQueryBaseModel]:
+    return model_graph()
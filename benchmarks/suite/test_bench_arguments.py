@@ -0,0 +1,32 @@
+from graphql_query import Argument
+
+long_string = Argument(name="text", value='"' + "x" * 100_000 + '"')
+int_list = Argument(name="ids", value=list(range(10_000)))
+str_list = Argument(name="logins", value=[f'"user{i}"' for i in range(10_000)])
+object_list = Argument(
+    name="users",
+    value=[
+        [
+            Argument(name="login", value=f'"user{i}"'),
+            Argument(name="age", value=i),
+            Argument(name="address", value=[Argument(name="city", value='"Paris"'), Argument(name="zip", value=i)]),
+        ]
+        for i in range(1000)
+    ],
+)
+
+
+def test_render_long_string(benchmark):
+    benchmark(long_string.render)
+
+
+def test_render_int_list(benchmark):
+    benchmark(int_list.render)
+
+
+def test_render_str_list(benchmark):
+    benchmark(str_list.render)
+
+
+def test_render_object_list(benchmark):
+    benchmark(object_list.render)
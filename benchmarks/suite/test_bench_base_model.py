@@ -0,0 +1,7 @@
+from typing import Type
+
+from graphql_query import GraphQLQueryBaseModel
+
+
+def test_graphql_fields(benchmark, model: Type[GraphQLQueryBaseModel]):
+    benchmark(model.graphql_fields)
@@ -0,0 +1,19 @@
+import importlib
+import sys
+
+
+def _forget_package() -> None:
+    for name in [name for name in sys.modules if name == "graphql_query" or name.startswith("graphql_query.")]:
+        del sys.modules[name]
+
+
+def test_import(benchmark):
+    # modules of dependencies stay imported, so this is the import time of the package itself
+    modules = {name: module for name, module in sys.modules.items() if name.startswith("graphql_query")}
+    try:
+        benchmark.pedantic(
+            importlib.import_module, args=("graphql_query",), setup=_forget_package, rounds=20, warmup_rounds=2
+        )
+    finally:
+        _forget_package()
+        sys.modules.update(modules)
@@ -0,0 +1,32 @@
+from graphql_query import Argument, Field, Query, Variable
+
+from trees import deep_operation, fragment_operation, wide_operation
+
+var_first = Variable(name="first", type="Int!")
+
+
+def test_construct_field(benchmark):
+    benchmark(
+        lambda: Field(
+            name="posts",
+            alias="latest",
+            arguments=[Argument(name="first", value=var_first), Argument(name="tags", value=['"a"', '"b"'])],
+            fields=["id", "title", Field(name="author", fields=["id", "login"])],
+        )
+    )
+
+
+def test_construct_query(benchmark):
+    benchmark(lambda: Query(name="user", fields=[Field(name=f"field{i}") for i in range(100)]))
+
+
+def test_construct_wide(benchmark):
+    benchmark(wide_operation)
+
+
+def test_construct_deep(benchmark):
+    benchmark(deep_operation)
+
+
+def test_construct_fragments(benchmark):
+    benchmark(fragment_operation)
@@ -0,0 +1,13 @@
+from graphql_query import Operation
+
+
+def test_render_wide(benchmark, wide: Operation):
+    benchmark(wide.render)
+
+
+def test_render_deep(benchmark, deep: Operation):
+    benchmark(deep.render)
+
+
+def test_render_fragments(benchmark, fragments: Operation):
+    benchmark(fragments.render)
@@ -0,0 +1,77 @@
+"""Node trees and models of the benchmark suite."""
+
+from typing import List, Type, Union
+
+from pydantic import create_model
+
+from graphql_query import Argument, Field, Fragment, GraphQLQueryBaseModel, InlineFragment, Operation, Query, Variable
+
+
+def wide_operation(width: int = 1000) -> Operation:
+    """One query with ``width`` fields with arguments."""
+    return Operation(
+        name="Wide",
+        queries=[
+            Query(
+                name="node",
+                fields=[Field(name=f"field{i}", arguments=[Argument(name="first", value=i)]) for i in range(width)],
+            )
+        ],
+    )
+
+
+def deep_operation(depth: int = 100) -> Operation:
+    """A chain of ``depth`` nested fields."""
+    field = Field(name="leaf", fields=["id", "name"])
+    for i in range(depth):
+        field = Field(name=f"level{i}", arguments=[Argument(name="first", value=10)], fields=["id", field])
+
+    return Operation(name="Deep", queries=[Query(name="root", fields=[field])])
+
+
+def fragment_operation(fragments: int = 200) -> Operation:
+    """Spreads of ``fragments`` fragments with inline fragments and nested spreads."""
+    leaf = Fragment(name="Leaf", type="Node", fields=["id", "createdAt"])
+    definitions = [leaf] + [
+        Fragment(
+            name=f"Fragment{i}",
+            type="Node",
+            fields=[
+                f"field{i}",
+                leaf,
+                InlineFragment(type=f"Type{i}", fields=["name", Field(name="owner", fields=[leaf])]),
+            ],
+        )
+        for i in range(fragments)
+    ]
+
+    return Operation(
+        name="Fragments",
+        variables=[Variable(name="id", type="ID!")],
+        queries=[
+            Query(
+                name="node",
+                arguments=[Argument(name="id", value=Variable(name="id", type="ID!"))],
+                fields=definitions[1:],
+            )
+        ],
+        fragments=definitions,
+    )
+
+
+def model_graph(types: int = 5, scalars: int = 10, children: int = 3) -> Type[GraphQLQueryBaseModel]:
+    """A model of ``types`` levels, every level has scalars, ``children`` lists of the level below and a union."""
+    model: Type[GraphQLQueryBaseModel] = create_model(  # type: ignore
+        "Level0", __base__=GraphQLQueryBaseModel, **{f"scalar{i}": (str, ...) for i in range(scalars)}
+    )
+
+    for level in range(1, types):
+        fields = {f"scalar{i}": (str, ...) for i in range(scalars)}
+        fields.update({f"child{i}": (List[model], ...) for i in range(children)})  # type: ignore
+        fields["union"] = (
+            Union[model, create_model(f"Other{level}", __base__=GraphQLQueryBaseModel, id=(str, ...))],
+            ...,
+        )
+        model = create_model(f"Level{level}", __base__=GraphQLQueryBaseModel, **fields)  # type: ignore
+
+    return model
@@ -0,0 +1,45 @@
+import threading
+import weakref
+from typing import Any, Callable, Dict, Generic, Hashable, TypeVar
+
+__all__ = [
+    "_NodeCache",
+]
+
+_T = TypeVar("_T")
+
+
+class _NodeCache(Generic[_T]):
+    """A cache of values computed from a node tree.
+
+    Nodes are pydantic models and they are not hashable, so values are keyed by the identity of the node and
+    dropped when the node is garbage collected. A cached value is not invalidated on mutation: a node tree must
+    not be changed after a value for it has been cached.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[int, Dict[Hashable, _T]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, node: Any, factory: Callable[[], _T], key: Hashable = None) -> _T:
+        """Return the cached value for ``node`` and ``key`` or compute it with ``factory``."""
+        values = self._values.get(id(node))
+        if values is not None and key in values:
+            return values[key]
+
+        value = factory()
+
+        with self._lock:
+            values = self._values.get(id(node))
+            if values is None:
+                values = self._values[id(node)] = {}
+                weakref.finalize(node, self._values.pop, id(node), None)
+
+            return values.setdefault(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
@@ -0,0 +1,34 @@
+import contextlib
+import os
+import tempfile
+from typing import BinaryIO, Iterator, Union
+
+__all__ = [
+    "_atomic_write",
+]
+
+# the umask can only be read by setting it, it is read once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Union[str, "os.PathLike[str]"]) -> Iterator[BinaryIO]:
+    """Open a new temporary file next to ``path`` for writing and replace ``path`` with it on success.
+
+    Every writer gets its own temporary file, so processes which write the same path at the same time don't
+    corrupt it: the last replace wins. The temporary file is removed if writing fails.
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            yield file
+        # mkstemp creates files readable only by the owner, the file gets the mode of files created by open()
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Set, Tuple, Union
+
+from .parser import GraphQLParseError, parse_fields
+from .types import Fragment, Operation, Query, Variable, _GraphQL2PythonQuery
+
+__all__ = [
+    "_iter_nodes",
+    "_with_queries",
+]
+
+
+def _flatten(value: Any) -> Iterator[Any]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _flatten(item)
+    else:
+        yield value
+
+
+def _iter_nodes(node: Union[str, _GraphQL2PythonQuery]) -> Iterator[Union[str, _GraphQL2PythonQuery]]:
+    """Iterate over all nodes of a tree in pre-order without recursion.
+
+    Fragments inside of ``fields`` are spreads: they are yielded but not expanded.
+    Strings in ``fields`` are yielded as fields; other scalar values are not nodes.
+    """
+    # (node, expand the node)
+    stack: List[Tuple[Any, bool]] = [(node, True)]
+
+    while stack:
+        current, expand = stack.pop()
+        yield current
+
+        if not expand or not isinstance(current, _GraphQL2PythonQuery):
+            continue
+
+        children: List[Tuple[Any, bool]] = []
+        for name in type(current).model_fields:
+            for item in _flatten(getattr(current, name)):
+                if isinstance(item, _GraphQL2PythonQuery):
+                    children.append((item, not (name == "fields" and isinstance(item, Fragment))))
+                elif name == "fields" and isinstance(item, str):
+                    children.append((item, False))
+
+        stack.extend(reversed(children))
+
+
+def _iter_references(
+    node: Union[str, _GraphQL2PythonQuery], definitions: Mapping[str, Fragment]
+) -> Iterator[Union[str, _GraphQL2PythonQuery]]:
+    """Iterate over nodes like ``_iter_nodes``, string selections which are not names are parsed into nodes.
+
+    Raises:
+        GraphQLParseError: if a string selection can't be parsed.
+    """
+    for child in _iter_nodes(node):
+        if isinstance(child, str) and not child.strip().isidentifier():
+            for field in parse_fields(child, fragments=definitions.values()):
+                if isinstance(field, Fragment):
+                    yield field
+                else:
+                    yield from _iter_references(field, definitions)
+        else:
+            yield child
+
+
+def _spreads(nodes: Sequence[Union[Query, Fragment]], definitions: Mapping[str, Fragment]) -> Set[str]:
+    names: Set[str] = set()
+    for node in nodes:
+        for child in _iter_references(node, definitions):
+            if isinstance(child, Fragment) and child is not node:
+                names.add(child.name)
+
+    return names
+
+
+def _with_queries(operation: Operation, queries: List[Query], definitions: Dict[str, Fragment]) -> Operation:
+    """Return a copy of the operation with other queries and only fragments and variables which they use.
+
+    A string selection which can't be parsed may use any fragment and variable, then all of them are kept.
+    """
+    try:
+        used_fragments: Set[str] = set()
+        pending = _spreads(queries, definitions)
+        while pending:
+            name = pending.pop()
+            if name in used_fragments or name not in definitions:
+                continue
+
+            used_fragments.add(name)
+            pending |= _spreads([definitions[name]], definitions)
+
+        fragments = [fragment for name, fragment in definitions.items() if name in used_fragments]
+
+        used_variables = {
+            node.name
+            for root in [*queries, *fragments]
+            for node in _iter_references(root, definitions)
+            if isinstance(node, Variable)
+        }
+    except GraphQLParseError:
+        return operation.model_copy(update={"queries": queries, "fragments": list(definitions.values())})
+
+    return operation.model_copy(
+        update={
+            "variables": [variable for variable in operation.variables if variable.name in used_variables],
+            "queries": queries,
+            "fragments": fragments,
+        }
+    )
@@ -1,88 +1,147 @@
-from typing import List, Optional, Type, Union, get_args, get_origin
+from typing import Any, Iterable, List, Optional, Set, Type, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic.fields import FieldInfo as PydanticFieldInfo
 
 from .types import Argument, Directive, Field, Fragment, InlineFragment
 
 
-def _get_field_template(field_info: PydanticFieldInfo) -> Field:
+def _get_field_template(field_info: PydanticFieldInfo, name: str = "<NAME>") -> Field:
     alias: Optional[str] = None
     arguments: List[Argument] = []
     directives: List[Directive] = []
     typename: bool = False
 
     if (field_info.json_schema_extra is not None) and isinstance(field_info.json_schema_extra, dict):
+        # the name of the GraphQL field if it can't be the attribute name (for example `from`)
+        name = field_info.json_schema_extra.get("graphql_name", name)  # type: ignore
         alias = field_info.json_schema_extra.get("graphql_alias", None)  # type: ignore
         arguments = field_info.json_schema_extra.get("graphql_arguments", [])  # type: ignore
         directives = field_info.json_schema_extra.get("graphql_directives", [])  # type: ignore
         typename = field_info.json_schema_extra.get("graphql_typename", False)  # type: ignore
 
-    return Field(name="<NAME>", fields=[], alias=alias, arguments=arguments, directives=directives, typename=typename)
+    return Field(name=name, fields=[], alias=alias, arguments=arguments, directives=directives, typename=typename)
+
+
+# a generated model -> compact forms of its parsed selection set
+_selections: "WeakKeyDictionary[type, List[Any]]" = WeakKeyDictionary()
+
+
+def _get_selection(model: Type['GraphQLQueryBaseModel']) -> List[Union[str, Field, InlineFragment, Fragment]]:
+    """Return the precomputed selection set of a generated model (see ``graphql_query.codegen``).
+
+    The selection set is parsed once, every call gets new nodes built from its compact form.
+    """
+    from .compact import from_compact, to_compact
+
+    selection = _selections.get(model)
+    if selection is None:
+        from .parser import parse_fields
+
+        fields = parse_fields(model.__dict__["__graphql_selection__"], model.__dict__.get("__graphql_variables__"))
+        selection = _selections[model] = [field if isinstance(field, str) else to_compact(field) for field in fields]
+
+    return [field if isinstance(field, str) else from_compact(field) for field in selection]
+
+
+def _get_type_fields(annotation: Any) -> List[Union[str, Field, InlineFragment, Fragment]]:
+    #
+    # list type
+    #
+    if get_origin(annotation) is list:
+        return _get_type_fields(get_args(annotation)[0])
+
+    #
+    # union type
+    #
+    if get_origin(annotation) is Union:
+        union_args = [union_arg for union_arg in get_args(annotation) if union_arg is not type(None)]
+
+        if len(union_args) == 1:
+            return _get_type_fields(union_args[0])
+
+        return [InlineFragment(type=union_arg.__name__, fields=_get_type_fields(union_arg)) for union_arg in union_args]
+
+    #
+    # custom type
+    #
+    if isinstance(annotation, type) and issubclass(annotation, GraphQLQueryBaseModel):
+        return _get_fields(annotation)
+
+    return []
 
 
 def _get_fields(model: Type['GraphQLQueryBaseModel']) -> List[Union[str, Field, InlineFragment, Fragment]]:
+    if "__graphql_selection__" in model.__dict__:
+        return _get_selection(model)
+
     fields: List[Union[str, Field, InlineFragment, Fragment]] = []
 
     for f_name, f in model.model_fields.items():
-        _field_template = _get_field_template(f)
-        _field_template.name = f_name
+        _field_template = _get_field_template(f, f_name)
 
         if f.annotation is None:
             continue
 
-        #
-        # list type
-        #
-        if (hasattr(f.annotation, "__origin__")) and (f.annotation.__origin__ is list):
-            list_args = get_args(f.annotation)[0]
-
-            _field_template.name = f_name
-
-            if get_origin(list_args) is Union:
-                union_args = [union_arg for union_arg in get_args(list_args) if union_arg is not type(None)]
-
-                if len(union_args) == 1:
-                    _field_template.fields = _get_fields(union_args[0])
-
-                else:
-                    _field_template.fields = [
-                        InlineFragment(type=union_arg.__name__, fields=_get_fields(union_arg))
-                        for union_arg in union_args
-                    ]
-            else:
-                _field_template.fields = _get_fields(list_args)
-
-        #
-        # union type
-        #
-        elif get_origin(f.annotation) is Union:
-            union_args = [union_arg for union_arg in get_args(f.annotation) if union_arg is not type(None)]
-
-            if len(union_args) == 1:
-                _field_template.name = f_name
-                _field_template.fields = _get_fields(union_args[0])
-
-            else:
-                _field_template.name = f_name
-                _field_template.fields = [
-                    InlineFragment(type=union_arg.__name__, fields=_get_fields(union_arg)) for union_arg in union_args
-                ]
-
-        #
-        # custom type
-        #
-        elif issubclass(f.annotation, GraphQLQueryBaseModel):
-            _field_template.fields = _get_fields(f.annotation)
+        _field_template.fields = _get_type_fields(f.annotation)
 
         fields.append(_field_template)
 
     return fields
 
 
+def _exclude_fields(
+    fields: List[Union[str, Field, InlineFragment, Fragment]], exclude: Set[str], prefix: str
+) -> List[Union[str, Field, InlineFragment, Fragment]]:
+    result: List[Union[str, Field, InlineFragment, Fragment]] = []
+
+    for field in fields:
+        if isinstance(field, InlineFragment):
+            # fields of inline fragments are fields of the parent object
+            sub_fields = _exclude_fields(field.fields, exclude, prefix)
+            if len(sub_fields) > 0:
+                result.append(field.model_copy(update={"fields": sub_fields}))
+            continue
+
+        if isinstance(field, Fragment):
+            result.append(field)
+            continue
+
+        path = prefix + (field if isinstance(field, str) else field.alias or field.name)
+        if path in exclude:
+            continue
+
+        if isinstance(field, Field) and len(field.fields) > 0:
+            sub_fields = _exclude_fields(field.fields, exclude, path + ".")
+            if len(sub_fields) == 0:
+                # an object field without fields is not valid
+                continue
+            field = field.model_copy(update={"fields": sub_fields})
+
+        result.append(field)
+
+    return result
+
+
 class GraphQLQueryBaseModel(BaseModel):
     """A base class for GraphQL query data-model."""
 
+    # validators of models are built on their first validation, not on import
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
-    def graphql_fields(cls) -> List[Union[str, Field, InlineFragment, Fragment]]:
-        return _get_fields(cls)
+    def graphql_fields(
+        cls, exclude: Optional[Iterable[str]] = None
+    ) -> List[Union[str, Field, InlineFragment, Fragment]]:
+        """Return the selection set of the model.
+
+        Args:
+            exclude: Paths of fields which are not selected: response keys separated by dots, for example
+                ``friends.name``. An object field without remaining fields is not selected too.
+        """
+        fields = _get_fields(cls)
+        if exclude is None:
+            return fields
+
+        return _exclude_fields(fields, set(exclude), "")
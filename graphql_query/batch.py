@@ -0,0 +1,159 @@
+"""Batched requests: many operations in one HTTP request.
+
+Servers like Apollo Server accept a JSON array of request bodies and answer with an array of responses in the same
+order. ``batch_body`` joins request bodies built by ``graphql_query.body.request_body`` (the encoded documents are
+cached per operation) and ``split_batch_response`` checks the array response. ``AsyncBatcher`` collects requests
+of concurrent tasks and sends them in batches.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .body import request_body
+from .compiled import CompiledOperation
+from .types import Operation
+
+__all__ = [
+    "batch_body",
+    "split_batch_response",
+    "AsyncBatcher",
+]
+
+_Operation = Union[Operation, CompiledOperation]
+_Request = Union[_Operation, Tuple[_Operation, Optional[Mapping[str, Any]]]]
+
+
+def batch_body(requests: Iterable[_Request]) -> bytes:
+    """Return the UTF-8 JSON array of request bodies.
+
+    Example:
+
+        >>> body = batch_body([
+        ...     Operation(queries=[Query(name="viewer", fields=["login"])]),
+        ...     (Operation(name="Hero", queries=[Query(name="hero", fields=["name"])]), {}),
+        ... ])
+        >>> [request.get("operationName") for request in json.loads(body)]
+        [None, 'Hero']
+
+    Args:
+        requests: Operations or pairs of an operation and values of its variables.
+    """
+    bodies = [
+        request_body(*request) if isinstance(request, tuple) else request_body(request)  # type: ignore
+        for request in requests
+    ]
+
+    return b"[" + b",".join(bodies) + b"]"
+
+
+def split_batch_response(response: Union[bytes, str, List[Any]], size: int) -> List[Dict[str, Any]]:
+    """Return responses to the requests of a batch in the order of the requests.
+
+    Raises:
+        ValueError: if the response is not an array of ``size`` objects.
+    """
+    results = json.loads(response) if isinstance(response, (bytes, str)) else response
+
+    if not isinstance(results, list) or not all(isinstance(result, dict) for result in results):
+        raise ValueError("The response to a batch must be an array of objects.")
+
+    if len(results) != size:
+        raise ValueError(f"The batch has {size} requests but the response has {len(results)} results.")
+
+    return results
+
+
+class AsyncBatcher:
+    """A batcher of requests of concurrent tasks.
+
+    A batch is sent when it has ``max_size`` requests or ``max_wait`` seconds after its first request.
+
+    Example:
+
+        >>> async def send(body: bytes) -> bytes:
+        ...     response = await client.post(url, content=body, headers={"Content-Type": "application/json"})
+        ...     return response.content
+        ...
+        >>> async with AsyncBatcher(send, max_size=20, max_wait=0.01) as batcher:
+        ...     results = await asyncio.gather(*[batcher.execute(operation, {"id": i}) for i in range(100)])
+
+    Args:
+        send: A coroutine function which sends the body of a batch and returns the response (bytes, str or
+            decoded JSON).
+        max_size: The maximal number of requests in a batch.
+        max_wait: The maximal delay of the first request of a batch in seconds.
+    """
+
+    def __init__(self, send: Callable[[bytes], Awaitable[Any]], max_size: int = 10, max_wait: float = 0.005) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+
+        self.send = send
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[bytes, "asyncio.Future[Dict[str, Any]]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def execute(self, operation: _Operation, variables: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """Add the request to the current batch and return its response (a dict with ``data`` and ``errors``).
+
+        Raises:
+            ValueError: if values of variables don't match the variables of the operation.
+        """
+        body = request_body(operation, variables)
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        self._pending.append((body, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if len(self._pending) == 0:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[bytes, "asyncio.Future[Dict[str, Any]]"]]) -> None:
+        try:
+            response = await self.send(b"[" + b",".join(body for body, _ in batch) + b"]")
+            results = split_batch_response(response, len(batch))
+        except Exception as error:  # the error of the batch is the error of every request
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        except BaseException:  # a cancelled batch cancels every request, no request waits forever
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def flush(self) -> None:
+        """Send the current batch and wait for all sent batches."""
+        self._flush()
+        if len(self._tasks) > 0:
+            await asyncio.gather(*self._tasks)
+
+    async def __aenter__(self) -> "AsyncBatcher":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.flush()
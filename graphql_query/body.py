@@ -0,0 +1,92 @@
+"""Encoded request bodies.
+
+``request_body`` returns the final UTF-8 ``{"query": ..., "variables": ..., "operationName": ...}`` body of an
+operation. The JSON-escaped document is cached per operation, so only variables are encoded per call. orjson
+is used for encoding when it is installed (``pip install graphql_query[orjson]``), the standard ``json`` module
+otherwise.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple, Union
+
+from ._cache import _NodeCache
+from .encoders import encode_variables
+from .types import Operation
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    from .compiled import CompiledOperation
+    from .schema import Schema
+
+__all__ = [
+    "request_body",
+]
+
+_segments: "_NodeCache[Tuple[bytes, bytes]]" = _NodeCache()
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value)
+
+
+_dumps = _json_dumps if orjson is None else _orjson_dumps
+
+
+def _body_segments(document: str, operation_name: Optional[str]) -> Tuple[bytes, bytes]:
+    """Return encoded parts of a request body before and after the value of variables."""
+    prefix = b'{"query":' + _dumps(document) + b',"variables":'
+    suffix = b"}" if operation_name is None else b',"operationName":' + _dumps(operation_name) + b"}"
+
+    return prefix, suffix
+
+
+def request_body(
+    operation: Union[Operation, "CompiledOperation"],
+    variables: Optional[Mapping[str, Any]] = None,
+    schema: Optional["Schema"] = None,
+) -> bytes:
+    """Return the UTF-8 JSON request body of the operation.
+
+    The encoded document of an ``Operation`` is cached, so the operation must not be changed after the first call.
+
+    Example:
+
+        >>> operation = Operation(
+        ...     name="Hero",
+        ...     variables=[Variable(name="episode", type="Episode")],
+        ...     queries=[
+        ...         Query(
+        ...             name="hero",
+        ...             arguments=[Argument(name="episode", value=Variable(name="episode", type="Episode"))],
+        ...             fields=["name"],
+        ...         )
+        ...     ],
+        ... )
+        >>> body = json.loads(request_body(operation, {"episode": "JEDI"}))
+        >>> body["query"] == operation.render()
+        True
+        >>> body["variables"], body["operationName"]
+        ({'episode': 'JEDI'}, 'Hero')
+
+    Args:
+        operation: An operation or a compiled operation.
+        variables: Values of variables, they are checked and encoded by ``graphql_query.encoders``.
+        schema: A schema for checking values of enum and input types of an ``Operation``.
+
+    Raises:
+        ValueError: if values of variables don't match the variables of the operation.
+    """
+    if not isinstance(operation, Operation):
+        return operation.bind(**(variables or {}))
+
+    prefix, suffix = _segments.get(operation, lambda: _body_segments(operation.render(), operation.name))
+
+    return prefix + _dumps(encode_variables(operation.variables, variables or {}, schema)) + suffix
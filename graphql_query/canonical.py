@@ -0,0 +1,220 @@
+"""Canonical rendering of operations for stable cache keys.
+
+Two operations which differ only in the order of fields, the order of arguments, duplicate selections or the
+operation name have the same canonical document. The canonical document is a compact one-line text:
+
+- fields, fragment spreads and inline fragments of every selection set are merged and sorted;
+- arguments, fields of input objects and variables are sorted by name;
+- ``typename=True`` and an explicit ``__typename`` field are the same selection; like ``render()``, fields and
+  queries without other fields ignore ``typename=True``;
+- the optional operation name is omitted and fragments are sorted by name;
+- string selections (``"title: name"``, ``"friends { name }"``, ``"...F"``) are parsed, so they are the same as
+  ``Field`` nodes. Strings which ``parse_fields`` doesn't support (for example inline fragments with directives) are
+  kept as stripped text, so they are not canonical: other whitespace or order inside of them is another document.
+
+The order of list values and directives is significant in GraphQL and it is kept as is.
+"""
+
+import hashlib
+from typing import Any, Dict, List, NamedTuple, Sequence, Union
+
+from ._cache import _NodeCache
+from .parser import GraphQLParseError, parse_fields
+from .types import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+
+__all__ = [
+    "CanonicalDocument",
+    "canonicalize",
+    "canonical_render",
+    "canonical_hash",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment, Query]
+
+
+class CanonicalDocument(NamedTuple):
+    """The canonical document of an operation and its sha256 hex digest."""
+
+    document: str
+    hash: str
+
+
+def _render_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    if isinstance(value, str):
+        return value.strip()
+
+    if isinstance(value, Variable):
+        return f"${value.name}"
+
+    if isinstance(value, Argument):
+        return "{" + _render_argument(value) + "}"
+
+    if isinstance(value, list):
+        if len(value) > 0 and Argument._check_is_list_of_str(value):
+            return "[" + ",".join(Argument._clean_list_of_str(value)) + "]"
+
+        if len(value) > 0 and Argument._check_is_list_of_arguments(value):
+            return "{" + _render_arguments(value) + "}"
+
+        if len(value) > 0 and Argument._check_is_list_of_list(value):
+            return "[" + ",".join("{" + _render_arguments(arguments) + "}" for arguments in value) + "]"
+
+        return "[" + ",".join(str(item).lower() for item in value) + "]"
+
+    raise ValueError("Invalid type for `graphql_query.Argument.value`.")
+
+
+def _render_argument(argument: Argument) -> str:
+    return f"{argument.name}:{_render_value(argument.value)}"
+
+
+def _render_arguments(arguments: Sequence[Argument]) -> str:
+    return ",".join(sorted({_render_argument(argument) for argument in arguments}))
+
+
+def _render_directive(directive: Directive) -> str:
+    if len(directive.arguments) == 0:
+        return f"@{directive.name}"
+
+    return f"@{directive.name}({_render_arguments(directive.arguments)})"
+
+
+def _selection_head(selection: _Selection) -> str:
+    if isinstance(selection, str):
+        return selection.strip()
+
+    if isinstance(selection, Fragment):
+        return f"...{selection.name}"
+
+    if isinstance(selection, InlineFragment):
+        head = f"...on {selection.type}"
+    else:
+        head = selection.name if selection.alias in (None, selection.name) else f"{selection.alias}:{selection.name}"
+
+    if len(selection.arguments) > 0:
+        head += f"({_render_arguments(selection.arguments)})"
+
+    if isinstance(selection, Field):
+        head += "".join(_render_directive(directive) for directive in selection.directives)
+
+    return head
+
+
+def _parse_strings(selections: Sequence[_Selection], fragments: Sequence[Fragment]) -> List[_Selection]:
+    parsed: List[_Selection] = []
+    for selection in selections:
+        if isinstance(selection, str) and not selection.strip().isidentifier():
+            try:
+                parsed.extend(parse_fields(selection, fragments=fragments))
+                continue
+            except GraphQLParseError:  # a selection which the parser doesn't support, it is kept as text
+                pass
+        parsed.append(selection)
+
+    return parsed
+
+
+def _render_selection_set(
+    selections: Sequence[_Selection], fragments: Sequence[Fragment], typename: bool = False
+) -> str:
+    # canonical head of a selection -> sub-selections of all merged duplicates
+    groups: Dict[str, List[_Selection]] = {}
+    # canonical head of a selection -> `typename` of any of merged duplicates
+    typenames: Dict[str, bool] = {}
+
+    if typename:
+        groups["__typename"] = []
+
+    for selection in _parse_strings(selections, fragments):
+        head = _selection_head(selection)
+        children = groups.setdefault(head, [])
+
+        if isinstance(selection, (Field, InlineFragment, Query)):
+            children.extend(selection.fields)
+            # like render(), fields and queries select `__typename` only with other fields
+            selects_typename = selection.typename and (
+                isinstance(selection, InlineFragment) or len(selection.fields) > 0
+            )
+            typenames[head] = typenames.get(head, False) or selects_typename
+
+    rendered = []
+    for head, children in groups.items():
+        if len(children) > 0 or typenames.get(head, False):
+            rendered.append(head + "{" + _render_selection_set(children, fragments, typenames.get(head, False)) + "}")
+        else:
+            rendered.append(head)
+
+    return " ".join(sorted(rendered))
+
+
+def _render_variable(variable: Variable) -> str:
+    if variable.default is None:
+        return f"${variable.name}:{variable.type.strip()}"
+
+    return f"${variable.name}:{variable.type.strip()}={variable.default.strip()}"
+
+
+def _render_operation(operation: Operation) -> str:
+    document = operation.type
+
+    if len(operation.variables) > 0:
+        document += "(" + ",".join(sorted({_render_variable(variable) for variable in operation.variables})) + ")"
+
+    document += "{" + _render_selection_set(operation.queries, operation.fragments) + "}"
+
+    fragments: Dict[str, List[_Selection]] = {}
+    fragment_types: Dict[str, str] = {}
+    fragment_typenames: Dict[str, bool] = {}
+    for fragment in operation.fragments:
+        fragments.setdefault(fragment.name, []).extend(fragment.fields)
+        fragment_types[fragment.name] = fragment.type
+        fragment_typenames[fragment.name] = fragment_typenames.get(fragment.name, False) or fragment.typename
+
+    for name in sorted(fragments):
+        selection_set = _render_selection_set(fragments[name], operation.fragments, fragment_typenames[name])
+        document += f" fragment {name} on {fragment_types[name]}" + "{" + selection_set + "}"
+
+    return document
+
+
+_canonical_cache: _NodeCache[CanonicalDocument] = _NodeCache()
+
+
+def canonicalize(operation: Operation) -> CanonicalDocument:
+    """Return the canonical document of the operation and its hash.
+
+    The result is computed in one traversal of the operation tree and cached for the operation object, so
+    the operation must not be changed after the first call.
+
+    Example:
+
+        >>> op_1 = Operation(name="A", queries=[Query(name="hero", fields=["name", "id"])])
+        >>> op_2 = Operation(name="B", queries=[Query(name="hero", fields=["id", "name", "id"])])
+        >>> canonicalize(op_1) == canonicalize(op_2)
+        True
+        >>> canonicalize(op_1).document
+        'query{hero{id name}}'
+
+    """
+
+    def factory() -> CanonicalDocument:
+        document = _render_operation(operation)
+        return CanonicalDocument(document=document, hash=hashlib.sha256(document.encode("utf-8")).hexdigest())
+
+    return _canonical_cache.get(operation, factory)
+
+
+def canonical_render(operation: Operation) -> str:
+    """Return the canonical document of the operation."""
+    return canonicalize(operation).document
+
+
+def canonical_hash(operation: Operation) -> str:
+    """Return the sha256 hex digest of the canonical document of the operation."""
+    return canonicalize(operation).hash
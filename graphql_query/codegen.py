@@ -0,0 +1,481 @@
+"""A generator of ``GraphQLQueryBaseModel`` classes from a GraphQL schema.
+
+Every object and interface type of the schema gets a model class in its own module of the generated package. The
+package ``__init__`` imports a module only when its class is requested, so importing one model doesn't load the
+whole schema. Forward references between models are resolved on the first ``model_rebuild`` (pydantic calls it
+on the first validation): the models which are reachable from the rebuilt one are imported and linked then.
+
+Every model carries a precomputed selection set in ``__graphql_selection__``, so ``graphql_fields()`` doesn't walk
+the pydantic fields. The selection set contains all scalar and enum fields, object fields are expanded down to
+``max_depth`` levels; a type is not expanded again inside of itself. Required arguments are bound to variables
+named by the path of the argument (``post(id: $post_id)``, ``friends { post(id: $friends_post_id) }``), their
+types are kept in ``__graphql_variables__`` and the arguments of model fields in ``graphql_arguments`` of
+``json_schema_extra``. Fields which names can't be attribute names get a trailing underscore, the GraphQL name as
+``graphql_name`` and the attribute name as ``graphql_alias`` (the response key).
+
+Run from the command line::
+
+    python -m graphql_query.codegen schema.graphql models/
+
+"""
+
+import argparse
+import keyword
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .base_model import GraphQLQueryBaseModel
+from .schema import Schema, SchemaField, _named_type
+
+__all__ = [
+    "render_models",
+    "generate_models",
+]
+
+_HEADER = '"""Generated by graphql_query.codegen, do not edit."""\n'
+
+_SCALARS = {"Int": "int", "Float": "float", "String": "str", "Boolean": "bool", "ID": "str"}
+
+# names which are used by generated modules
+_RESERVED_CLASS_NAMES = frozenset(
+    ["Any", "ClassVar", "Dict", "List", "Optional", "Union", "Argument", "Variable", "PydanticField", "GeneratedModel"]
+)
+_RESERVED_ATTRIBUTE_NAMES = frozenset(dir(GraphQLQueryBaseModel))
+
+_BASE_MODULE = '''{header}
+import importlib
+import sys
+from typing import Any, List, Set
+
+from graphql_query import GraphQLQueryBaseModel
+
+
+class GeneratedModel(GraphQLQueryBaseModel):
+    """A base class of generated models."""
+
+    @classmethod
+    def model_rebuild(cls, **kwargs: Any) -> Any:
+        # referenced models are put into the module of the model, forward references are resolved from it
+        _link(cls.__name__)
+        return super().model_rebuild(**kwargs)
+
+
+def _link(name: str) -> None:
+    """Import the models which are reachable from the model and put referenced models into their modules."""
+    package = sys.modules[__package__]
+    linked: Set[str] = set()
+    stack: List[str] = [name]
+
+    while stack:
+        current = stack.pop()
+        if current in linked:
+            continue
+        linked.add(current)
+
+        module = importlib.import_module(f"{{__package__}}.{{package._MODULES[current]}}")
+        for reference in package._REFERENCES[current]:
+            module.__dict__[reference] = getattr(package, reference)
+            stack.append(reference)
+'''
+
+_INIT_MODULE = '''{header}
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+__all__ = [
+{all_names}
+]
+
+# a model -> a module of the model
+_MODULES = {{
+{modules}
+}}
+
+# a model -> models which are referenced by the model
+_REFERENCES = {{
+{references}
+}}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    model = getattr(importlib.import_module(f"{{__name__}}.{{module}}"), name)
+    globals()[name] = model
+    return model
+'''
+
+
+def _module_name(type_name: str) -> str:
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", type_name)
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower().lstrip("_")
+
+
+def _tuple_literal(names: List[str]) -> str:
+    items = ", ".join(f'"{name}"' for name in names)
+    return f"({items},)" if len(names) == 1 else f"({items})"
+
+
+def _string_literal(text: str, prefix: str, width: int = 100, line_length: int = 120) -> str:
+    """Return ``prefix`` with a string literal; a long literal is split into parts of ``width`` characters."""
+    if len(prefix) + len(text) + 2 <= line_length:
+        return f'{prefix}"{text}"'
+
+    indent = " " * (len(prefix) - len(prefix.lstrip()))
+    parts: List[str] = []
+    start = 0
+    while len(text) - start > width:
+        end = text.rfind(" ", start, start + width)
+        if end <= start:
+            end = text.find(" ", start + width)
+            if end == -1:
+                break
+        parts.append(text[start : end + 1])
+        start = end + 1
+    parts.append(text[start:])
+
+    return f"{prefix}(\n" + "".join(f'{indent}    "{part}"\n' for part in parts) + f"{indent})"
+
+
+def _uses(source: str, name: str) -> bool:
+    return re.search(rf"\b{name}\b", source) is not None
+
+
+class _Variables:
+    """Variables of the selection set of a model, a variable of an argument is named by the path of the argument."""
+
+    def __init__(self) -> None:
+        self.types: Dict[str, str] = {}
+        self.selected: Dict[str, str] = {}
+        self._names: Dict[Tuple[str, ...], str] = {}
+
+    def name(self, path: Tuple[str, ...], type_: str, selected: bool = True) -> str:
+        name = self._names.get(path)
+        if name is None:
+            name = self._names[path] = _unique("_".join(path), set(self.types))
+            self.types[name] = type_
+        if selected:
+            self.selected[name] = type_
+
+        return name
+
+
+def _unique(name: str, taken: Set[str]) -> str:
+    while keyword.iskeyword(name) or name in taken:
+        name += "_"
+    taken.add(name)
+    return name
+
+
+class _Generator:
+    def __init__(self, schema: Schema, max_depth: int) -> None:
+        self.schema = schema
+        self.max_depth = max_depth
+
+        self.types = sorted(
+            name for name, kind in schema.kinds.items() if kind in ("OBJECT", "INTERFACE") and not name.startswith("__")
+        )
+
+        taken_classes = set(_RESERVED_CLASS_NAMES)
+        taken_modules = {"_base"}
+        self.class_names = {name: _unique(name, taken_classes) for name in self.types}
+        self.module_names = {name: _unique(_module_name(name) or "type", taken_modules) for name in self.types}
+
+        self._attribute_names: Dict[str, Dict[str, str]] = {}
+
+    def attribute_names(self, type_name: str) -> Dict[str, str]:
+        """Return names of model attributes for fields of the type."""
+        names = self._attribute_names.get(type_name)
+        if names is None:
+            fields = self.schema.fields.get(type_name, {})
+            taken = set(_RESERVED_ATTRIBUTE_NAMES)
+            taken.update(fields)
+
+            names = {}
+            for name in fields:
+                if (
+                    keyword.iskeyword(name)
+                    or name.startswith("_")
+                    or name in _RESERVED_ATTRIBUTE_NAMES
+                    or name in _RESERVED_CLASS_NAMES
+                    or name in self.class_names
+                ):
+                    names[name] = _unique(name.lstrip("_") or "field", taken)
+                else:
+                    names[name] = name
+
+            self._attribute_names[type_name] = names
+
+        return names
+
+    def is_leaf(self, type_: str) -> bool:
+        return self.schema.kinds.get(_named_type(type_)) not in ("OBJECT", "INTERFACE", "UNION")
+
+    @staticmethod
+    def required_arguments(field: SchemaField) -> List[Tuple[str, str]]:
+        return [
+            (name, argument.type)
+            for name, argument in field.arguments.items()
+            if argument.type.endswith("!") and not argument.has_default
+        ]
+
+    # selection sets
+
+    def selection(
+        self, type_name: str, depth: int, path: Tuple[str, ...], prefix: Tuple[str, ...], variables: _Variables
+    ) -> List[str]:
+        if self.schema.kinds.get(type_name) == "UNION":
+            selections = ["__typename"]
+            for member in sorted(self.schema.possible_types.get(type_name, ())):
+                if member in path:
+                    continue
+                # fields of members may have the same names and other argument types
+                members = self.selection(member, depth, path + (member,), prefix + (member,), variables)
+                if len(members) > 0:
+                    selections.append(f"... on {member} {{ {' '.join(members)} }}")
+            return selections
+
+        selections = []
+        attribute_names = self.attribute_names(type_name)
+
+        for name, field in self.schema.fields.get(type_name, {}).items():
+            attribute = attribute_names[name]
+            head = name if attribute == name else f"{attribute}: {name}"
+
+            fields: List[str] = []
+            if not self.is_leaf(field.type):
+                named = _named_type(field.type)
+                if depth >= self.max_depth or named in path:
+                    continue
+
+                fields = self.selection(named, depth + 1, path + (named,), prefix + (attribute,), variables)
+                if len(fields) == 0:
+                    continue
+
+            # variables are named only for selected fields
+            arguments = self.required_arguments(field)
+            if len(arguments) > 0:
+                head += (
+                    "("
+                    + ", ".join(
+                        f"{argument}: ${variables.name(prefix + (attribute, argument), argument_type)}"
+                        for argument, argument_type in arguments
+                    )
+                    + ")"
+                )
+
+            selections.append(head if len(fields) == 0 else f"{head} {{ {' '.join(fields)} }}")
+
+        return selections
+
+    # annotations
+
+    def annotation(self, type_: str, references: Set[str]) -> str:
+        if type_.endswith("!"):
+            return self._annotation_of_non_null(type_[:-1], references)
+
+        return f"Optional[{self._annotation_of_non_null(type_, references)}]"
+
+    def _annotation_of_non_null(self, type_: str, references: Set[str]) -> str:
+        if type_.startswith("["):
+            return f"List[{self.annotation(type_[1:-1], references)}]"
+
+        if type_ in _SCALARS:
+            return _SCALARS[type_]
+
+        kind = self.schema.kinds.get(type_)
+
+        if kind == "ENUM":
+            return "str"
+
+        if kind == "UNION":
+            members = [self.class_names[member] for member in sorted(self.schema.possible_types.get(type_, ()))]
+            references.update(members)
+            return "Union[" + ", ".join(f'"{member}"' for member in members) + "]"
+
+        if kind in ("OBJECT", "INTERFACE"):
+            references.add(self.class_names[type_])
+            return f'"{self.class_names[type_]}"'
+
+        return "Any"
+
+    # modules
+
+    def model_module(self, type_name: str) -> Tuple[str, Set[str]]:
+        class_name = self.class_names[type_name]
+        attribute_names = self.attribute_names(type_name)
+        references: Set[str] = set()
+        lines: List[str] = []
+
+        # variables of arguments of the model fields get the shortest names
+        variables = _Variables()
+        for name, field in self.schema.fields.get(type_name, {}).items():
+            for argument, argument_type in self.required_arguments(field):
+                variables.name((attribute_names[name], argument), argument_type, selected=False)
+
+        for name, field in self.schema.fields.get(type_name, {}).items():
+            attribute = attribute_names[name]
+            annotation = self.annotation(field.type, references)
+
+            # object fields are not selected beyond the depth, so they are always optional
+            required = field.type.endswith("!") and self.is_leaf(field.type)
+            if field.type.endswith("!") and not required:
+                annotation = f"Optional[{annotation}]"
+
+            extra = []
+            if attribute != name:
+                # the response key is the attribute name
+                extra.append(f'"graphql_name": "{name}"')
+                extra.append(f'"graphql_alias": "{attribute}"')
+
+            arguments = self.required_arguments(field)
+            if len(arguments) > 0:
+                values = ", ".join(
+                    f'Argument(name="{argument}", value=Variable('
+                    f'name="{variables.name((attribute, argument), argument_type, False)}", type="{argument_type}"))'
+                    for argument, argument_type in arguments
+                )
+                extra.append(f'"graphql_arguments": [{values}]')
+
+            if len(extra) > 0:
+                lines.append(f"    {attribute}: {annotation} = PydanticField(")
+                if not required:
+                    lines.append("        default=None,")
+                lines.append("        json_schema_extra={")
+                lines.extend(f"            {item}," for item in extra)
+                lines.append("        },")
+                lines.append("    )")
+            elif required:
+                lines.append(f"    {attribute}: {annotation}")
+            else:
+                lines.append(f"    {attribute}: {annotation} = None")
+
+        selection = " ".join(self.selection(type_name, 0, (type_name,), (), variables))
+        body = "\n".join(lines)
+
+        typing_names = ["ClassVar"] + [name for name in ("Any", "List", "Optional", "Union") if _uses(body, name)]
+        if len(variables.selected) > 0:
+            typing_names.append("Dict")
+        imports = [f"from typing import {', '.join(sorted(typing_names))}"]
+        if "PydanticField(" in body:
+            imports += ["", "from pydantic import Field as PydanticField"]
+        if "Argument(" in body:
+            imports += ["", "from graphql_query import Argument, Variable"]
+
+        source = (
+            f"{_HEADER}\n"
+            + "\n".join(imports)
+            + "\n\nfrom ._base import GeneratedModel\n\n\n"
+            + f"class {class_name}(GeneratedModel):\n"
+            + f'    """The GraphQL type `{type_name}`."""\n\n'
+            + _string_literal(selection, "    __graphql_selection__: ClassVar[str] = ")
+            + "\n"
+            + (
+                "    __graphql_variables__: ClassVar[Dict[str, str]] = {\n"
+                + "".join(f'        "{name}": "{type_}",\n' for name, type_ in variables.selected.items())
+                + "    }\n"
+                if len(variables.selected) > 0
+                else ""
+            )
+            + (f"\n{body}\n" if body else "")
+        )
+        references.discard(class_name)
+        return source, references
+
+    def modules(self) -> Dict[str, str]:
+        modules: Dict[str, str] = {"_base.py": _BASE_MODULE.format(header=_HEADER)}
+        references: Dict[str, Set[str]] = {}
+
+        for type_name in self.types:
+            source, references[type_name] = self.model_module(type_name)
+            modules[f"{self.module_names[type_name]}.py"] = source
+
+        class_names = [self.class_names[name] for name in self.types]
+        modules["__init__.py"] = _INIT_MODULE.format(
+            header=_HEADER,
+            type_checking_imports="\n".join(
+                f"    from .{self.module_names[name]} import {self.class_names[name]}" for name in self.types
+            )
+            or "    pass",
+            all_names="\n".join(f'    "{name}",' for name in class_names),
+            modules="\n".join(f'    "{self.class_names[name]}": "{self.module_names[name]}",' for name in self.types),
+            references="\n".join(
+                f'    "{self.class_names[name]}": {_tuple_literal(sorted(references[name]))},' for name in self.types
+            ),
+        )
+
+        return modules
+
+
+def render_models(schema: Schema, max_depth: int = 2) -> Dict[str, str]:
+    """Render modules of a package with models for the schema.
+
+    Args:
+        schema: The schema.
+        max_depth: How many levels of object fields are expanded in precomputed selection sets.
+
+    Returns:
+        File names of the package and their sources.
+    """
+    return _Generator(schema, max_depth).modules()
+
+
+def generate_models(
+    schema: Union[Schema, str, "os.PathLike[str]"],
+    directory: Union[str, "os.PathLike[str]"],
+    max_depth: int = 2,
+) -> List[str]:
+    """Write a package with models for the schema.
+
+    Example:
+
+        >>> generate_models("schema.graphql", "models")
+        >>>
+        >>> from models import Character
+        >>>
+        >>> Query(name="hero", fields=Character.graphql_fields())
+
+    Args:
+        schema: The schema or a path of the schema file.
+        directory: A directory of the package, it is created if needed.
+        max_depth: How many levels of object fields are expanded in precomputed selection sets.
+
+    Returns:
+        Paths of written files.
+    """
+    if not isinstance(schema, Schema):
+        schema = Schema.load(schema)
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for file_name, source in render_models(schema, max_depth).items():
+        path = os.path.join(directory, file_name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(source)
+        paths.append(path)
+
+    return paths
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m graphql_query.codegen", description="Generate GraphQLQueryBaseModel classes from a schema."
+    )
+    parser.add_argument("schema", help="a path of an SDL file or an introspection result (*.json)")
+    parser.add_argument("directory", help="a directory of the generated package")
+    parser.add_argument("--max-depth", type=int, default=2, help="levels of object fields in selection sets")
+    args = parser.parse_args(argv)
+
+    paths = generate_models(args.schema, args.directory, max_depth=args.max_depth)
+    print(f"{len(paths)} files are written to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""A compact form of node trees made of tuples, lists and scalars.
+
+Pickling of pydantic nodes stores the class, the attribute names and the pydantic state of every node, so sending
+big trees to worker processes can take longer than rendering them. The compact form of a node is a tuple of the tag
+of its class and the values of its attributes in declaration order. Nested nodes are tuples too, lists stay lists.
+A node used in many places of a tree (for example a shared ``Variable``) becomes one tuple, so ``pickle`` stores it
+once, and ``from_compact`` builds one node again.
+
+``from_compact`` builds nodes like ``model_construct``, without validation, so the compact form must come from
+``to_compact``.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from .types import (
+    Argument,
+    Directive,
+    Field,
+    Fragment,
+    InlineFragment,
+    Operation,
+    Query,
+    Variable,
+    _GraphQL2PythonQuery,
+)
+
+__all__ = [
+    "to_compact",
+    "from_compact",
+]
+
+_CLASSES: Tuple[Type[_GraphQL2PythonQuery], ...] = (
+    Variable,
+    Argument,
+    Directive,
+    Field,
+    InlineFragment,
+    Fragment,
+    Query,
+    Operation,
+)
+_TAGS: Dict[type, int] = {cls: tag for tag, cls in enumerate(_CLASSES)}
+_NAMES: Tuple[Tuple[str, ...], ...] = tuple(tuple(cls.model_fields) for cls in _CLASSES)
+
+_Memo = Dict[int, Any]
+
+
+def _compact(node: Any, memo: _Memo) -> Any:
+    compact = memo.get(id(node))
+    if compact is None:
+        tag = _TAGS.get(node.__class__)
+        if tag is None:
+            raise ValueError(f"{node.__class__.__name__} can't be converted to the compact form.")
+        compact = memo[id(node)] = _COMPACT[tag](node.__dict__, memo)
+
+    return compact
+
+
+def _compact_value(value: Any, memo: _Memo) -> Any:
+    if value.__class__ is list:
+        return [_compact_value(item, memo) for item in value]
+    if isinstance(value, _GraphQL2PythonQuery):
+        return _compact(value, memo)
+    return value
+
+
+def _compact_fields(fields: List[Any], memo: _Memo) -> List[Any]:
+    return [field if field.__class__ is str else _compact(field, memo) for field in fields]
+
+
+def _compact_nodes(nodes: List[Any], memo: _Memo) -> List[Any]:
+    return [_compact(node, memo) for node in nodes]
+
+
+_COMPACT: Tuple[Callable[[Dict[str, Any], _Memo], Tuple[Any, ...]], ...] = (
+    lambda d, memo: (0, d["name"], d["type"], d["default"]),
+    lambda d, memo: (1, d["name"], _compact_value(d["value"], memo)),
+    lambda d, memo: (2, d["name"], _compact_nodes(d["arguments"], memo)),
+    lambda d, memo: (
+        3,
+        d["name"],
+        d["alias"],
+        _compact_nodes(d["arguments"], memo),
+        _compact_fields(d["fields"], memo),
+        _compact_nodes(d["directives"], memo),
+        d["typename"],
+    ),
+    lambda d, memo: (
+        4,
+        d["type"],
+        _compact_nodes(d["arguments"], memo),
+        _compact_fields(d["fields"], memo),
+        d["typename"],
+    ),
+    lambda d, memo: (5, d["name"], d["type"], _compact_fields(d["fields"], memo), d["typename"]),
+    lambda d, memo: (
+        6,
+        d["name"],
+        d["alias"],
+        _compact_nodes(d["arguments"], memo),
+        d["typename"],
+        _compact_fields(d["fields"], memo),
+    ),
+    lambda d, memo: (
+        7,
+        d["type"],
+        d["name"],
+        _compact_nodes(d["variables"], memo),
+        _compact_nodes(d["queries"], memo),
+        _compact_nodes(d["fragments"], memo),
+    ),
+)
+
+
+def to_compact(node: _GraphQL2PythonQuery) -> Tuple[Any, ...]:
+    """Return the compact form of a node tree.
+
+    Example:
+
+        >>> to_compact(Query(name="user", arguments=[Argument(name="id", value=1)], fields=["id", "login"]))
+        (6, 'user', None, [(1, 'id', 1)], False, ['id', 'login'])
+
+    Raises:
+        ValueError: if the tree has objects which are not nodes of this package (for example subclasses of nodes).
+    """
+    return _compact(node, {})
+
+
+# setters of the slots of pydantic models, they are faster than ``object.__setattr__`` with a name
+_new = object.__new__
+_set_dict = PydanticBaseModel.__dict__["__dict__"].__set__
+_set_fields_set = PydanticBaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = PydanticBaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = PydanticBaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _build(compact: Tuple[Any, ...], memo: _Memo) -> Any:
+    node = memo.get(id(compact))
+    if node is None:
+        tag = compact[0]
+        node = memo[id(compact)] = _new(_CLASSES[tag])
+        _set_dict(node, _BUILD[tag](compact, memo))
+        _set_fields_set(node, set(_NAMES[tag]))
+        _set_extra(node, None)
+        _set_private(node, None)
+
+    return node
+
+
+def _build_value(value: Any, memo: _Memo) -> Any:
+    if value.__class__ is list:
+        return [_build_value(item, memo) for item in value]
+    if value.__class__ is tuple:
+        return _build(value, memo)
+    return value
+
+
+def _build_fields(fields: List[Any], memo: _Memo) -> List[Any]:
+    return [field if field.__class__ is str else _build(field, memo) for field in fields]
+
+
+def _build_nodes(nodes: List[Any], memo: _Memo) -> List[Any]:
+    return [_build(node, memo) for node in nodes]
+
+
+_BUILD: Tuple[Callable[[Tuple[Any, ...], _Memo], Dict[str, Any]], ...] = (
+    lambda c, memo: {"name": c[1], "type": c[2], "default": c[3]},
+    lambda c, memo: {"name": c[1], "value": _build_value(c[2], memo)},
+    lambda c, memo: {"name": c[1], "arguments": _build_nodes(c[2], memo)},
+    lambda c, memo: {
+        "name": c[1],
+        "alias": c[2],
+        "arguments": _build_nodes(c[3], memo),
+        "fields": _build_fields(c[4], memo),
+        "directives": _build_nodes(c[5], memo),
+        "typename": c[6],
+    },
+    lambda c, memo: {
+        "type": c[1],
+        "arguments": _build_nodes(c[2], memo),
+        "fields": _build_fields(c[3], memo),
+        "typename": c[4],
+    },
+    lambda c, memo: {"name": c[1], "type": c[2], "fields": _build_fields(c[3], memo), "typename": c[4]},
+    lambda c, memo: {
+        "name": c[1],
+        "alias": c[2],
+        "arguments": _build_nodes(c[3], memo),
+        "typename": c[4],
+        "fields": _build_fields(c[5], memo),
+    },
+    lambda c, memo: {
+        "type": c[1],
+        "name": c[2],
+        "variables": _build_nodes(c[3], memo),
+        "queries": _build_nodes(c[4], memo),
+        "fragments": _build_nodes(c[5], memo),
+    },
+)
+
+
+def from_compact(compact: Tuple[Any, ...]) -> Any:
+    """Build the node tree of a compact form returned by ``to_compact``.
+
+    Example:
+
+        >>> from_compact((6, 'user', None, [(1, 'id', 1)], False, ['id', 'login']))
+        Query(name='user', alias=None, arguments=[Argument(name='id', value=1)], typename=False, fields=['id', 'login'])
+    """
+    if not isinstance(compact, tuple) or len(compact) == 0 or not 0 <= compact[0] < len(_CLASSES):
+        raise ValueError("The value is not a compact form of a node.")
+
+    return _build(compact, {})
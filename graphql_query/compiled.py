@@ -0,0 +1,136 @@
+"""Compiled operations: render once, bind variables per request.
+
+``Operation.compile()`` renders the operation once and keeps the rendered document, its hash and the JSON request
+body without variables (see ``graphql_query.body``). ``CompiledOperation.bind`` checks and encodes only values of
+variables with encoders compiled from their types (see ``graphql_query.encoders``), the rest of the request body is
+already encoded.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .body import _body_segments, _dumps
+from .encoders import _InvalidValue, variable_encoder
+from .schema import Schema
+from .store import document_hash
+from .types import Operation, Variable
+
+__all__ = [
+    "CompiledOperation",
+]
+
+
+class CompiledOperation:
+    """An immutable compiled operation.
+
+    Example:
+
+        >>> operation = Operation(
+        ...     name="Hero",
+        ...     variables=[Variable(name="episode", type="Episode!")],
+        ...     queries=[
+        ...         Query(
+        ...             name="hero",
+        ...             arguments=[Argument(name="episode", value=Variable(name="episode", type="Episode!"))],
+        ...             fields=["name"],
+        ...         )
+        ...     ],
+        ... )
+        >>> compiled = operation.compile()
+        >>> body = json.loads(compiled.bind(episode="JEDI"))
+        >>> body["query"] == compiled.document
+        True
+        >>> body["variables"], body["operationName"]
+        ({'episode': 'JEDI'}, 'Hero')
+
+    Attributes:
+        document: The rendered document.
+        hash: The sha256 hex digest of the document (the same hash as ``graphql_query.store`` uses).
+        operation_name: The name of the operation.
+        variables: Variables of the operation.
+    """
+
+    __slots__ = (
+        "document",
+        "hash",
+        "operation_name",
+        "variables",
+        "_encoders",
+        "_names",
+        "_required",
+        "_prefix",
+        "_suffix",
+    )
+
+    document: str
+    hash: str
+    operation_name: Optional[str]
+    variables: Tuple[Variable, ...]
+
+    _encoders: Dict[str, Callable[[Any], Any]]
+    _names: FrozenSet[str]
+    _required: FrozenSet[str]
+    _prefix: bytes
+    _suffix: bytes
+
+    def __init__(self, operation: Operation, schema: Optional[Schema] = None) -> None:
+        document = operation.render()
+        variables = tuple(variable.model_copy() for variable in operation.variables)
+
+        prefix, suffix = _body_segments(document, operation.name)
+
+        for name, value in (
+            ("document", document),
+            ("hash", document_hash(document)),
+            ("operation_name", operation.name),
+            ("variables", variables),
+            ("_encoders", {variable.name: variable_encoder(variable.type, schema) for variable in variables}),
+            ("_names", frozenset(variable.name for variable in variables)),
+            (
+                "_required",
+                frozenset(
+                    variable.name
+                    for variable in variables
+                    if variable.type.strip().endswith("!") and variable.default is None
+                ),
+            ),
+            ("_prefix", prefix),
+            ("_suffix", suffix),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(operation_name={self.operation_name!r}, hash={self.hash!r})"
+
+    def _check(self, values: Dict[str, Any]) -> None:
+        if not self._names.issuperset(values):
+            unknown = ", ".join(sorted(set(values) - self._names))
+            raise ValueError(f"Unknown variables: {unknown}.")
+
+        if not self._required.issubset(values):
+            missing = ", ".join(sorted(self._required - set(values)))
+            raise ValueError(f"Missing values of required variables: {missing}.")
+
+    def bind(self, **values: Any) -> bytes:
+        """Return the UTF-8 JSON request body with values of variables.
+
+        Raises:
+            ValueError: if a value is given for an unknown variable, a required variable has no value or a value
+                doesn't match the type of the variable.
+        """
+        self._check(values)
+
+        encoders = self._encoders
+        for name, value in values.items():
+            try:
+                values[name] = encoders[name](value)
+            except _InvalidValue as error:
+                error.path.insert(0, f"${name}")
+                raise
+
+        return self._prefix + _dumps(values) + self._suffix
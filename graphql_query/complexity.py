@@ -0,0 +1,189 @@
+"""Complexity and cost of operations.
+
+``analyze_complexity`` computes the numbers which GraphQL gateways usually limit:
+
+- ``depth``: the maximal depth of fields (top-level queries have depth 1, fragments are expanded, inline fragments
+  don't add a level);
+- ``nodes``: the number of fields and inline fragments as written in the document (every used fragment counts once);
+- ``aliases``: the number of aliases as written in the document;
+- ``size``: the number of fields and inline fragments with every fragment spread expanded;
+- ``cost``: the sum of field weights, every weight is multiplied by the sizes of all lists above the field. A list
+  size is the value of a list argument (``first``, ``last``, ``limit`` by default) of the field.
+
+String selections which are not names (``"issues(first: 50) { title }"``) are parsed and counted like nodes, a
+string which can't be parsed is counted as one field. It is one iterative traversal of the fragment-expanded tree
+without rendering, so it can be called for every request.
+"""
+
+from typing import Any, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from .parser import GraphQLParseError, parse_fields
+from .schema import Schema, _named_type
+from .types import Argument, Field, Fragment, InlineFragment, Operation, Query, Variable
+
+__all__ = [
+    "Complexity",
+    "analyze_complexity",
+]
+
+_DEFAULT_LIST_ARGUMENTS = ("first", "last", "limit")
+
+
+class Complexity(NamedTuple):
+    """Complexity of an operation, see ``analyze_complexity``."""
+
+    depth: int
+    nodes: int
+    aliases: int
+    size: int
+    cost: float
+
+
+def _list_size(
+    arguments: List[Argument],
+    list_arguments: Sequence[str],
+    variables: Mapping[str, Any],
+    default_list_size: int,
+) -> Optional[int]:
+    size: Optional[int] = None
+
+    for argument in arguments:
+        if argument.name not in list_arguments:
+            continue
+
+        value: Any = argument.value
+        if isinstance(value, Variable):
+            value = variables.get(value.name, value.default)
+        if isinstance(value, str):
+            value = value.strip()
+            value = int(value) if value.isdigit() else None
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            value = default_list_size
+
+        size = value if size is None else max(size, value)
+
+    return size
+
+
+def analyze_complexity(
+    operation: Operation,
+    weights: Optional[Mapping[str, float]] = None,
+    variables: Optional[Mapping[str, Any]] = None,
+    schema: Optional[Schema] = None,
+    list_arguments: Sequence[str] = _DEFAULT_LIST_ARGUMENTS,
+    default_weight: float = 1.0,
+    default_list_size: int = 1,
+) -> Complexity:
+    """Compute depth, node count, alias count, fragment-expanded size and cost of the operation.
+
+    Example:
+
+        >>> operation = Operation(
+        ...     queries=[
+        ...         Query(
+        ...             name="repositories",
+        ...             arguments=[Argument(name="first", value=10)],
+        ...             fields=[
+        ...                 "name",
+        ...                 Field(name="issues", arguments=[Argument(name="first", value=5)], fields=["title"]),
+        ...             ],
+        ...         )
+        ...     ]
+        ... )
+        >>> analyze_complexity(operation, weights={"name": 0, "title": 0})
+        Complexity(depth=3, nodes=4, aliases=0, size=4, cost=11.0)
+
+    Args:
+        operation: The operation.
+        weights: Weights of fields by ``Type.field`` (types are known from the schema, inline fragments and
+            fragments) or by ``field``.
+        variables: Values of variables which are used for list sizes.
+        schema: The schema to know types of fields for weights.
+        list_arguments: Names of arguments with list sizes.
+        default_weight: A weight of fields which are not in ``weights``.
+        default_list_size: A list size when the value of a list argument is unknown.
+    """
+    weights = weights or {}
+    variables = variables or {}
+
+    if schema is not None:
+        root_type: Optional[str] = schema.root_types.get(operation.type)
+    else:
+        root_type = operation.type.capitalize()
+
+    depth = 0
+    nodes = 0
+    aliases = 0
+    size = 0
+    cost = 0.0
+
+    counted_fragments: Set[str] = set()
+
+    # (selection, depth of the selection set, list multiplier, parent type, count the selection as written)
+    stack: List[Tuple[Union[str, Query, Field, InlineFragment, Fragment], int, int, Optional[str], bool]] = [
+        (query, 1, 1, root_type, True) for query in reversed(operation.queries)
+    ]
+
+    while stack:
+        selection, level, multiplier, parent_type, as_written = stack.pop()
+
+        if isinstance(selection, Fragment):
+            count = as_written and selection.name not in counted_fragments
+            counted_fragments.add(selection.name)
+            stack.extend((field, level, multiplier, selection.type, count) for field in reversed(selection.fields))
+            if selection.typename:
+                stack.append(("__typename", level, multiplier, selection.type, count))
+            continue
+
+        if isinstance(selection, InlineFragment):
+            size += 1
+            nodes += as_written
+            stack.extend((field, level, multiplier, selection.type, as_written) for field in reversed(selection.fields))
+            if selection.typename:
+                stack.append(("__typename", level, multiplier, selection.type, as_written))
+            continue
+
+        if isinstance(selection, str) and not selection.strip().isidentifier():
+            try:
+                parsed = parse_fields(selection, fragments=operation.fragments)
+            except GraphQLParseError:  # not a selection, it is counted as a field
+                parsed = None
+            if parsed is not None:
+                stack.extend((field, level, multiplier, parent_type, as_written) for field in reversed(parsed))
+                continue
+
+        if isinstance(selection, str):
+            name = selection.strip()
+            arguments: List[Argument] = []
+            fields: List[Any] = []
+        else:
+            name = selection.name
+            arguments = selection.arguments
+            fields = selection.fields
+            aliases += as_written and selection.alias is not None
+            if selection.typename:
+                fields = [*fields, "__typename"]
+
+        size += 1
+        nodes += as_written
+        depth = max(depth, level)
+
+        weight = weights.get(f"{parent_type}.{name}") if parent_type is not None else None
+        if weight is None:
+            weight = weights.get(name, default_weight)
+        cost += weight * multiplier
+
+        if len(fields) == 0:
+            continue
+
+        list_size = _list_size(arguments, list_arguments, variables, default_list_size)
+        field_type = None
+        if schema is not None and parent_type is not None:
+            schema_field = schema.fields.get(parent_type, {}).get(name)
+            field_type = _named_type(schema_field.type) if schema_field is not None else None
+
+        child_multiplier = multiplier * list_size if list_size is not None else multiplier
+        stack.extend((field, level + 1, child_multiplier, field_type, as_written) for field in reversed(fields))
+
+    return Complexity(depth=depth, nodes=nodes, aliases=aliases, size=size, cost=cost)
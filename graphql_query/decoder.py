@@ -0,0 +1,380 @@
+"""Response decoders compiled from ``GraphQLQueryBaseModel`` classes.
+
+``compile_decoder`` turns a model class into a function which builds model objects from response data. The
+annotations of the model are inspected once: every field knows its response key (``graphql_alias`` or the
+attribute name), leaf values of JSON types are taken as is, other leaf values are validated by a pydantic
+``TypeAdapter`` and members of unions are chosen by ``__typename``. The decoding function of a model is generated
+once and builds objects like ``model_construct``, without validation of whole objects, so the response is trusted to
+match the selection set of the model.
+
+``iter_decode`` reads a JSON response from a byte stream and yields decoded items of one list of the response
+(for example ``data.users``) without loading the whole response into memory.
+"""
+
+import codecs
+import functools
+import inspect
+import json
+import threading
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import TypeAdapter
+
+from .base_model import GraphQLQueryBaseModel, _get_field_template
+
+__all__ = [
+    "compile_decoder",
+    "iter_decode",
+]
+
+_Model = TypeVar("_Model", bound=GraphQLQueryBaseModel)
+_Decoder = Callable[[Any], Any]
+
+_JSON_TYPES = (str, int, float, bool, Any, dict, list)
+
+_decoders: Dict[type, "_ModelDecoder"] = {}
+_lock = threading.Lock()
+
+
+class _ModelDecoder:
+    """A decoder of objects of one model.
+
+    The decoding function is generated on the first call (models may refer to themselves): it reads the response
+    keys of the fields one by one and sets the values of the object without validation of the whole object.
+    """
+
+    __slots__ = ("model", "_decode", "_required")
+
+    def __init__(self, model: Type[GraphQLQueryBaseModel]) -> None:
+        self.model = model
+        self._decode: Optional[_Decoder] = None
+        self._required: Tuple[str, ...] = ()
+
+    def _compile(self) -> _Decoder:
+        model = self.model
+        if not model.__pydantic_complete__:
+            # resolve forward references, for example between generated models
+            model.model_rebuild()
+
+        self._required = tuple(
+            _get_field_template(info).alias or name for name, info in model.model_fields.items() if info.is_required()
+        )
+
+        if _is_plain(model, set()):
+            # pydantic-core validates such objects faster than a decoder in Python builds them
+            self._decode = model.model_validate
+            return self._decode
+
+        namespace: Dict[str, Any] = {
+            "_model": model,
+            "_new": model.__new__,
+            "_set": object.__setattr__,
+            "_complete": functools.partial(_complete, model),
+        }
+        lines = ["def decode(data):", "    values = {}"]
+        for index, (name, info) in enumerate(model.model_fields.items()):
+            key = _get_field_template(info).alias or name
+            decode_value = _value_decoder(info.annotation)
+
+            lines.append(f"    if {key!r} in data:")
+            if decode_value is None:
+                lines.append(f"        values[{name!r}] = data[{key!r}]")
+            else:
+                namespace[f"_decode_{index}"] = decode_value
+                lines.append(f"        value = data[{key!r}]")
+                lines.append(f"        values[{name!r}] = None if value is None else _decode_{index}(value)")
+
+        if len(model.__private_attributes__) > 0:
+            lines.append("    return _model.model_construct(**values)")
+        else:
+            lines.extend(
+                [
+                    "    fields_set = set(values)",
+                    f"    if len(values) < {len(model.model_fields)}:",
+                    "        values = _complete(values)",
+                    "    obj = _new(_model)",
+                    '    _set(obj, "__dict__", values)',
+                    '    _set(obj, "__pydantic_fields_set__", fields_set)',
+                    '    _set(obj, "__pydantic_extra__", None)',
+                    '    _set(obj, "__pydantic_private__", None)',
+                    "    return obj",
+                ]
+            )
+
+        exec("\n".join(lines), namespace)  # noqa: S102
+
+        self._decode = namespace["decode"]
+        return self._decode
+
+    def matches(self, data: Dict[str, Any]) -> bool:
+        if self._decode is None:
+            self._compile()
+        return all(key in data for key in self._required)
+
+    def __call__(self, data: Any) -> Any:
+        return (self._decode or self._compile())(data)
+
+
+def _complete(model: Type[GraphQLQueryBaseModel], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Add default values of missing fields like ``model_construct``."""
+    completed = {}
+    for name, info in model.model_fields.items():
+        if name in values:
+            completed[name] = values[name]
+        elif not info.is_required():
+            completed[name] = info.get_default(call_default_factory=True)
+
+    return completed
+
+
+def _model_decoder(model: Type[GraphQLQueryBaseModel]) -> _ModelDecoder:
+    decoder = _decoders.get(model)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.setdefault(model, _ModelDecoder(model))
+
+    return decoder
+
+
+def _union_decoder(members: List[Type[GraphQLQueryBaseModel]]) -> _Decoder:
+    decoders = [_model_decoder(member) for member in members]
+    by_typename = {member.__name__: decoder for member, decoder in zip(members, decoders)}
+
+    def decode(data: Any) -> Any:
+        decoder = by_typename.get(data.get("__typename"))
+        if decoder is None:
+            # without `__typename` the first member which has all required fields is chosen
+            decoder = next((decoder for decoder in decoders if decoder.matches(data)), decoders[-1])
+        return decoder(data)
+
+    return decode
+
+
+def _is_model(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, GraphQLQueryBaseModel)
+
+
+def _is_plain(annotation: Any, seen: Set[type]) -> bool:
+    """Check that pydantic can validate values of the annotation: there are no aliases and unions of models."""
+    if _is_model(annotation):
+        if annotation in seen:
+            return True
+        seen.add(annotation)
+
+        if not annotation.__pydantic_complete__:
+            annotation.model_rebuild()
+
+        return all(
+            _get_field_template(info).alias is None and _is_plain(info.annotation, seen)
+            for info in annotation.model_fields.values()
+        )
+
+    members = [member for member in get_args(annotation) if member is not type(None)]
+    if get_origin(annotation) is Union and sum(_is_model(member) for member in members) > 1:
+        return False
+
+    return all(_is_plain(member, seen) for member in members)
+
+
+def _value_decoder(annotation: Any) -> Optional[_Decoder]:
+    """Return a decoder of values of the annotation or ``None`` if values are taken as is."""
+    if annotation is None or annotation is type(None) or annotation in _JSON_TYPES:
+        return None
+
+    if _is_plain(annotation, set()):
+        # pydantic-core validates such values faster than a decoder in Python builds them
+        return TypeAdapter(annotation).validate_python
+
+    origin = get_origin(annotation)
+
+    if origin is Union:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        if len(members) == 1:
+            return _value_decoder(members[0])
+        if all(_is_model(member) for member in members):
+            return _union_decoder(members)
+
+    elif origin is list:
+        arguments = get_args(annotation)
+        decode_item = _value_decoder(arguments[0]) if arguments else None
+        if decode_item is None:
+            return None
+        return lambda items: [None if item is None else decode_item(item) for item in items]
+
+    elif _is_model(annotation):
+        return _model_decoder(annotation)
+
+    return TypeAdapter(annotation).validate_python
+
+
+def compile_decoder(model: Type[_Model]) -> Callable[[Any], _Model]:
+    """Return a cached decoder of response data into objects of the model.
+
+    Example:
+
+        >>> class Droid(GraphQLQueryBaseModel):
+        ...     name: str
+        ...     primary_function: str = PydanticField(json_schema_extra={"graphql_alias": "function"})
+        ...
+        >>> decode = compile_decoder(Droid)
+        >>> decode({"name": "R2-D2", "function": "Astromech"})
+        Droid(name='R2-D2', primary_function='Astromech')
+
+    """
+    return _model_decoder(model)
+
+
+class _StreamReader:
+    """A buffer of decoded text of a byte stream for ``json.JSONDecoder.raw_decode``."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self.chunks = chunks
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.exhausted = False
+
+    def read(self) -> bool:
+        """Read the next chunk into the buffer, return ``False`` at the end of the stream."""
+        if self.exhausted:
+            return False
+
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            self.buffer = self.buffer[self.position :] + self.decoder.decode(b"", final=True)
+        else:
+            self.buffer = self.buffer[self.position :] + self.decoder.decode(chunk)
+        self.position = 0
+
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character or an empty string at the end of the stream."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in " \t\n\r":
+                self.position += 1
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.read():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if character == "" or character not in characters:
+            raise ValueError(f"Invalid JSON: expected one of `{characters}`, got `{character or 'end of stream'}`.")
+
+        self.position += 1
+        return character
+
+    def value(self) -> Any:
+        """Decode the next value, a value must be followed by another character to be complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.json.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self.read():
+                    raise
+                continue
+
+            if end == len(self.buffer) and not self.exhausted:
+                # a number may continue in the next chunk
+                self.read()
+                continue
+
+            self.position = end
+            return value
+
+
+def _chunks(stream: Union[IO[bytes], Iterable[bytes]], chunk_size: int) -> Iterator[bytes]:
+    read = getattr(stream, "read", None)
+    if read is None:
+        yield from stream  # type: ignore
+        return
+
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_decode(
+    stream: Union[IO[bytes], Iterable[bytes]],
+    model: Type[_Model],
+    path: str = "data",
+    chunk_size: int = 65536,
+) -> Iterator[_Model]:
+    """Decode items of a list of a JSON response as they are read from the stream.
+
+    Only the current item is kept in memory. Values before the list are skipped; values after it are not read.
+
+    Example:
+
+        >>> class User(GraphQLQueryBaseModel):
+        ...     login: str
+        ...
+        >>> chunks = [b'{"data": {"users": [{"lo', b'gin": "a"}, {"login": "b"}]}}']
+        >>> list(iter_decode(chunks, User, "data.users"))
+        [User(login='a'), User(login='b')]
+
+    Args:
+        stream: A binary file or an iterable of bytes chunks.
+        model: A model of items of the list.
+        path: Keys of the list separated by dots. An empty path means that the response is a list.
+        chunk_size: The size of chunks read from a binary file.
+
+    Raises:
+        ValueError: if the stream is not valid JSON or the value at the path is not a list. Nothing is yielded
+            when the value at the path is missing or null.
+    """
+    decode = compile_decoder(model)
+    reader = _StreamReader(_chunks(stream, chunk_size))
+
+    for key in [key for key in path.split(".") if key]:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                return
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.expect(",}") == "}":
+                return
+
+        if reader.peek() == "n":
+            reader.value()
+            return
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+
+    while True:
+        item = reader.value()
+        yield None if item is None else decode(item)  # type: ignore
+
+        if reader.expect(",]") == "]":
+            return
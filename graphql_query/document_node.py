@@ -0,0 +1,260 @@
+"""Direct conversion of operations into graphql-core ``DocumentNode``.
+
+``gql(operation.render())`` renders an operation into text and graphql-core parses the text back into an AST.
+``to_document_node`` builds graphql-core AST nodes directly from the operation tree. Only raw GraphQL text
+stored in the tree (string arguments which are not simple literals, variable defaults and complex string fields)
+is parsed by graphql-core.
+
+This module needs the optional dependency graphql-core.
+"""
+
+import re
+from typing import Any, List, Optional, Tuple, Union
+
+try:
+    from graphql.language import (
+        ArgumentNode,
+        BooleanValueNode,
+        DirectiveNode,
+        DocumentNode,
+        EnumValueNode,
+        FieldNode,
+        FloatValueNode,
+        FragmentDefinitionNode,
+        FragmentSpreadNode,
+        InlineFragmentNode,
+        IntValueNode,
+        ListTypeNode,
+        ListValueNode,
+        NamedTypeNode,
+        NameNode,
+        NonNullTypeNode,
+        NullValueNode,
+        ObjectFieldNode,
+        ObjectValueNode,
+        OperationDefinitionNode,
+        OperationType,
+        SelectionNode,
+        SelectionSetNode,
+        StringValueNode,
+        TypeNode,
+        ValueNode,
+        VariableDefinitionNode,
+        VariableNode,
+        parse,
+        parse_value,
+    )
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "graphql-core is required for `graphql_query.document_node`, "
+        "install it with `pip install graphql_query[graphql-core]`."
+    ) from error
+
+from ._cache import _NodeCache
+from .types import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+
+__all__ = [
+    "to_document_node",
+    "cached_document_node",
+]
+
+_NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+_SIMPLE_STRING = re.compile(r'"[^"\\\n\r]*"')
+
+
+def _name(value: str) -> NameNode:
+    return NameNode(value=value)
+
+
+def _type(text: str) -> TypeNode:
+    text = text.strip()
+
+    if text.endswith("!"):
+        return NonNullTypeNode(type=_type(text[:-1]))  # type: ignore[arg-type]
+
+    if text.startswith("[") and text.endswith("]"):
+        return ListTypeNode(type=_type(text[1:-1]))
+
+    return NamedTypeNode(name=_name(text))
+
+
+def _raw_value(text: str) -> ValueNode:
+    text = text.strip()
+
+    if text == "null":
+        return NullValueNode()
+
+    if text in ("true", "false"):
+        return BooleanValueNode(value=text == "true")
+
+    if _NAME.fullmatch(text):
+        return EnumValueNode(value=text)
+
+    if _SIMPLE_STRING.fullmatch(text):
+        return StringValueNode(value=text[1:-1])
+
+    return parse_value(text, no_location=True)
+
+
+def _object(arguments: List[Argument]) -> ObjectValueNode:
+    return ObjectValueNode(
+        fields=tuple(ObjectFieldNode(name=_name(argument.name), value=_value(argument.value)) for argument in arguments)
+    )
+
+
+def _value(value: Any) -> ValueNode:
+    if isinstance(value, bool):
+        return BooleanValueNode(value=value)
+
+    if isinstance(value, int):
+        return IntValueNode(value=str(value))
+
+    if isinstance(value, float):
+        return FloatValueNode(value=str(value))
+
+    if isinstance(value, str):
+        return _raw_value(value)
+
+    if isinstance(value, Variable):
+        return VariableNode(name=_name(value.name))
+
+    if isinstance(value, Argument):
+        return _object([value])
+
+    if isinstance(value, list):
+        if len(value) == 0:
+            return ListValueNode(values=())
+
+        if Argument._check_is_list_of_str(value):
+            return ListValueNode(
+                values=tuple(StringValueNode(value=item[1:-1]) for item in Argument._clean_list_of_str(value))
+            )
+
+        if Argument._check_is_list_of_arguments(value):
+            return _object(value)
+
+        if Argument._check_is_list_of_list(value):
+            return ListValueNode(values=tuple(_object(arguments) for arguments in value))
+
+        return ListValueNode(values=tuple(_value(item) for item in value))
+
+    raise ValueError("Invalid type for `graphql_query.Argument.value`.")
+
+
+def _arguments(arguments: List[Argument]) -> Tuple[ArgumentNode, ...]:
+    return tuple(ArgumentNode(name=_name(argument.name), value=_value(argument.value)) for argument in arguments)
+
+
+def _directives(directives: List[Directive]) -> Tuple[DirectiveNode, ...]:
+    return tuple(
+        DirectiveNode(name=_name(directive.name), arguments=_arguments(directive.arguments)) for directive in directives
+    )
+
+
+def _selection_set(
+    fields: List[Union[str, Field, InlineFragment, Fragment]], typename: bool
+) -> Optional[SelectionSetNode]:
+    selections: List[SelectionNode] = []
+
+    if typename:
+        selections.append(FieldNode(name=_name("__typename"), arguments=(), directives=()))
+
+    for field in fields:
+        if isinstance(field, str):
+            if _NAME.fullmatch(field.strip()):
+                selections.append(FieldNode(name=_name(field.strip()), arguments=(), directives=()))
+            else:
+                # a raw GraphQL text in the selection set
+                document = parse(f"{{{field}}}", no_location=True)
+                selections.extend(document.definitions[0].selection_set.selections)  # type: ignore[attr-defined]
+
+        elif isinstance(field, Fragment):
+            selections.append(FragmentSpreadNode(name=_name(field.name), directives=()))
+
+        elif isinstance(field, InlineFragment):
+            if len(field.arguments) > 0:
+                raise ValueError("Inline fragments with arguments can't be converted to graphql-core AST.")
+
+            selections.append(
+                InlineFragmentNode(
+                    type_condition=NamedTypeNode(name=_name(field.type)),
+                    directives=(),
+                    selection_set=_selection_set(field.fields, field.typename),  # type: ignore[arg-type]
+                )
+            )
+
+        else:
+            selections.append(_field(field))
+
+    if len(selections) == 0:
+        return None
+
+    return SelectionSetNode(selections=tuple(selections))
+
+
+def _field(field: Union[Field, Query]) -> FieldNode:
+    return FieldNode(
+        alias=_name(field.alias) if field.alias is not None else None,
+        name=_name(field.name),
+        arguments=_arguments(field.arguments),
+        directives=_directives(field.directives) if isinstance(field, Field) else (),
+        # like render(), fields and queries select `__typename` only with other fields
+        selection_set=_selection_set(field.fields, field.typename and len(field.fields) > 0),
+    )
+
+
+def _variable_definition(variable: Variable) -> VariableDefinitionNode:
+    return VariableDefinitionNode(
+        variable=VariableNode(name=_name(variable.name)),
+        type=_type(variable.type),
+        default_value=_raw_value(variable.default) if variable.default is not None else None,  # type: ignore[arg-type]
+        directives=(),
+    )
+
+
+def to_document_node(operation: Operation) -> DocumentNode:
+    """Build a graphql-core ``DocumentNode`` for the operation without rendering and parsing of the text.
+
+    Example:
+
+        >>> from graphql import print_ast
+        >>>
+        >>> operation = Operation(queries=[Query(name="continents", fields=["code", "name"])])
+        >>> print(print_ast(to_document_node(operation)))
+        {
+          continents {
+            code
+            name
+          }
+        }
+
+    """
+    definition = OperationDefinitionNode(
+        operation=OperationType(operation.type),
+        name=_name(operation.name) if operation.name is not None else None,
+        variable_definitions=tuple(_variable_definition(variable) for variable in operation.variables),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(_field(query) for query in operation.queries)),
+    )
+    fragments = tuple(
+        FragmentDefinitionNode(
+            name=_name(fragment.name),
+            type_condition=NamedTypeNode(name=_name(fragment.type)),
+            directives=(),
+            selection_set=_selection_set(fragment.fields, fragment.typename),  # type: ignore[arg-type]
+        )
+        for fragment in operation.fragments
+    )
+
+    return DocumentNode(definitions=(definition, *fragments))
+
+
+_document_node_cache: _NodeCache[DocumentNode] = _NodeCache()
+
+
+def cached_document_node(operation: Operation) -> DocumentNode:
+    """The same as ``to_document_node`` with the result cached for the operation object.
+
+    The operation must not be changed after the first call and the returned AST must not be changed.
+    """
+    return _document_node_cache.get(operation, lambda: to_document_node(operation))
@@ -0,0 +1,370 @@
+"""Encoders of values of variables compiled from their GraphQL types.
+
+An encoder is compiled once per type signature (``[ID!]!``, ``ReviewInput!``) and cached. It checks a Python value
+against the type and returns a JSON-ready structure:
+
+- ``Int``, ``Float``, ``String``, ``Boolean`` and ``ID`` are checked strictly (``Decimal`` is accepted as
+  ``Float``, integers and ``UUID`` as ``ID``);
+- ``datetime``, ``date`` and ``time`` are encoded as ISO 8601 strings, ``Decimal`` and ``UUID`` as strings;
+- ``Enum`` members are encoded as their names, which are the GraphQL enum values, with and without a schema and
+  for every type (``Episode.JEDI`` is ``"JEDI"`` whatever ``Episode.JEDI.value`` is);
+- pydantic models are dumped by aliases;
+- lists of built-in scalars and of dates are checked in one pass without calling an encoder per item.
+
+Without a schema, custom scalars, enums and input types are only encoded. With a ``Schema``, enum values and
+fields of input types are checked too.
+"""
+
+import datetime
+import decimal
+import enum
+import math
+import uuid
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from ._cache import _NodeCache
+from .schema import Schema
+from .types import Variable
+
+__all__ = [
+    "variable_encoder",
+    "encode_variables",
+]
+
+_Encoder = Callable[[Any], Any]
+
+_INT_MIN = -(2**31)
+_INT_MAX = 2**31 - 1
+
+# types of items of a list which can be passed as is
+_NATIVE_ITEMS: Dict[str, Tuple[type, ...]] = {"String": (str,), "Boolean": (bool,), "ID": (str,), "Int": (int,)}
+
+_ISO_TYPES = (datetime.datetime, datetime.date, datetime.time)
+
+_encoders: Dict[str, _Encoder] = {}
+
+
+class _SchemaTypes:
+    """Types of a schema which encoders check and encoders compiled for them.
+
+    Encoders refer to the types and not to the schema, so the cached encoders don't keep the schema alive.
+    """
+
+    __slots__ = ("kinds", "input_fields", "enum_values", "encoders")
+
+    def __init__(self, schema: Schema) -> None:
+        self.kinds = schema.kinds
+        self.input_fields = schema.input_fields
+        self.enum_values = schema.enum_values
+        self.encoders: Dict[str, _Encoder] = {}
+
+
+_schema_types: "_NodeCache[_SchemaTypes]" = _NodeCache()
+
+
+class _InvalidValue(ValueError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+        self.path: List[str] = []
+
+    def __str__(self) -> str:
+        return f"{''.join(self.path)}: {self.message}" if self.path else self.message
+
+
+def _type_name(value: Any) -> str:
+    return type(value).__name__
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.name
+
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+
+    if isinstance(value, PydanticBaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+
+    if isinstance(value, Mapping):
+        return {str(key): _json_value(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_json_value(item) for item in value]
+
+    raise _InvalidValue(f"a value of type `{_type_name(value)}` is not JSON serializable.")
+
+
+def _encode_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool) and _INT_MIN <= value <= _INT_MAX:
+        return int(value)
+
+    raise _InvalidValue(f"expected Int, got {value!r}.")
+
+
+def _encode_float(value: Any) -> float:
+    if isinstance(value, (int, float, decimal.Decimal)) and not isinstance(value, bool):
+        result = float(value)
+        if math.isfinite(result):
+            return result
+
+    raise _InvalidValue(f"expected Float, got {value!r}.")
+
+
+def _encode_string(value: Any) -> str:
+    if isinstance(value, enum.Enum):
+        value = value.name
+
+    if isinstance(value, str):
+        return str(value)
+
+    raise _InvalidValue(f"expected String, got {value!r}.")
+
+
+def _encode_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    raise _InvalidValue(f"expected Boolean, got {value!r}.")
+
+
+def _encode_id(value: Any) -> str:
+    if isinstance(value, (str, uuid.UUID)) or (isinstance(value, int) and not isinstance(value, bool)):
+        return str(value)
+
+    raise _InvalidValue(f"expected ID, got {value!r}.")
+
+
+_SCALAR_ENCODERS: Dict[str, _Encoder] = {
+    "Int": _encode_int,
+    "Float": _encode_float,
+    "String": _encode_string,
+    "Boolean": _encode_boolean,
+    "ID": _encode_id,
+}
+
+
+def _enum_encoder(name: str, values: Sequence[str]) -> _Encoder:
+    allowed = frozenset(values)
+
+    def encode(value: Any) -> str:
+        if isinstance(value, enum.Enum):
+            value = value.name
+
+        if isinstance(value, str) and value in allowed:
+            return str(value)
+
+        raise _InvalidValue(f"expected a value of the enum {name}, got {value!r}.")
+
+    return encode
+
+
+def _input_encoder(name: str, types: _SchemaTypes) -> _Encoder:
+    # fields are compiled on the first call, input types may refer to themselves
+    compiled: List[Tuple[Dict[str, _Encoder], List[str]]] = []
+
+    def encode(value: Any) -> Dict[str, Any]:
+        if not compiled:
+            compiled.append(
+                (
+                    {
+                        field_name: _compile(argument.type, types)
+                        for field_name, argument in types.input_fields.get(name, {}).items()
+                    },
+                    [
+                        field_name
+                        for field_name, argument in types.input_fields.get(name, {}).items()
+                        if argument.type.endswith("!") and not argument.has_default
+                    ],
+                )
+            )
+        fields, required = compiled[0]
+
+        if isinstance(value, PydanticBaseModel):
+            value = value.model_dump(by_alias=True)
+        elif not isinstance(value, Mapping):
+            raise _InvalidValue(f"expected an object of the input type {name}, got {value!r}.")
+
+        result: Dict[str, Any] = {}
+        for key, item in value.items():
+            encoder = fields.get(key)
+            if encoder is None:
+                raise _InvalidValue(f"the input type {name} has no field `{key}`.")
+
+            try:
+                result[key] = encoder(item)
+            except _InvalidValue as error:
+                error.path.insert(0, f".{key}")
+                raise
+
+        for key in required:
+            if key not in result:
+                raise _InvalidValue(f"the required field `{key}` of the input type {name} is missing.")
+
+        return result
+
+    return encode
+
+
+def _named_encoder(name: str, types: Optional[_SchemaTypes]) -> _Encoder:
+    if name in _SCALAR_ENCODERS:
+        return _SCALAR_ENCODERS[name]
+
+    if types is None:
+        return _json_value
+
+    kind = types.kinds.get(name)
+    if kind == "ENUM":
+        return _enum_encoder(name, sorted(types.enum_values.get(name, ())))
+    if kind == "INPUT_OBJECT":
+        return _input_encoder(name, types)
+    if kind == "SCALAR":
+        return _json_value
+
+    raise ValueError(f"The type `{name}` is not an input type of the types.")
+
+
+def _list_encoder(item_type: str, types: Optional[_SchemaTypes]) -> _Encoder:
+    encode_item = _compile(item_type, types)
+
+    native: Optional[Tuple[type, ...]] = _NATIVE_ITEMS.get(item_type.rstrip("!"))
+    if native is not None and not item_type.endswith("!"):
+        native = (*native, type(None))
+    named = item_type.rstrip("!")
+    check_range = named == "Int"
+    custom_scalar = named not in _SCALAR_ENCODERS and (types is None or types.kinds.get(named) == "SCALAR")
+
+    def encode(value: Any) -> List[Any]:
+        if isinstance(value, (str, bytes, Mapping, PydanticBaseModel)) or not hasattr(value, "__iter__"):
+            # input coercion: a single value is a list of one item
+            value = [value]
+
+        if custom_scalar and isinstance(value, list) and value:
+            # lists of dates and times of one type
+            first = type(value[0])
+            if first in _ISO_TYPES and all(type(item) is first for item in value):
+                return [item.isoformat() for item in value]
+
+        if native is not None:
+            items = value if isinstance(value, list) else list(value)
+            if all(type(item) in native for item in items):
+                numbers = [item for item in items if item is not None] if check_range else None
+                if not numbers or (min(numbers) >= _INT_MIN and max(numbers) <= _INT_MAX):
+                    return list(items) if items is value else items
+            value = items
+
+        result = []
+        for index, item in enumerate(value):
+            try:
+                result.append(encode_item(item))
+            except _InvalidValue as error:
+                error.path.insert(0, f"[{index}]")
+                raise
+
+        return result
+
+    return encode
+
+
+def _compile(type_: str, types: Optional[_SchemaTypes]) -> _Encoder:
+    encoders = _encoders if types is None else types.encoders
+    encoder = encoders.get(type_)
+    if encoder is None:
+        encoder = encoders.setdefault(type_, _build(type_, types))
+    return encoder
+
+
+def _build(type_: str, types: Optional[_SchemaTypes]) -> _Encoder:
+    if type_.endswith("!"):
+        encode_value = _compile(type_[:-1], types)
+
+        def encode_non_null(value: Any) -> Any:
+            if value is None:
+                raise _InvalidValue(f"expected a non-null value of {type_}.")
+            return encode_value(value)
+
+        return encode_non_null
+
+    if type_.startswith("[") and type_.endswith("]"):
+        encode_value = _list_encoder(type_[1:-1], types)
+    elif type_ and "[" not in type_ and "]" not in type_:
+        encode_value = _named_encoder(type_, types)
+    else:
+        raise ValueError(f"Invalid GraphQL type `{type_}`.")
+
+    def encode_nullable(value: Any) -> Any:
+        return None if value is None else encode_value(value)
+
+    return encode_nullable
+
+
+def variable_encoder(type_: str, schema: Optional[Schema] = None) -> Callable[[Any], Any]:
+    """Return a cached encoder of values of the GraphQL type.
+
+    Example:
+
+        >>> import datetime
+        >>> encode = variable_encoder("[DateTime!]")
+        >>> encode([datetime.datetime(2024, 1, 2, 3, 4, 5)])
+        ['2024-01-02T03:04:05']
+        >>> variable_encoder("[ID!]!")([1, "2"])
+        ['1', '2']
+
+    Args:
+        type_: A type of a variable.
+        schema: A schema for checking enum values and fields of input types.
+
+    Returns:
+        A function which returns a JSON-ready value and raises ``ValueError`` for values which don't match the type.
+    """
+    types = None if schema is None else _schema_types.get(schema, lambda: _SchemaTypes(schema))
+    return _compile("".join(type_.split()), types)
+
+
+def encode_variables(
+    variables: Sequence[Variable],
+    values: Mapping[str, Any],
+    schema: Optional[Schema] = None,
+) -> Dict[str, Any]:
+    """Check and encode values of variables of an operation.
+
+    Example:
+
+        >>> from decimal import Decimal
+        >>> encode_variables(
+        ...     [Variable(name="ids", type="[ID!]!"), Variable(name="price", type="Float")],
+        ...     {"ids": [1, 2], "price": Decimal("9.99")},
+        ... )
+        {'ids': ['1', '2'], 'price': 9.99}
+
+    Raises:
+        ValueError: if a value is given for an unknown variable, a required variable has no value or a value
+            doesn't match the type. The message starts with the path of the value, for example ``$review.stars``.
+    """
+    types = {variable.name: variable for variable in variables}
+
+    result: Dict[str, Any] = {}
+    for name, value in values.items():
+        variable = types.get(name)
+        if variable is None:
+            raise ValueError(f"Unknown variable `{name}`.")
+
+        try:
+            result[name] = variable_encoder(variable.type, schema)(value)
+        except _InvalidValue as error:
+            error.path.insert(0, f"${name}")
+            raise
+
+    for variable in variables:
+        if variable.name not in values and variable.type.strip().endswith("!") and variable.default is None:
+            raise ValueError(f"The value of the required variable `${variable.name}` is missing.")
+
+    return result
@@ -0,0 +1,222 @@
+"""Automatic fragment extraction for repeated subtrees.
+
+Large generated documents often repeat the same selection set, for example the same ``author { ... }`` field
+under many parents. The pass finds identical selection sets with structural (Merkle) hashes, moves every
+repeated selection set above a size threshold into a generated named fragment and replaces it with a spread.
+
+GraphQL fragments need a type condition which cannot be derived from a field without a schema, so the type of
+a field is given by a mapping of field names to types or by a function. Selection sets of inline fragments use
+their own type condition.
+
+The pass makes three linear traversals of the tree:
+
+1. hash every selection set bottom-up and count equal ones;
+2. count repeats again top-down, visiting the body of each repeated selection set only once, so a selection set
+   which is repeated only as a part of a bigger repeated selection set is not extracted on its own;
+3. rebuild the tree with spreads of the generated fragments.
+"""
+
+import hashlib
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from .canonical import _selection_head
+from .types import Field, Fragment, InlineFragment, Operation, Query
+
+__all__ = [
+    "extract_fragments",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment, Query]
+_Parent = (Query, Field, InlineFragment)
+_TypeResolver = Callable[[Union[Query, Field]], Optional[str]]
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _resolver_from_mapping(types: Mapping[str, str]) -> _TypeResolver:
+    def type_of(field: Union[Query, Field]) -> Optional[str]:
+        return types.get(field.name)
+
+    return type_of
+
+
+class _FragmentExtractor:
+    def __init__(self, type_of: _TypeResolver, min_size: int, prefix: str, used_names: Set[str]) -> None:
+        self._type_of = type_of
+        self._min_size = min_size
+        self._prefix = prefix
+        self._used_names = used_names
+
+        # id of a node -> key of its selection set
+        self._keys: Dict[int, bytes] = {}
+        # key of a selection set -> type condition, size in nodes, number of occurrences
+        self._types: Dict[bytes, str] = {}
+        self._sizes: Dict[bytes, int] = {}
+        self._counts: Dict[bytes, int] = {}
+
+        self._effective_counts: Dict[bytes, int] = {}
+        self._visited: Set[bytes] = set()
+
+        self._fragments: Dict[bytes, Fragment] = {}
+
+    # 1. structural hashes
+
+    def hash_selection_set(self, selections: Sequence[_Selection]) -> Tuple[bytes, int]:
+        digests = []
+        size = 0
+        for selection in selections:
+            digest, selection_size = self._hash_selection(selection)
+            digests.append(digest)
+            size += selection_size
+
+        return _digest(b"".join(digests)), size
+
+    def _hash_selection(self, selection: _Selection) -> Tuple[bytes, int]:
+        head = _selection_head(selection).encode("utf-8")
+
+        if not isinstance(selection, _Parent) or len(selection.fields) == 0:
+            return _digest(head), 1
+
+        set_digest, size = self.hash_selection_set(selection.fields)
+
+        type_name = selection.type if isinstance(selection, InlineFragment) else self._type_of(selection)
+        if type_name is not None:
+            key = _digest(type_name.encode("utf-8") + b"\x00" + set_digest)
+            self._keys[id(selection)] = key
+            self._types[key] = type_name
+            self._sizes[key] = size
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        typename = b"1" if selection.typename else b"0"
+        return _digest(head + typename + set_digest), size + 1
+
+    # 2. effective number of repeats
+
+    def _is_candidate(self, key: bytes) -> bool:
+        return self._counts[key] > 1 and self._sizes[key] >= self._min_size
+
+    def count_selection_set(self, selections: Sequence[_Selection]) -> None:
+        for selection in selections:
+            if not isinstance(selection, _Parent):
+                continue
+
+            key = self._keys.get(id(selection))
+            if key is not None and self._is_candidate(key):
+                self._effective_counts[key] = self._effective_counts.get(key, 0) + 1
+                if key in self._visited:
+                    continue
+                self._visited.add(key)
+
+            self.count_selection_set(selection.fields)
+
+    # 3. rewriting
+
+    def _is_extracted(self, key: Optional[bytes]) -> bool:
+        return key is not None and self._effective_counts.get(key, 0) > 1
+
+    def _new_name(self) -> str:
+        index = len(self._fragments) + 1
+        while f"{self._prefix}{index}" in self._used_names:
+            index += 1
+
+        name = f"{self._prefix}{index}"
+        self._used_names.add(name)
+        return name
+
+    def rewrite_selection_set(self, selections: Sequence[_Selection]) -> List[_Selection]:
+        return [self._rewrite_selection(selection) for selection in selections]
+
+    def _rewrite_selection(self, selection: _Selection) -> _Selection:
+        if not isinstance(selection, _Parent):
+            return selection
+
+        key = self._keys.get(id(selection))
+        if key is not None and self._is_extracted(key):
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                fields = self.rewrite_selection_set(selection.fields)
+                fragment = self._fragments[key] = Fragment(
+                    name=self._new_name(), type=self._types[key], fields=fields  # type: ignore[arg-type]
+                )
+
+            return selection.model_copy(update={"fields": [fragment]})
+
+        return selection.model_copy(update={"fields": self.rewrite_selection_set(selection.fields)})
+
+    @property
+    def fragments(self) -> List[Fragment]:
+        return list(self._fragments.values())
+
+
+def extract_fragments(
+    operation: Operation,
+    types: Union[Mapping[str, str], _TypeResolver],
+    min_size: int = 3,
+    prefix: str = "Fragment",
+) -> Operation:
+    """Move repeated selection sets of the operation into generated fragments.
+
+    Args:
+        operation: An operation for compression; it is not changed.
+        types: GraphQL types of fields: a mapping of field names to type names or a function which returns
+            the type of a field (``Field`` or ``Query``) or ``None`` if the type is unknown.
+        min_size: The minimal number of nodes in a selection set to extract it.
+        prefix: A prefix for names of generated fragments.
+
+    Returns:
+        A new operation with spreads of generated fragments and with the fragments registered
+        in ``Operation.fragments``.
+
+    Example:
+
+        >>> author = Field(name="author", fields=["id", "name", "avatar"])
+        >>> operation = Operation(
+        ...     queries=[
+        ...         Query(name="posts", fields=["title", author]),
+        ...         Query(name="comments", fields=["text", author]),
+        ...     ]
+        ... )
+        >>> print(extract_fragments(operation, {"author": "User"}).render())
+        query {
+          posts {
+            title
+            author {
+              ...Fragment1
+            }
+          }
+          comments {
+            text
+            author {
+              ...Fragment1
+            }
+          }
+        }
+        <BLANKLINE>
+        fragment Fragment1 on User {
+          id
+          name
+          avatar
+        }
+
+    """
+    type_of = _resolver_from_mapping(types) if isinstance(types, Mapping) else types
+
+    extractor = _FragmentExtractor(type_of, min_size, prefix, {fragment.name for fragment in operation.fragments})
+
+    extractor.hash_selection_set(operation.queries)
+    for fragment in operation.fragments:
+        extractor.hash_selection_set(fragment.fields)
+
+    extractor.count_selection_set(operation.queries)
+    for fragment in operation.fragments:
+        extractor.count_selection_set(fragment.fields)
+
+    queries = extractor.rewrite_selection_set(operation.queries)
+    fragments = [
+        fragment.model_copy(update={"fields": extractor.rewrite_selection_set(fragment.fields)})
+        for fragment in operation.fragments
+    ]
+
+    return operation.model_copy(update={"queries": queries, "fragments": fragments + extractor.fragments})
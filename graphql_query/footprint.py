@@ -0,0 +1,148 @@
+"""Memory footprint of node trees.
+
+``footprint`` walks a tree and counts the memory of every object of it once: nodes, their ``__dict__`` and pydantic
+state, lists and values. Objects shared by many nodes (for example a ``Variable`` used by many arguments or interned
+strings) are counted once, like the memory they take. Subtrees which are equal to an earlier subtree but are other
+objects are duplicates: replacing them by the earlier subtree (interning) would save their memory.
+"""
+
+import sys
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+
+from .types import _GraphQL2PythonQuery
+
+__all__ = [
+    "footprint",
+    "FootprintReport",
+]
+
+
+class FootprintReport(NamedTuple):
+    """The memory footprint of a node tree.
+
+    Attributes:
+        nodes: The number of node objects by class names, a shared node is counted once.
+        sizes: Bytes of node objects by class names: the nodes, their attributes and lists, without child nodes.
+        size: Bytes of all objects of the tree.
+        duplicate_size: Bytes of subtrees which are equal to other subtrees, interning of subtrees would save them.
+        rendered_size: Bytes of the rendered text in UTF-8.
+    """
+
+    nodes: Dict[str, int]
+    sizes: Dict[str, int]
+    size: int
+    duplicate_size: int
+    rendered_size: int
+
+
+class _Walker:
+    def __init__(self) -> None:
+        self.seen: Set[int] = set()
+        self.keys: Dict[Tuple[Any, ...], int] = {}
+        self.node_keys: Dict[int, int] = {}
+        self.first: Dict[int, _GraphQL2PythonQuery] = {}
+        self.nodes: Dict[str, int] = {}
+        self.sizes: Dict[str, int] = {}
+        self.duplicate_size = 0
+
+    def key(self, value: Any) -> Any:
+        """Return a hashable key of a value, equal subtrees have equal keys."""
+        if isinstance(value, _GraphQL2PythonQuery):
+            key = self.node_keys.get(id(value))
+            if key is None:
+                # keys of nodes are small numbers, so keys of parents stay flat and fast to hash
+                items = (type(value), *[self.key(item) for item in value.__dict__.values()])
+                key = self.node_keys[id(value)] = self.keys.setdefault(items, len(self.keys))
+            return key
+
+        if isinstance(value, list):
+            return (list, *[self.key(item) for item in value])
+
+        if isinstance(value, (str, int, float)) or value is None:
+            # 1 and True are equal but are different values of arguments
+            return (type(value), value)
+
+        return (type(value), id(value))
+
+    def size(self, value: Any) -> int:
+        """Return bytes of objects of a value which were not counted yet, without child nodes."""
+        if id(value) in self.seen:
+            return 0
+        self.seen.add(id(value))
+
+        size = sys.getsizeof(value)
+        if isinstance(value, list):
+            size += sum(self.size(item) for item in value if not isinstance(item, _GraphQL2PythonQuery))
+
+        return size
+
+    def children(self, value: Any, nodes: List[_GraphQL2PythonQuery]) -> None:
+        if isinstance(value, _GraphQL2PythonQuery):
+            nodes.append(value)
+        elif isinstance(value, list):
+            for item in value:
+                self.children(item, nodes)
+
+    def visit(self, node: _GraphQL2PythonQuery, duplicate: bool = False) -> int:
+        """Count a subtree and return bytes of its objects which were not counted yet."""
+        if id(node) in self.seen:
+            return 0
+
+        key = self.key(node)
+        first = self.first.setdefault(key, node)
+        if first is not node and not duplicate:
+            size = self.visit(node, duplicate=True)
+            self.duplicate_size += size
+            return size
+
+        name = type(node).__name__
+        own = self.size(node) + self.size(node.__dict__) + self.size(node.__pydantic_fields_set__)
+        for state in (node.__pydantic_extra__, node.__pydantic_private__):
+            if state is not None:
+                own += self.size(state)
+
+        children: List[_GraphQL2PythonQuery] = []
+        for value in node.__dict__.values():
+            own += self.size(value) if not isinstance(value, _GraphQL2PythonQuery) else 0
+            self.children(value, children)
+
+        self.nodes[name] = self.nodes.get(name, 0) + 1
+        self.sizes[name] = self.sizes.get(name, 0) + own
+
+        return own + sum(self.visit(child, duplicate) for child in children)
+
+
+def footprint(node: _GraphQL2PythonQuery, render: bool = True) -> FootprintReport:
+    """Return the memory footprint of a node tree.
+
+    Example:
+
+        >>> var_id = Variable(name="id", type="ID!")
+        >>> operation = Operation(
+        ...     variables=[var_id],
+        ...     queries=[
+        ...         Query(name="user", alias=f"user{i}", arguments=[Argument(name="id", value=var_id)], fields=["id"])
+        ...         for i in range(100)
+        ...     ],
+        ... )
+        >>> report = footprint(operation)
+        >>> report.nodes
+        {'Operation': 1, 'Variable': 1, 'Query': 100, 'Argument': 100}
+        >>> report.duplicate_size > 0  # equal arguments are other objects
+        True
+
+    Args:
+        node: The root of the tree.
+        render: Render the tree for ``rendered_size``, it is 0 without rendering.
+    """
+    walker = _Walker()
+    size = walker.visit(node)
+    rendered_size = len(node.render().encode("utf-8")) if render else 0
+
+    return FootprintReport(
+        nodes=walker.nodes,
+        sizes=walker.sizes,
+        size=size,
+        duplicate_size=walker.duplicate_size,
+        rendered_size=rendered_size,
+    )
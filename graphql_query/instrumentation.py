@@ -0,0 +1,245 @@
+"""Opt-in instrumentation of rendering: time and size of renders per node class and the slowest subtrees.
+
+``RenderProfiler.enable`` replaces ``render`` of node classes with a recording wrapper and ``disable`` puts the
+original methods back, so there is no overhead at all while no profiler is enabled. Nested renders are recorded with
+a path of the node in the rendered tree, for example ``Operation:Feed.Query:posts.Field:author``, the time of a
+render includes the renders of its children and the self time doesn't.
+"""
+
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from .types import Argument, Directive, Fragment, InlineFragment, Operation, Variable, _GraphQL2PythonQuery
+
+__all__ = [
+    "RenderProfiler",
+    "RenderSnapshot",
+    "NodeStats",
+    "SlowRender",
+]
+
+_Hook = Callable[[_GraphQL2PythonQuery, str, float, str], None]
+
+
+class NodeStats(NamedTuple):
+    """Renders of nodes of a class.
+
+    Attributes:
+        calls: The number of renders.
+        time: The cumulative time of renders in seconds, with renders of children.
+        self_time: The cumulative time of renders in seconds, without renders of children.
+        size: The cumulative length of rendered text in characters.
+    """
+
+    calls: int
+    time: float
+    self_time: float
+    size: int
+
+
+class SlowRender(NamedTuple):
+    """A render of a subtree.
+
+    Attributes:
+        path: The path of the node in the rendered tree.
+        node: The class name of the node.
+        time: The time of the render in seconds.
+        size: The length of the rendered text in characters.
+    """
+
+    path: str
+    node: str
+    time: float
+    size: int
+
+
+class RenderSnapshot(NamedTuple):
+    """Statistics of renders recorded by a profiler.
+
+    Attributes:
+        nodes: Statistics by class names of nodes.
+        slowest: The slowest renders, the slowest first.
+    """
+
+    nodes: Dict[str, NodeStats]
+    slowest: List[SlowRender]
+
+    def metrics(self, prefix: str = "graphql_query.render") -> Dict[str, float]:
+        """Return a flat mapping of metric names to values, for example ``graphql_query.render.Field.calls``."""
+        return {
+            f"{prefix}.{node}.{name}": value
+            for node, stats in self.nodes.items()
+            for name, value in stats._asdict().items()
+        }
+
+
+def _segment(node: _GraphQL2PythonQuery) -> str:
+    name = type(node).__name__
+    if isinstance(node, Operation):
+        return f"{name}:{node.name or node.type}"
+    if isinstance(node, InlineFragment):
+        return f"{name}:{node.type}"
+    if isinstance(node, (Fragment, Argument, Directive, Variable)):
+        return f"{name}:{node.name}"
+
+    # Field and Query
+    return f"{name}:{getattr(node, 'alias', None) or getattr(node, 'name', '')}"
+
+
+def _node_classes(cls: Type[_GraphQL2PythonQuery]) -> List[Type[_GraphQL2PythonQuery]]:
+    classes = []
+    for subclass in cls.__subclasses__():
+        if "render" in subclass.__dict__:
+            classes.append(subclass)
+        classes.extend(_node_classes(subclass))
+
+    return classes
+
+
+class RenderProfiler:
+    """A profiler of renders of nodes.
+
+    Only one profiler is enabled at a time. Renders in all threads are recorded.
+
+    Example:
+
+        >>> profiler = RenderProfiler(slowest=3)
+        >>> with profiler:
+        ...     document = operation.render()
+        ...
+        >>> snapshot = profiler.snapshot()
+        >>> snapshot.nodes["Argument"].calls
+        12
+        >>> snapshot.slowest[0].path
+        'Operation:Feed'
+        >>> statsd.gauge_many(snapshot.metrics())
+
+    Args:
+        slowest: The number of the slowest renders to keep.
+        hook: A function called after every render with the node, its path, the time and the rendered text.
+    """
+
+    _enabled: Optional["RenderProfiler"] = None
+    _enable_lock = threading.Lock()
+
+    def __init__(self, slowest: int = 10, hook: Optional[_Hook] = None) -> None:
+        self.slowest = slowest
+        self.hook = hook
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._originals: Dict[type, Any] = {}
+        self._nodes: Dict[str, List[Any]] = {}
+        self._slowest: List[Tuple[float, int, SlowRender]] = []
+        self._count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return RenderProfiler._enabled is self
+
+    def enable(self) -> None:
+        """Start recording of renders.
+
+        Raises:
+            ValueError: if another profiler is enabled.
+        """
+        with RenderProfiler._enable_lock:
+            if RenderProfiler._enabled is self:
+                return
+            if RenderProfiler._enabled is not None:
+                raise ValueError("Another RenderProfiler is enabled.")
+
+            for cls in _node_classes(_GraphQL2PythonQuery):
+                self._originals[cls] = cls.__dict__["render"]
+                setattr(cls, "render", self._wrap(cls.__name__, cls.__dict__["render"]))
+
+            RenderProfiler._enabled = self
+
+    def disable(self) -> None:
+        """Stop recording of renders, recorded statistics are kept."""
+        with RenderProfiler._enable_lock:
+            if RenderProfiler._enabled is not self:
+                return
+
+            for cls, render in self._originals.items():
+                setattr(cls, "render", render)
+
+            self._originals = {}
+            RenderProfiler._enabled = None
+
+    def __enter__(self) -> "RenderProfiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.disable()
+
+    def _wrap(self, name: str, render: Callable[[Any], str]) -> Callable[[Any], str]:
+        local = self._local
+        perf_counter = time.perf_counter
+
+        def wrapper(node: _GraphQL2PythonQuery) -> str:
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+
+            parent = stack[-1] if len(stack) > 0 else None
+            if parent is not None and parent[2] is node:
+                # `super().render()` of a subclass of a node class
+                return render(node)
+
+            path = _segment(node) if parent is None else f"{parent[0]}.{_segment(node)}"
+            frame: List[Any] = [path, 0.0, node]
+
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                result = render(node)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if parent is not None:
+                    parent[1] += elapsed
+
+            self._record(name, path, elapsed, elapsed - frame[1], len(result))
+            if self.hook is not None:
+                self.hook(node, path, elapsed, result)
+
+            return result
+
+        wrapper.__wrapped__ = render  # type: ignore
+        return wrapper
+
+    def _record(self, name: str, path: str, elapsed: float, self_time: float, size: int) -> None:
+        with self._lock:
+            stats = self._nodes.get(name)
+            if stats is None:
+                stats = self._nodes[name] = [0, 0.0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += self_time
+            stats[3] += size
+
+            if self.slowest > 0 and (len(self._slowest) < self.slowest or elapsed > self._slowest[0][0]):
+                # the counter orders renders of the same time
+                self._count += 1
+                item = (elapsed, self._count, SlowRender(path=path, node=name, time=elapsed, size=size))
+                if len(self._slowest) < self.slowest:
+                    heapq.heappush(self._slowest, item)
+                else:
+                    heapq.heapreplace(self._slowest, item)
+
+    def snapshot(self) -> RenderSnapshot:
+        """Return recorded statistics, the profiler may stay enabled."""
+        with self._lock:
+            nodes = {name: NodeStats(*stats) for name, stats in self._nodes.items()}
+            slowest = [item[2] for item in sorted(self._slowest, reverse=True)]
+
+        return RenderSnapshot(nodes=nodes, slowest=slowest)
+
+    def reset(self) -> None:
+        """Forget recorded statistics."""
+        with self._lock:
+            self._nodes = {}
+            self._slowest = []
@@ -0,0 +1,136 @@
+"""Field merging: deduplication of selection sets.
+
+Composed selections often select the same field several times. The pass merges fields with the same name,
+alias, arguments and directives (and inline fragments with the same type condition) recursively, removes
+repeated fragment spreads and drops explicit ``__typename`` fields of selection sets with ``typename=True``.
+The first occurrence of every selection keeps its position.
+"""
+
+from typing import Dict, List, NamedTuple, Sequence, TypeVar, Union
+
+from ._walk import _iter_nodes
+from .canonical import _selection_head
+from .types import Field, Fragment, InlineFragment, Operation, Query, _GraphQL2PythonQuery
+
+__all__ = [
+    "MergeResult",
+    "merge_fields",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment, Query]
+_Node = TypeVar("_Node", Operation, Query, Field, InlineFragment, Fragment)
+
+
+class MergeResult(NamedTuple):
+    """A result of the field merging pass.
+
+    Attributes:
+        node: A new node tree with merged fields.
+        removed_nodes: How many nodes were removed from the tree.
+        removed_bytes: How many bytes were removed from the rendered document.
+    """
+
+    node: Union[Operation, Query, Field, InlineFragment, Fragment]
+    removed_nodes: int
+    removed_bytes: int
+
+
+def _is_typename(selection: _Selection) -> bool:
+    if isinstance(selection, str):
+        return selection.strip() == "__typename"
+
+    return (
+        isinstance(selection, Field)
+        and selection.name == "__typename"
+        and selection.alias in (None, "__typename")
+        and len(selection.directives) == 0
+    )
+
+
+def _merge_selections(selections: Sequence[_Selection], typename: bool = False) -> List[_Selection]:
+    groups: Dict[str, List[_Selection]] = {}
+
+    for selection in selections:
+        if typename and _is_typename(selection):
+            continue
+
+        groups.setdefault(_selection_head(selection), []).append(selection)
+
+    merged: List[_Selection] = []
+    for group in groups.values():
+        parents = [selection for selection in group if isinstance(selection, (Query, Field, InlineFragment))]
+
+        if len(parents) == 0:
+            merged.append(group[0])
+            continue
+
+        group_typename = any(parent.typename for parent in parents)
+        children = [child for parent in parents for child in parent.fields]
+        merged.append(
+            parents[0].model_copy(
+                update={"fields": _merge_selections(children, group_typename), "typename": group_typename}
+            )
+        )
+
+    return merged
+
+
+def _merge_fragments(fragments: Sequence[Fragment]) -> List[Fragment]:
+    groups: Dict[str, List[Fragment]] = {}
+    for fragment in fragments:
+        groups.setdefault(fragment.name, []).append(fragment)
+
+    merged: List[Fragment] = []
+    for group in groups.values():
+        group_typename = any(fragment.typename for fragment in group)
+        children = [child for fragment in group for child in fragment.fields]
+        merged.append(
+            group[0].model_copy(
+                update={"fields": _merge_selections(children, group_typename), "typename": group_typename}
+            )
+        )
+
+    return merged
+
+
+def merge_fields(node: _Node) -> MergeResult:
+    """Merge duplicate fields of the node tree.
+
+    The given tree is not changed, the result contains a new tree.
+
+    Example:
+
+        >>> result = merge_fields(
+        ...     Query(
+        ...         name="hero",
+        ...         fields=[Field(name="friends", fields=["name"]), Field(name="friends", fields=["id", "name"])],
+        ...     )
+        ... )
+        >>> print(result.node.render())
+        hero {
+          friends {
+            name
+            id
+          }
+        }
+        >>> result.removed_nodes
+        2
+
+    """
+    merged: _GraphQL2PythonQuery
+
+    if isinstance(node, Operation):
+        merged = node.model_copy(
+            update={
+                "queries": _merge_selections(node.queries),
+                "fragments": _merge_fragments(node.fragments),
+            }
+        )
+    else:
+        merged = node.model_copy(update={"fields": _merge_selections(node.fields, node.typename)})
+
+    return MergeResult(
+        node=merged,  # type: ignore[arg-type]
+        removed_nodes=sum(1 for _ in _iter_nodes(node)) - sum(1 for _ in _iter_nodes(merged)),
+        removed_bytes=len(node.render().encode("utf-8")) - len(merged.render().encode("utf-8")),
+    )
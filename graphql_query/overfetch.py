@@ -0,0 +1,290 @@
+"""An overfetch profiler: which selected fields are read by the application.
+
+``OverfetchProfiler.wrap`` returns a read-only view of response data which records reads of keys (``data["name"]``)
+and attributes (``data.name``, attribute names of the model are mapped to response keys) by selection paths. Objects
+have the mapping methods ``get``, ``keys``, ``values`` and ``items`` too, but fields of the model and keys of the
+object with the same names take precedence: ``data.items`` of a model with the field ``items`` is the field. The
+profiler counts in how many responses every selected field was read, and ``report`` lists the fields which were
+never read. ``report().exclude`` can be passed to ``graphql_fields(exclude=...)`` of the model.
+"""
+
+import inspect
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from .base_model import GraphQLQueryBaseModel, _get_field_template
+from .types import Field, Fragment, InlineFragment, Operation
+
+__all__ = [
+    "OverfetchProfiler",
+    "OverfetchReport",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment]
+
+
+class OverfetchReport(NamedTuple):
+    """Reads of selected fields.
+
+    Attributes:
+        requests: The number of wrapped responses.
+        reads: The number of responses in which a field was read by selection paths.
+        unused: Paths of fields which were never read.
+        exclude: The shortest paths of fields which were never read, fields of unused objects are not listed. An
+            object which was read keeps one of its fields even if none was read, so it is not dropped.
+    """
+
+    requests: int
+    reads: Dict[str, int]
+    unused: List[str]
+    exclude: List[str]
+
+
+def _selection_paths(
+    fields: Sequence[_Selection], prefix: str, fragments: Dict[str, Fragment], paths: List[str]
+) -> None:
+    for field in fields:
+        if isinstance(field, str):
+            paths.append(prefix + field)
+        elif isinstance(field, InlineFragment):
+            _selection_paths(field.fields, prefix, fragments, paths)
+        elif isinstance(field, Fragment):
+            _selection_paths(fragments.get(field.name, field).fields, prefix, fragments, paths)
+        else:
+            path = prefix + (field.alias or field.name)
+            paths.append(path)
+            _selection_paths(field.fields, path + ".", fragments, paths)
+
+
+def _models(annotation: Any) -> Iterator[Type[GraphQLQueryBaseModel]]:
+    if inspect.isclass(annotation) and issubclass(annotation, GraphQLQueryBaseModel):
+        yield annotation
+    for argument in get_args(annotation) if get_origin(annotation) is not None else ():
+        yield from _models(argument)
+
+
+def _attribute_keys(
+    model: Type[GraphQLQueryBaseModel], prefix: str, selected: Set[str], keys: Dict[str, Dict[str, str]]
+) -> None:
+    attributes = keys.setdefault(prefix, {})
+    for name, info in model.model_fields.items():
+        template = _get_field_template(info, name)
+        key = template.alias or template.name
+        attributes[name] = key
+
+        path = prefix + key
+        if path in selected:
+            for sub_model in _models(info.annotation):
+                _attribute_keys(sub_model, path + ".", selected, keys)
+
+
+class _TrackedList:
+    __slots__ = ("_items", "_path", "_response")
+
+    def __init__(self, items: List[Any], path: str, response: "_Response") -> None:
+        self._items = items
+        self._path = path
+        self._response = response
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return _TrackedList(self._items[index], self._path, self._response)
+        return self._response.wrap(self._items[index], self._path)
+
+    def __iter__(self) -> Iterator[Any]:
+        for item in self._items:
+            yield self._response.wrap(item, self._path)
+
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+
+_MAPPING_METHODS = frozenset(["get", "keys", "values", "items"])
+
+
+class _TrackedObject:
+    __slots__ = ("_data", "_path", "_response")
+
+    def __init__(self, data: Dict[str, Any], path: str, response: "_Response") -> None:
+        self._data = data
+        self._path = path
+        self._response = response
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        path = self._path + key
+        self._response.read(path)
+        return self._response.wrap(value, path + ".")
+
+    def __getattr__(self, name: str) -> Any:
+        attributes = self._response.profiler._keys.get(self._path, {})
+        key = attributes.get(name, name)
+        if key in self._data:
+            return self[key]
+
+        # mapping methods are looked up after fields, so fields named `items` or `values` are not shadowed
+        if name in _MAPPING_METHODS and name not in attributes:
+            return getattr(self, "_" + name)
+
+        raise AttributeError(name)
+
+    def _get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._data else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def _keys(self) -> Any:
+        return self._data.keys()
+
+    def _values(self) -> List[Any]:
+        return [self[key] for key in self._data]
+
+    def _items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self._data]
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+
+class _Response:
+    """Paths which were read in one response."""
+
+    __slots__ = ("profiler", "paths")
+
+    def __init__(self, profiler: "OverfetchProfiler") -> None:
+        self.profiler = profiler
+        self.paths: Set[str] = set()
+
+    def read(self, path: str) -> None:
+        if path not in self.paths:
+            self.paths.add(path)
+            self.profiler._count(path)
+
+    def wrap(self, value: Any, path: str) -> Any:
+        if isinstance(value, dict):
+            return _TrackedObject(value, path, self)
+        if isinstance(value, list):
+            return _TrackedList(value, path, self)
+        return value
+
+
+class OverfetchProfiler:
+    """A profiler of reads of selected fields in responses.
+
+    Example:
+
+        >>> class Friend(GraphQLQueryBaseModel):
+        ...     name: str
+        ...     height: float
+        ...
+        >>> class Hero(GraphQLQueryBaseModel):
+        ...     name: str
+        ...     friends: List[Friend]
+        ...
+        >>> profiler = OverfetchProfiler(Hero)
+        >>> responses = [{"name": "Luke", "friends": [{"name": "Han", "height": 1.8}]}, {"name": "Leia", "friends": []}]
+        >>> for data in responses:
+        ...     hero = profiler.wrap(data)
+        ...     print(hero.name, [friend.name for friend in hero.friends])
+        Luke ['Han']
+        Leia []
+        >>> profiler.report().exclude
+        ['friends.height']
+        >>> print(Field(name="hero", fields=Hero.graphql_fields(exclude=profiler.report().exclude)).render())
+        hero {
+          name
+          friends {
+            name
+          }
+        }
+
+    Args:
+        selection: A model, an operation (paths start with response keys of queries) or a selection set.
+    """
+
+    def __init__(self, selection: Union[Type[GraphQLQueryBaseModel], Operation, Sequence[_Selection]]) -> None:
+        paths: List[str] = []
+        self._keys: Dict[str, Dict[str, str]] = {}
+
+        if isinstance(selection, Operation):
+            fragments = {fragment.name: fragment for fragment in selection.fragments}
+            for query in selection.queries:
+                paths.append(query.alias or query.name)
+                _selection_paths(query.fields, (query.alias or query.name) + ".", fragments, paths)
+        elif inspect.isclass(selection) and issubclass(selection, GraphQLQueryBaseModel):
+            _selection_paths(selection.graphql_fields(), "", {}, paths)
+            _attribute_keys(selection, "", set(paths), self._keys)
+        else:
+            _selection_paths(selection, "", {}, paths)  # type: ignore
+
+        self._paths = list(dict.fromkeys(paths))
+        self._reads: Dict[str, int] = dict.fromkeys(self._paths, 0)
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def _count(self, path: str) -> None:
+        if path in self._reads:
+            with self._lock:
+                self._reads[path] += 1
+
+    def wrap(self, data: Any) -> Any:
+        """Return a read-only view of response data which records reads of fields."""
+        with self._lock:
+            self._requests += 1
+
+        return _Response(self).wrap(data, "")
+
+    def report(self) -> OverfetchReport:
+        """Return counts of reads of selected fields."""
+        with self._lock:
+            reads = dict(self._reads)
+            requests = self._requests
+
+        children: Dict[str, List[str]] = {}
+        for path in self._paths:
+            if "." in path:
+                children.setdefault(path.rpartition(".")[0], []).append(path)
+
+        # an object which was read keeps one field (a scalar one if possible), so it stays in the selection set
+        kept = {path for path in self._paths if reads[path] > 0}
+        for path in self._paths:
+            if path in kept and path in children and not any(child in kept for child in children[path]):
+                leaves = [child for child in children[path] if child not in children]
+                kept.add((leaves or children[path])[0])
+
+        unused = [path for path in self._paths if reads[path] == 0]
+        exclude: List[str] = []
+        for path in unused:
+            if path not in kept and not any(path.startswith(parent + ".") for parent in exclude):
+                exclude.append(path)
+
+        return OverfetchReport(requests=requests, reads=reads, unused=unused, exclude=exclude)
+
+    def reset(self) -> None:
+        """Forget all reads."""
+        with self._lock:
+            self._reads = dict.fromkeys(self._paths, 0)
+            self._requests = 0
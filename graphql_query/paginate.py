@@ -0,0 +1,297 @@
+"""Pagination over connections with a compiled operation.
+
+The operation is compiled once (see ``Operation.compile``) and every page only binds other values of the cursor
+or offset variables. ``paginate`` and ``apaginate`` walk relay-style cursor connections: the request of the next
+page is sent while the nodes of the current page are consumed. ``paginate_offsets`` and ``apaginate_offsets``
+request offset pages with bounded concurrency. Only a fixed number of pages is kept in memory.
+
+A connection is found in ``data`` by a path of response keys separated by dots. Its nodes are ``nodes``,
+``node`` of ``edges`` or the connection itself if it is a list; ``pageInfo { hasNextPage endCursor }`` is used
+for cursors.
+"""
+
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .compiled import CompiledOperation
+from .types import Operation
+
+__all__ = [
+    "paginate",
+    "apaginate",
+    "paginate_offsets",
+    "apaginate_offsets",
+]
+
+_Operation = Union[Operation, CompiledOperation]
+
+
+def _compile(operation: _Operation, names: Tuple[str, ...]) -> CompiledOperation:
+    compiled = operation.compile() if isinstance(operation, Operation) else operation
+
+    variables = {variable.name for variable in compiled.variables}
+    for name in names:
+        if name not in variables:
+            raise ValueError(f"The operation has no variable `${name}` for pagination.")
+
+    return compiled
+
+
+def _connection(response: Any, path: str) -> Any:
+    if isinstance(response, (bytes, str)):
+        response = json.loads(response)
+
+    value = response.get("data")
+    if value is None:
+        messages = "; ".join(error.get("message", "") for error in response.get("errors") or [])
+        raise ValueError(f"The response has no data: {messages or 'unknown error'}.")
+
+    for key in path.split("."):
+        if key == "":
+            continue
+        if not isinstance(value, dict) or key not in value:
+            raise ValueError(f"The response has no connection at `{path}`.")
+        value = value[key]
+
+    return value
+
+
+def _nodes(connection: Any) -> List[Any]:
+    if connection is None:
+        return []
+    if isinstance(connection, list):
+        return connection
+    if "nodes" in connection:
+        return connection["nodes"] or []
+    if "edges" in connection:
+        return [edge["node"] if isinstance(edge, dict) else edge for edge in connection["edges"] or []]
+
+    raise ValueError("A connection must have `nodes` or `edges`.")
+
+
+def _next_cursor(connection: Any) -> Optional[str]:
+    page_info = (connection or {}).get("pageInfo") or {}
+    if not page_info.get("hasNextPage"):
+        return None
+
+    cursor = page_info.get("endCursor")
+    if cursor is None:
+        raise ValueError("The next page has no cursor: `pageInfo.endCursor` is not selected or null.")
+
+    return cursor
+
+
+def paginate(
+    operation: _Operation,
+    send: Callable[[bytes], Any],
+    path: str,
+    variables: Optional[Mapping[str, Any]] = None,
+    cursor: str = "after",
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """Yield nodes of a cursor connection page by page.
+
+    Example:
+
+        >>> operation = Operation(
+        ...     variables=[Variable(name="after", type="String"), Variable(name="first", type="Int")],
+        ...     queries=[
+        ...         Query(
+        ...             name="users",
+        ...             arguments=[
+        ...                 Argument(name="after", value=Variable(name="after", type="String")),
+        ...                 Argument(name="first", value=Variable(name="first", type="Int")),
+        ...             ],
+        ...             fields=["nodes { login }", "pageInfo { hasNextPage endCursor }"],
+        ...         )
+        ...     ],
+        ... )
+        >>> def send(body: bytes) -> bytes:
+        ...     return session.post(url, data=body, headers={"Content-Type": "application/json"}).content
+        ...
+        >>> for user in paginate(operation, send, "users", {"first": 100}):
+        ...     print(user["login"])
+
+    Args:
+        operation: An operation or a compiled operation with the cursor variable.
+        send: A function which sends a request body and returns the response (bytes, str or decoded JSON).
+        path: The path of the connection in ``data``.
+        variables: Values of other variables and the cursor of the first page.
+        cursor: The name of the cursor variable.
+        prefetch: Send the request of the next page in a thread while nodes of the current page are consumed.
+
+    Raises:
+        ValueError: if the operation has no cursor variable or a response has no data or no connection.
+    """
+    compiled = _compile(operation, (cursor,))
+    values = dict(variables or {})
+    first = values.pop(cursor, None)
+
+    def fetch(after: Optional[str]) -> Any:
+        return _connection(send(compiled.bind(**values, **({} if after is None else {cursor: after}))), path)
+
+    if not prefetch:
+        connection = fetch(first)
+        while True:
+            after = _next_cursor(connection)
+            yield from _nodes(connection)
+            if after is None:
+                return
+            connection = fetch(after)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connection = fetch(first)
+        while True:
+            after = _next_cursor(connection)
+            following = executor.submit(fetch, after) if after is not None else None
+            try:
+                yield from _nodes(connection)
+            except BaseException:
+                if following is not None:
+                    following.cancel()
+                raise
+            if following is None:
+                return
+            connection = following.result()
+
+
+async def apaginate(
+    operation: _Operation,
+    send: Callable[[bytes], Awaitable[Any]],
+    path: str,
+    variables: Optional[Mapping[str, Any]] = None,
+    cursor: str = "after",
+) -> AsyncIterator[Any]:
+    """Yield nodes of a cursor connection, the next page is requested while the current one is consumed.
+
+    The arguments are the arguments of ``paginate``, ``send`` is a coroutine function.
+    """
+    compiled = _compile(operation, (cursor,))
+    values = dict(variables or {})
+    first = values.pop(cursor, None)
+
+    async def fetch(after: Optional[str]) -> Any:
+        return _connection(await send(compiled.bind(**values, **({} if after is None else {cursor: after}))), path)
+
+    connection = await fetch(first)
+    while True:
+        after = _next_cursor(connection)
+        following = asyncio.ensure_future(fetch(after)) if after is not None else None
+        try:
+            for node in _nodes(connection):
+                yield node
+        except BaseException:
+            if following is not None:
+                following.cancel()
+            raise
+        if following is None:
+            return
+        connection = await following
+
+
+def paginate_offsets(
+    operation: _Operation,
+    send: Callable[[bytes], Any],
+    path: str,
+    page_size: int,
+    variables: Optional[Mapping[str, Any]] = None,
+    offset: str = "offset",
+    limit: str = "limit",
+    concurrency: int = 4,
+) -> Iterator[Any]:
+    """Yield nodes of offset pages in order, up to ``concurrency`` pages are requested at once.
+
+    Pages are requested until a page has less than ``page_size`` nodes.
+
+    Args:
+        operation: An operation or a compiled operation with the offset and limit variables.
+        send: A function which sends a request body and returns the response (bytes, str or decoded JSON).
+        path: The path of the list or the connection in ``data``.
+        page_size: The value of the limit variable.
+        variables: Values of other variables.
+        offset: The name of the offset variable.
+        limit: The name of the limit variable.
+        concurrency: The maximal number of requested pages.
+    """
+    if page_size < 1 or concurrency < 1:
+        raise ValueError("page_size and concurrency must be positive.")
+
+    compiled = _compile(operation, (offset, limit))
+    values = {name: value for name, value in (variables or {}).items() if name not in (offset, limit)}
+
+    def fetch(start: int) -> List[Any]:
+        return _nodes(_connection(send(compiled.bind(**values, **{offset: start, limit: page_size})), path))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pages: Deque["Future[List[Any]]"] = deque()
+        start = 0
+        try:
+            while True:
+                while len(pages) < concurrency:
+                    pages.append(executor.submit(fetch, start))
+                    start += page_size
+
+                nodes = pages.popleft().result()
+                yield from nodes
+                if len(nodes) < page_size:
+                    return
+        finally:
+            for page in pages:
+                page.cancel()
+
+
+async def apaginate_offsets(
+    operation: _Operation,
+    send: Callable[[bytes], Awaitable[Any]],
+    path: str,
+    page_size: int,
+    variables: Optional[Mapping[str, Any]] = None,
+    offset: str = "offset",
+    limit: str = "limit",
+    concurrency: int = 4,
+) -> AsyncIterator[Any]:
+    """Yield nodes of offset pages in order, up to ``concurrency`` pages are requested at once.
+
+    The arguments are the arguments of ``paginate_offsets``, ``send`` is a coroutine function.
+    """
+    if page_size < 1 or concurrency < 1:
+        raise ValueError("page_size and concurrency must be positive.")
+
+    compiled = _compile(operation, (offset, limit))
+    values: Dict[str, Any] = {name: value for name, value in (variables or {}).items() if name not in (offset, limit)}
+
+    async def fetch(start: int) -> List[Any]:
+        return _nodes(_connection(await send(compiled.bind(**values, **{offset: start, limit: page_size})), path))
+
+    pages: Deque["asyncio.Future[List[Any]]"] = deque()
+    start = 0
+    try:
+        while True:
+            while len(pages) < concurrency:
+                pages.append(asyncio.ensure_future(fetch(start)))
+                start += page_size
+
+            nodes = await pages.popleft()
+            for node in nodes:
+                yield node
+            if len(nodes) < page_size:
+                return
+    finally:
+        for page in pages:
+            page.cancel()
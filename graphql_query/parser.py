@@ -0,0 +1,529 @@
+"""A parser of GraphQL documents into graphql_query node trees.
+
+The parser is a single pass over the document text: a lexer built on one compiled regular expression produces
+tokens on demand and a recursive descent parser builds ``Operation``, ``Query``, ``Field``, ``InlineFragment``,
+``Fragment``, ``Argument``, ``Directive`` and ``Variable`` nodes directly. It does not need graphql-core.
+
+Some GraphQL constructions have no counterpart in graphql_query and raise ``GraphQLParseError``: directives on
+operations, variable definitions, top-level fields, fragment spreads, inline fragments and fragment
+definitions; top-level fragment spreads and inline fragments; inline fragments without a type condition.
+
+Argument values are converted to the closest ``Argument.value`` type: numbers to ``int``/``float``, booleans to
+``bool``, objects to ``Argument``/``List[Argument]``, lists of scalars and objects to lists. Strings, enum values,
+``null`` and values without a matching type (for example, lists of enum values) are kept as GraphQL text.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .types import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+
+__all__ = [
+    "GraphQLParseError",
+    "parse",
+    "parse_operations",
+    "parse_fields",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment]
+
+_TOKEN = re.compile(
+    r"""
+    (?P<ignored>(?:[\s,\ufeff]+|\#[^\n\r]*)+)
+    |(?P<punctuator>\.\.\.|[!$&():=@\[\]{|}])
+    |(?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    |(?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+    |(?P<block_string>\"\"\"(?:\\\"\"\"|(?!\"\"\")[\s\S])*\"\"\")
+    |(?P<string>"(?:[^"\\\n\r]|\\.)*")
+    """,
+    re.VERBOSE,
+)
+
+_EOF = "<EOF>"
+_OPERATION_TYPES = ("query", "mutation", "subscription")
+
+
+class GraphQLParseError(ValueError):
+    """A syntax error in a GraphQL document or a construction which graphql_query can't represent."""
+
+    def __init__(self, message: str, source: str, position: int) -> None:
+        line = source.count("\n", 0, position) + 1
+        column = position - (source.rfind("\n", 0, position) + 1) + 1
+        super().__init__(f"{message} (line {line}, column {column}).")
+        self.line = line
+        self.column = column
+
+
+class _Value(NamedTuple):
+    """A parsed value: its kind, the best ``Argument.value`` for it and its GraphQL text."""
+
+    kind: str
+    value: Any
+    text: str
+
+
+class _Parser:
+    def __init__(self, source: str) -> None:
+        self._source = source
+        self._position = 0
+
+        # the current token
+        self._kind = _EOF
+        self._token = ""
+        self._start = 0
+
+        # variables of the current operation
+        self._variables: Dict[str, Variable] = {}
+        # variables of all operations for references from fragments
+        self._all_variables: Dict[str, Variable] = {}
+        # references to variables inside of fragments and fragment spreads which are resolved after parsing
+        self._variable_references: List[Variable] = []
+        self._spreads: List[Tuple[Fragment, int]] = []
+        self._fragments: Dict[str, Fragment] = {}
+
+        self._advance()
+
+    # lexer
+
+    def _advance(self) -> None:
+        source = self._source
+
+        while True:
+            match = _TOKEN.match(source, self._position)
+
+            if match is None:
+                if self._position >= len(source):
+                    self._kind, self._token, self._start = _EOF, "", self._position
+                    return
+                raise GraphQLParseError(f"Unexpected character {source[self._position]!r}", source, self._position)
+
+            self._position = match.end()
+            kind = match.lastgroup
+            if kind == "ignored":
+                continue
+
+            token = match.group()
+            if kind == "punctuator":
+                kind = token
+            elif kind == "number":
+                kind = "int" if token.lstrip("-").isdigit() else "float"
+            elif kind == "block_string":
+                kind = "string"
+
+            self._kind, self._token, self._start = kind, token, match.start()  # type: ignore[assignment]
+            return
+
+    def _error(self, message: str) -> GraphQLParseError:
+        return GraphQLParseError(message, self._source, self._start)
+
+    def _unexpected(self) -> GraphQLParseError:
+        if self._kind == _EOF:
+            return self._error("Unexpected end of the document")
+        return self._error(f"Unexpected {self._token!r}")
+
+    def _peek(self, kind: str) -> bool:
+        return self._kind == kind
+
+    def _skip(self, kind: str) -> bool:
+        if self._kind == kind:
+            self._advance()
+            return True
+        return False
+
+    def _expect(self, kind: str) -> str:
+        if self._kind != kind:
+            raise self._unexpected()
+
+        token = self._token
+        self._advance()
+        return token
+
+    def _expect_keyword(self, keyword: str) -> None:
+        if self._kind != "name" or self._token != keyword:
+            raise self._unexpected()
+        self._advance()
+
+    def _unsupported_directives(self, where: str) -> None:
+        if self._peek("@"):
+            raise self._error(f"Directives on {where} are not supported")
+
+    # document
+
+    def parse_document(self) -> List[Operation]:
+        operations: List[Operation] = []
+
+        while not self._peek(_EOF):
+            if self._peek("{") or (self._kind == "name" and self._token in _OPERATION_TYPES):
+                operations.append(self._parse_operation())
+            elif self._kind == "name" and self._token == "fragment":
+                self._parse_fragment_definition()
+            else:
+                raise self._unexpected()
+
+        self._resolve_references()
+
+        # every operation gets the fragments which it uses
+        for operation in operations:
+            operation.fragments = self._used_fragments(operation)
+
+        return operations
+
+    def parse_fields(self) -> List[_Selection]:
+        selections: List[_Selection] = []
+
+        while not self._peek(_EOF):
+            selections.append(self._parse_selection())
+
+        self._resolve_references()
+
+        return selections
+
+    def _parse_operation(self) -> Operation:
+        self._variables = {}
+
+        if self._peek("{"):
+            return Operation(type="query", queries=self._parse_queries())
+
+        operation_type = self._expect("name")
+        name = self._expect("name") if self._peek("name") else None
+
+        variables: List[Variable] = []
+        if self._skip("("):
+            while not self._skip(")"):
+                variables.append(self._parse_variable_definition())
+
+        self._unsupported_directives("operations")
+
+        return Operation(type=operation_type, name=name, variables=variables, queries=self._parse_queries())
+
+    def _parse_variable_definition(self) -> Variable:
+        self._expect("$")
+        name = self._expect("name")
+        self._expect(":")
+        type_ = self._parse_type()
+        default = self._parse_value(const=True).text if self._skip("=") else None
+        self._unsupported_directives("variable definitions")
+
+        variable = Variable(name=name, type=type_, default=default)
+        self._variables[name] = variable
+        self._all_variables.setdefault(name, variable)
+        return variable
+
+    def _parse_type(self) -> str:
+        if self._skip("["):
+            type_ = f"[{self._parse_type()}]"
+            self._expect("]")
+        else:
+            type_ = self._expect("name")
+
+        if self._skip("!"):
+            type_ += "!"
+
+        return type_
+
+    def _parse_fragment_definition(self) -> None:
+        self._variables = {}
+
+        self._expect_keyword("fragment")
+        start = self._start
+        name = self._expect("name")
+        if name == "on":
+            raise GraphQLParseError("Unexpected fragment name 'on'", self._source, start)
+        if name in self._fragments:
+            raise GraphQLParseError(f"Duplicate fragment {name!r}", self._source, start)
+
+        self._expect_keyword("on")
+        type_ = self._expect("name")
+        self._unsupported_directives("fragment definitions")
+
+        self._fragments[name] = Fragment(name=name, type=type_, fields=self._parse_selection_set())
+
+    # selections
+
+    def _parse_queries(self) -> List[Query]:
+        queries: List[Query] = []
+
+        self._expect("{")
+        while not self._skip("}"):
+            if not self._peek("name"):
+                raise self._error("Only fields are supported in the top-level selection set")
+
+            alias, name = self._parse_alias_and_name()
+            arguments = self._parse_arguments()
+            self._unsupported_directives("top-level fields")
+            fields = self._parse_selection_set() if self._peek("{") else []
+
+            queries.append(Query(name=name, alias=alias, arguments=arguments, fields=fields))
+
+        if len(queries) == 0:
+            raise self._error("Empty selection set")
+
+        return queries
+
+    def _parse_selection_set(self) -> List[_Selection]:
+        selections: List[_Selection] = []
+
+        self._expect("{")
+        while not self._skip("}"):
+            selections.append(self._parse_selection())
+
+        if len(selections) == 0:
+            raise self._error("Empty selection set")
+
+        return selections
+
+    def _parse_alias_and_name(self) -> Tuple[Optional[str], str]:
+        name = self._expect("name")
+        if self._skip(":"):
+            return name, self._expect("name")
+        return None, name
+
+    def _parse_selection(self) -> _Selection:
+        if self._skip("..."):
+            if self._kind == "name" and self._token == "on":
+                self._advance()
+                type_ = self._expect("name")
+                arguments = self._parse_arguments()
+                self._unsupported_directives("inline fragments")
+                return InlineFragment(type=type_, arguments=arguments, fields=self._parse_selection_set())
+
+            if not self._peek("name"):
+                raise self._error("Inline fragments without a type condition are not supported")
+
+            start = self._start
+            # a placeholder which gets the fragment definition after parsing
+            spread = Fragment(name=self._expect("name"), type="")
+            self._spreads.append((spread, start))
+            self._unsupported_directives("fragment spreads")
+            return spread
+
+        alias, name = self._parse_alias_and_name()
+        arguments = self._parse_arguments()
+
+        directives: List[Directive] = []
+        while self._skip("@"):
+            directives.append(Directive(name=self._expect("name"), arguments=self._parse_arguments()))
+
+        fields = self._parse_selection_set() if self._peek("{") else []
+
+        if alias is None and len(arguments) == 0 and len(directives) == 0 and len(fields) == 0:
+            return name
+
+        return Field(name=name, alias=alias, arguments=arguments, directives=directives, fields=fields)
+
+    # arguments and values
+
+    def _parse_arguments(self) -> List[Argument]:
+        arguments: List[Argument] = []
+
+        if self._skip("("):
+            while not self._skip(")"):
+                name = self._expect("name")
+                self._expect(":")
+                arguments.append(Argument(name=name, value=self._parse_value(const=False).value))
+
+            if len(arguments) == 0:
+                raise self._error("Empty arguments")
+
+        return arguments
+
+    def _parse_value(self, const: bool) -> _Value:
+        kind, token = self._kind, self._token
+
+        if kind == "int":
+            self._advance()
+            return _Value("int", int(token), token)
+
+        if kind == "float":
+            self._advance()
+            return _Value("float", float(token), token)
+
+        if kind == "string":
+            self._advance()
+            return _Value("string", token, token)
+
+        if kind == "name":
+            self._advance()
+            if token in ("true", "false"):
+                return _Value("bool", token == "true", token)
+            return _Value("enum", token, token)
+
+        if kind == "$" and not const:
+            self._advance()
+            name = self._expect("name")
+            return _Value("variable", self._variable_reference(name), f"${name}")
+
+        if kind == "[":
+            return self._parse_list(const)
+
+        if kind == "{":
+            return self._parse_object(const)
+
+        raise self._unexpected()
+
+    def _variable_reference(self, name: str) -> Variable:
+        variable = self._variables.get(name)
+        if variable is None:
+            # a variable inside of a fragment: the definition is taken from an operation after parsing
+            variable = Variable(name=name, type="")
+            self._variable_references.append(variable)
+
+        return variable
+
+    def _parse_list(self, const: bool) -> _Value:
+        self._expect("[")
+        items: List[_Value] = []
+        while not self._skip("]"):
+            items.append(self._parse_value(const))
+
+        text = "[" + ", ".join(item.text for item in items) + "]"
+        kinds = {item.kind for item in items}
+
+        value: Any = text
+        if len(items) == 0:
+            value = []
+        elif len(kinds) == 1:
+            kind = kinds.pop()
+            if kind in ("int", "float", "bool"):
+                value = [item.value for item in items]
+            elif kind == "string" and all(_is_simple_string(item.text) for item in items):
+                # `Argument` quotes items of a list of strings itself
+                value = [item.text[1:-1] for item in items]
+            elif kind == "object" and all(isinstance(item.value, list) for item in items):
+                value = [item.value for item in items]
+
+        return _Value("list", value, text)
+
+    def _parse_object(self, const: bool) -> _Value:
+        self._expect("{")
+        arguments: List[Argument] = []
+        texts: List[str] = []
+        while not self._skip("}"):
+            name = self._expect("name")
+            self._expect(":")
+            item = self._parse_value(const)
+            arguments.append(Argument(name=name, value=item.value))
+            texts.append(f"{name}: {item.text}")
+
+        text = "{" + ", ".join(texts) + "}"
+        # an empty list of arguments is rendered as an empty list
+        return _Value("object", arguments if len(arguments) > 0 else text, text)
+
+    # references
+
+    def _resolve_references(self) -> None:
+        for spread, start in self._spreads:
+            definition = self._fragments.get(spread.name)
+            if definition is None:
+                raise GraphQLParseError(f"Unknown fragment {spread.name!r}", self._source, start)
+
+            spread.type = definition.type
+            spread.fields = definition.fields
+            spread.typename = definition.typename
+
+        for reference in self._variable_references:
+            variable = self._all_variables.get(reference.name)
+            if variable is not None:
+                reference.type = variable.type
+                reference.default = variable.default
+
+    def _used_fragments(self, operation: Operation) -> List[Fragment]:
+        used: Dict[str, Fragment] = {}
+        stack: List[Any] = list(operation.queries)
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Fragment):
+                if node.name in used:
+                    continue
+                used[node.name] = self._fragments[node.name]
+            if isinstance(node, (Query, Field, InlineFragment, Fragment)):
+                stack.extend(node.fields)
+
+        # keep the order of definitions in the document
+        return [fragment for name, fragment in self._fragments.items() if name in used]
+
+
+def _is_simple_string(text: str) -> bool:
+    """Check that `Argument` renders the content of the string literal as the same literal."""
+    content = text[1:-1]
+    return not text.startswith('"""') and content == content.strip() and all(char not in content for char in ',"\\')
+
+
+def parse_operations(source: str) -> List[Operation]:
+    """Parse all operations of a GraphQL document.
+
+    Every operation gets the fragment definitions of the document which it uses.
+    """
+    return _Parser(source).parse_document()
+
+
+def parse_fields(
+    source: str, variables: Optional[Mapping[str, str]] = None, fragments: Optional[Iterable[Fragment]] = None
+) -> List[Union[str, Field, InlineFragment, Fragment]]:
+    """Parse the content of a selection set (without braces) into fields.
+
+    Example:
+
+        >>> fields = parse_fields("id friends(first: $first) { name }", {"first": "Int!"})
+        >>> print(Field(name="hero", fields=fields).render())
+        hero {
+          id
+          friends(
+            first: $first
+          ) {
+            name
+          }
+        }
+
+    Args:
+        source: The selection set.
+        variables: Types of variables which are referenced in the selection set, other variables get an empty type.
+        fragments: Definitions of fragments which are spread in the selection set.
+
+    Raises:
+        GraphQLParseError: if the selection set is not valid or spreads an unknown fragment.
+    """
+    parser = _Parser(source)
+    for name, type_ in (variables or {}).items():
+        parser._all_variables[name] = Variable(name=name, type=type_)
+    for fragment in fragments or ():
+        parser._fragments[fragment.name] = fragment
+
+    return parser.parse_fields()
+
+
+def parse(source: str) -> Operation:
+    """Parse a GraphQL document with one operation.
+
+    Example:
+
+        >>> operation = parse('''
+        ... query Hero($episode: Episode) {
+        ...   hero(episode: $episode) {
+        ...     name
+        ...   }
+        ... }
+        ... ''')
+        >>> operation.queries[0].fields.append(Field(name="friends", fields=["name"]))
+        >>> print(operation.render())
+        query Hero(
+          $episode: Episode
+        ) {
+          hero(
+            episode: $episode
+          ) {
+            name
+            friends {
+              name
+            }
+          }
+        }
+
+    """
+    operations = parse_operations(source)
+
+    if len(operations) != 1:
+        raise ValueError(f"Expected one operation in the document, got {len(operations)}.")
+
+    return operations[0]
@@ -0,0 +1,158 @@
+"""Static ``@skip``/``@include`` pruning for known variable values.
+
+When values of ``Boolean`` variables used in ``@skip(if: ...)`` and ``@include(if: ...)`` are known before
+the request, the pass evaluates these directives on the client:
+
+- fields excluded by a directive are removed with their subtrees;
+- directives which are trivially true are removed;
+- fragments which are not spread anymore and variables which are not used anymore are removed.
+
+A selection set which loses all its fields selects ``__typename`` instead, so the document stays valid: fragments
+get ``typename=True`` and fields and queries get the field ``__typename`` (they render ``typename`` only with other
+fields).
+"""
+
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from ._cache import _NodeCache
+from ._walk import _iter_nodes, _with_queries
+from .types import Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+
+__all__ = [
+    "prune_conditions",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment, Query]
+
+_CONDITIONAL_DIRECTIVES = ("include", "skip")
+
+
+def _condition(value: Any, variables: Mapping[str, Any]) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+
+    if isinstance(value, str) and value.strip() in ("true", "false"):
+        return value.strip() == "true"
+
+    if isinstance(value, Variable):
+        variable_value = variables.get(value.name)
+        if isinstance(variable_value, bool):
+            return variable_value
+
+    return None
+
+
+def _evaluate(directive: Directive, variables: Mapping[str, Any]) -> Optional[bool]:
+    """Return True if the directive keeps the field, False if it removes one and None if it is unknown."""
+    if directive.name not in _CONDITIONAL_DIRECTIVES:
+        return None
+
+    condition = None
+    for argument in directive.arguments:
+        if argument.name == "if":
+            condition = _condition(argument.value, variables)
+
+    if condition is None:
+        return None
+
+    return condition if directive.name == "include" else not condition
+
+
+def _prune_selections(selections: Sequence[_Selection], variables: Mapping[str, Any]) -> List[_Selection]:
+    pruned: List[_Selection] = []
+
+    for selection in selections:
+        if isinstance(selection, (Field, Query, InlineFragment)):
+            update: dict = {}
+
+            if isinstance(selection, Field) and len(selection.directives) > 0:
+                results = [(directive, _evaluate(directive, variables)) for directive in selection.directives]
+                if any(result is False for _, result in results):
+                    continue
+
+                update["directives"] = [directive for directive, result in results if result is None]
+
+            fields = _prune_selections(selection.fields, variables)
+            update["fields"] = fields
+            if len(selection.fields) > 0 and len(fields) == 0:
+                if isinstance(selection, InlineFragment):
+                    update["typename"] = True
+                else:
+                    # fields and queries render `typename` only with other fields
+                    update["fields"] = ["__typename"]
+                    update["typename"] = False
+
+            selection = selection.model_copy(update=update)
+
+        pruned.append(selection)
+
+    return pruned
+
+
+def _prune_operation(operation: Operation, variables: Mapping[str, Any]) -> Operation:
+    queries = _prune_selections(operation.queries, variables)
+    definitions: Dict[str, Fragment] = {}
+    for fragment in operation.fragments:
+        fields = _prune_selections(fragment.fields, variables)
+        typename = fragment.typename or (len(fragment.fields) > 0 and len(fields) == 0)
+        definitions[fragment.name] = fragment.model_copy(update={"fields": fields, "typename": typename})
+
+    return _with_queries(operation, queries, definitions)  # type: ignore[arg-type]
+
+
+def _condition_variables(operation: Operation) -> FrozenSet[str]:
+    names: Set[str] = set()
+    for root in [*operation.queries, *operation.fragments]:
+        for node in _iter_nodes(root):
+            if isinstance(node, Directive) and node.name in _CONDITIONAL_DIRECTIVES:
+                names.update(argument.value.name for argument in node.arguments if isinstance(argument.value, Variable))
+
+    return frozenset(names)
+
+
+_condition_variables_cache: _NodeCache[FrozenSet[str]] = _NodeCache()
+_pruned_cache: _NodeCache[Operation] = _NodeCache()
+
+
+def prune_conditions(operation: Operation, variables: Mapping[str, Any]) -> Operation:
+    """Remove subtrees excluded by ``@skip``/``@include`` for the given variable values.
+
+    Only boolean values of variables used in ``@skip``/``@include`` directives are taken into account.
+    The result is cached for the operation object and each distinct combination of these values,
+    so the operation must not be changed after the first call.
+
+    Example:
+
+        >>> with_friends = Variable(name="withFriends", type="Boolean!")
+        >>> operation = Operation(
+        ...     variables=[with_friends],
+        ...     queries=[
+        ...         Query(
+        ...             name="hero",
+        ...             fields=[
+        ...                 "name",
+        ...                 Field(
+        ...                     name="friends",
+        ...                     fields=["name"],
+        ...                     directives=[
+        ...                         Directive(name="include", arguments=[Argument(name="if", value=with_friends)])
+        ...                     ],
+        ...                 ),
+        ...             ],
+        ...         )
+        ...     ],
+        ... )
+        >>> print(prune_conditions(operation, {"withFriends": False}).render())
+        query {
+          hero {
+            name
+          }
+        }
+
+    """
+    names = _condition_variables_cache.get(operation, lambda: _condition_variables(operation))
+    key: Tuple[Tuple[str, bool], ...] = tuple(
+        sorted((name, variables[name]) for name in names if isinstance(variables.get(name), bool))
+    )
+
+    return _pruned_cache.get(operation, lambda: _prune_operation(operation, dict(key)), key)
@@ -0,0 +1,131 @@
+"""Rendering of many nodes at once.
+
+Rendering is thread-safe: jinja templates are immutable after loading, and the caches of the package
+(``_NodeCache``, lazy templates, encoders and decoders) are guarded by locks only while a new value is stored, so
+threads don't wait for each other on the hot path. On free-threaded builds of Python threads render in parallel;
+with the GIL, a process pool gives parallelism.
+
+Nodes are sent to worker processes in the compact form of ``graphql_query.compact``, which is smaller and faster to
+pickle than pydantic objects. ``render_bulk`` doesn't send nodes at all: workers build them by a factory from
+inputs and only inputs and documents cross process boundaries.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from .compact import from_compact, to_compact
+from .types import _GraphQL2PythonQuery
+
+__all__ = [
+    "render_many",
+    "render_bulk",
+]
+
+_Node = TypeVar("_Node", bound=_GraphQL2PythonQuery)
+
+
+def _render_chunk(nodes: List[_GraphQL2PythonQuery]) -> List[str]:
+    return [node.render() for node in nodes]
+
+
+def _to_task(node: _GraphQL2PythonQuery) -> Union[tuple, _GraphQL2PythonQuery]:
+    try:
+        return to_compact(node)
+    except ValueError:  # subclasses of nodes are pickled as they are
+        return node
+
+
+def _render_task(task: Union[tuple, _GraphQL2PythonQuery]) -> str:
+    return (from_compact(task) if isinstance(task, tuple) else task).render()
+
+
+def _render_inputs(factory: Callable[[Any], _GraphQL2PythonQuery], inputs: List[Any]) -> List[str]:
+    return [factory(value).render() for value in inputs]
+
+
+def render_many(nodes: Iterable[_Node], executor: Optional[Executor] = None, chunk_size: int = 64) -> List[str]:
+    """Render nodes, for example operations, and return the results in the order of the nodes.
+
+    Example:
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> operations = [Operation(queries=[Query(name="user", alias=f"user{i}", fields=["id"])]) for i in range(3)]
+        >>> with ThreadPoolExecutor(max_workers=2) as executor:
+        ...     documents = render_many(operations, executor)
+        >>> documents == [operation.render() for operation in operations]
+        True
+
+    Args:
+        nodes: Nodes to render.
+        executor: A thread or process pool; nodes are rendered in the current thread without an executor.
+        chunk_size: The number of nodes in a task of the executor. Nodes are pickled for a process pool, so bigger
+            chunks amortize the cost of a task.
+    """
+    items: List[_GraphQL2PythonQuery] = list(nodes)
+
+    if executor is None:
+        return _render_chunk(items)
+
+    if isinstance(executor, ProcessPoolExecutor):
+        tasks = [_to_task(node) for node in items]
+        return list(executor.map(_render_task, tasks, chunksize=max(1, chunk_size)))
+
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), max(1, chunk_size))]
+    return [document for documents in executor.map(_render_chunk, chunks) for document in documents]
+
+
+def render_bulk(
+    factory: Callable[[Any], _GraphQL2PythonQuery],
+    inputs: Iterable[Any],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+    max_pending: Optional[int] = None,
+) -> Iterator[str]:
+    """Build nodes by ``factory(input)`` in worker processes and yield the rendered documents in the order of inputs.
+
+    Inputs are read lazily and at most ``max_pending`` chunks are in flight, so millions of documents are generated
+    with bounded memory. The factory and inputs must be picklable (a factory is a function of a module).
+
+    Example:
+
+        >>> def user_operation(login: str) -> Operation:
+        ...     return Operation(queries=[Query(name="user", arguments=[Argument(name="login", value=f'"{login}"')])])
+        ...
+        >>> for document in render_bulk(user_operation, (f"user{i}" for i in range(1_000_000))):
+        ...     file.write(document)
+
+    Args:
+        factory: A function which returns a node for an input.
+        inputs: Inputs of the factory.
+        executor: A process pool; a new ``ProcessPoolExecutor`` is used and shut down without it.
+        chunk_size: The number of inputs in a task of a worker.
+        max_pending: The maximal number of chunks in flight, two per CPU by default.
+    """
+    if chunk_size < 1 or (max_pending is not None and max_pending < 1):
+        raise ValueError("chunk_size and max_pending must be positive.")
+
+    pool = ProcessPoolExecutor() if executor is None else executor
+    limit = max_pending or 2 * (os.cpu_count() or 1)
+    values = iter(inputs)
+    chunks: Deque["Future[List[str]]"] = deque()
+
+    try:
+        while True:
+            while len(chunks) < limit:
+                chunk = list(itertools.islice(values, chunk_size))
+                if len(chunk) == 0:
+                    break
+                chunks.append(pool.submit(_render_inputs, factory, chunk))
+
+            if len(chunks) == 0:
+                return
+
+            yield from chunks.popleft().result()
+    finally:
+        for future in chunks:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
@@ -0,0 +1,797 @@
+"""Schema-aware validation of operations against a local schema.
+
+A schema is loaded from SDL or from an introspection result (JSON) into plain dict indexes:
+
+- ``kinds``: type name -> type kind (``SCALAR``, ``OBJECT``, ``INTERFACE``, ``UNION``, ``ENUM``, ``INPUT_OBJECT``);
+- ``fields``: type name -> field name -> ``SchemaField`` (the field type and its arguments);
+- ``input_fields``: input type name -> field name -> ``SchemaArgument``;
+- ``enum_values``: enum type name -> values;
+- ``possible_types``: interface or union name -> object types;
+- ``directives``: directive name -> argument name -> ``SchemaArgument``.
+
+``Schema.validate`` checks an operation in one traversal of the tree with dict lookups for every node and reports
+every error with the path of the node. SDL is parsed with the lexer of ``graphql_query.parser``, so graphql-core is
+not needed.
+
+Parsing of a large schema takes a noticeable time on every process start, so ``Schema.load`` can keep the indexes
+in a binary cache file: a fixed header (magic, format version, sha256 digest of the schema source) and the pickled
+indexes. The cache is used only if the digest matches the current source, otherwise it is rebuilt.
+"""
+
+import functools
+import gc
+import hashlib
+import json
+import os
+import pickle
+import re
+import struct
+import sys
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Union
+
+from ._files import _atomic_write
+from .parser import _EOF, GraphQLParseError, _Parser, parse_fields
+from .types import Argument, Directive, Field, Fragment, InlineFragment, Operation, Variable
+
+__all__ = [
+    "SchemaArgument",
+    "SchemaField",
+    "ValidationError",
+    "Schema",
+    "load_schema",
+]
+
+_Selection = Union[str, Field, InlineFragment, Fragment]
+
+_CACHE_MAGIC = b"GQLSCHEM"
+_CACHE_VERSION = 1
+
+# magic, format version, sha256 digest of the schema source
+_CACHE_HEADER = struct.Struct("<8sI32s")
+
+_NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+_INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLOAT = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+
+_BUILTIN_SCALARS = ("Int", "Float", "String", "Boolean", "ID")
+_COMPOSITE_KINDS = ("OBJECT", "INTERFACE", "UNION")
+_INPUT_KINDS = ("SCALAR", "ENUM", "INPUT_OBJECT")
+
+# value kinds which every built-in scalar accepts
+_SCALAR_VALUE_KINDS = {
+    "Int": ("int",),
+    "Float": ("int", "float"),
+    "String": ("string",),
+    "Boolean": ("bool",),
+    "ID": ("string", "int"),
+}
+
+
+class SchemaArgument(NamedTuple):
+    """An argument of a field or a directive or a field of an input type."""
+
+    type: str
+    has_default: bool = False
+
+
+class SchemaField(NamedTuple):
+    """A field of an object or interface type."""
+
+    type: str
+    arguments: Dict[str, SchemaArgument]
+
+
+class ValidationError(NamedTuple):
+    """An error found by ``Schema.validate``.
+
+    Attributes:
+        path: A path of the node: response keys separated by dots, ``... on Type`` for inline fragments,
+            ``fragment Name`` for fragment definitions and ``$name`` for variables.
+        message: The error description.
+    """
+
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_argument(type_: str, has_default: bool) -> SchemaArgument:
+    # equal arguments are shared by all fields, so the binary cache stores every distinct argument once
+    return SchemaArgument(type=sys.intern(type_), has_default=has_default)
+
+
+def _named_type(type_: str) -> str:
+    return type_.strip("[]!")
+
+
+def _types_compatible(variable_type: str, location_type: str) -> bool:
+    if location_type.endswith("!"):
+        if not variable_type.endswith("!"):
+            return False
+        return _types_compatible(variable_type[:-1], location_type[:-1])
+
+    if variable_type.endswith("!"):
+        return _types_compatible(variable_type[:-1], location_type)
+
+    if location_type.startswith("["):
+        return variable_type.startswith("[") and _types_compatible(variable_type[1:-1], location_type[1:-1])
+
+    return variable_type == location_type
+
+
+def _value_kind(value: Any) -> str:
+    """Return a kind of a GraphQL value for `Argument.value`."""
+    if isinstance(value, Variable):
+        return "variable"
+
+    if isinstance(value, bool):
+        return "bool"
+
+    if isinstance(value, int):
+        return "int"
+
+    if isinstance(value, float):
+        return "float"
+
+    if isinstance(value, Argument):
+        return "object"
+
+    if isinstance(value, list):
+        if len(value) > 0 and Argument._check_is_list_of_arguments(value):
+            return "object"
+        return "list"
+
+    text = value.strip()
+
+    if text == "null":
+        return "null"
+
+    if text in ("true", "false"):
+        return "bool"
+
+    if text.startswith('"'):
+        return "string"
+
+    if _INT.fullmatch(text):
+        return "int"
+
+    if _FLOAT.fullmatch(text):
+        return "float"
+
+    if _NAME.fullmatch(text):
+        return "enum"
+
+    # a raw list or object which is not checked
+    return "raw"
+
+
+def _list_items(value: Any) -> List[Any]:
+    if isinstance(value, list) and len(value) > 0 and Argument._check_is_list_of_str(value):
+        return Argument._clean_list_of_str(value)
+
+    return value
+
+
+def _object_fields(value: Any) -> List[Argument]:
+    return [value] if isinstance(value, Argument) else value
+
+
+class _SchemaParser(_Parser):
+    """A parser of the type system part of GraphQL documents (SDL)."""
+
+    def __init__(self, source: str) -> None:
+        super().__init__(source)
+
+        self.root_types: Dict[str, str] = {}
+        self.kinds: Dict[str, str] = {name: "SCALAR" for name in _BUILTIN_SCALARS}
+        self.fields: Dict[str, Dict[str, SchemaField]] = {}
+        self.input_fields: Dict[str, Dict[str, SchemaArgument]] = {}
+        self.enum_values: Dict[str, Set[str]] = {}
+        self.interfaces: Dict[str, Set[str]] = {}
+        self.union_members: Dict[str, Set[str]] = {}
+        self.directives: Dict[str, Dict[str, SchemaArgument]] = {}
+
+    def _skip_keyword(self, keyword: str) -> bool:
+        if self._kind == "name" and self._token == keyword:
+            self._advance()
+            return True
+        return False
+
+    def _skip_description(self) -> None:
+        self._skip("string")
+
+    def _skip_directives(self) -> None:
+        while self._skip("@"):
+            self._expect("name")
+            if self._skip("("):
+                while not self._skip(")"):
+                    self._expect("name")
+                    self._expect(":")
+                    self._parse_value(const=True)
+
+    def _parse_input_values(self, closing: str) -> Dict[str, SchemaArgument]:
+        values: Dict[str, SchemaArgument] = {}
+        while not self._skip(closing):
+            self._skip_description()
+            name = self._expect("name")
+            self._expect(":")
+            type_ = self._parse_type()
+            has_default = self._skip("=")
+            if has_default:
+                self._parse_value(const=True)
+            self._skip_directives()
+            values[sys.intern(name)] = _schema_argument(type_, has_default)
+
+        return values
+
+    def _parse_fields(self) -> Dict[str, SchemaField]:
+        fields: Dict[str, SchemaField] = {}
+        if self._skip("{"):
+            while not self._skip("}"):
+                self._skip_description()
+                name = self._expect("name")
+                arguments = self._parse_input_values(")") if self._skip("(") else {}
+                self._expect(":")
+                type_ = self._parse_type()
+                self._skip_directives()
+                fields[sys.intern(name)] = SchemaField(type=sys.intern(type_), arguments=arguments)
+
+        return fields
+
+    def _parse_names(self, separator: str) -> List[str]:
+        self._skip(separator)
+        names = [self._expect("name")]
+        while self._skip(separator):
+            names.append(self._expect("name"))
+        return names
+
+    def parse_schema(self) -> None:
+        while not self._peek(_EOF):
+            self._skip_description()
+            self._skip_keyword("extend")
+            keyword = self._expect("name")
+
+            if keyword == "schema":
+                self._skip_directives()
+                if self._skip("{"):
+                    while not self._skip("}"):
+                        operation = self._expect("name")
+                        self._expect(":")
+                        self.root_types[operation] = self._expect("name")
+
+            elif keyword == "directive":
+                self._expect("@")
+                name = self._expect("name")
+                self.directives[name] = self._parse_input_values(")") if self._skip("(") else {}
+                self._skip_keyword("repeatable")
+                self._expect_keyword("on")
+                self._parse_names("|")
+
+            elif keyword in ("scalar", "type", "interface", "union", "enum", "input"):
+                self._parse_type_definition(keyword)
+
+            else:
+                raise self._error(f"Unexpected {keyword!r}")
+
+    def _parse_type_definition(self, keyword: str) -> None:
+        name = self._expect("name")
+
+        if keyword == "scalar":
+            self.kinds[name] = "SCALAR"
+            self._skip_directives()
+
+        elif keyword in ("type", "interface"):
+            self.kinds[name] = "OBJECT" if keyword == "type" else "INTERFACE"
+            if self._skip_keyword("implements"):
+                self.interfaces.setdefault(name, set()).update(self._parse_names("&"))
+            self._skip_directives()
+            self.fields.setdefault(name, {}).update(self._parse_fields())
+
+        elif keyword == "union":
+            self.kinds[name] = "UNION"
+            self._skip_directives()
+            members = self.union_members.setdefault(name, set())
+            if self._skip("="):
+                members.update(self._parse_names("|"))
+
+        elif keyword == "enum":
+            self.kinds[name] = "ENUM"
+            self._skip_directives()
+            values = self.enum_values.setdefault(name, set())
+            if self._skip("{"):
+                while not self._skip("}"):
+                    self._skip_description()
+                    values.add(self._expect("name"))
+                    self._skip_directives()
+
+        else:
+            self.kinds[name] = "INPUT_OBJECT"
+            self._skip_directives()
+            values_ = self._parse_input_values("}") if self._skip("{") else {}
+            self.input_fields.setdefault(name, {}).update(values_)
+
+
+def _introspection_type(ref: Dict[str, Any]) -> str:
+    if ref["kind"] == "NON_NULL":
+        return _introspection_type(ref["ofType"]) + "!"
+
+    if ref["kind"] == "LIST":
+        return "[" + _introspection_type(ref["ofType"]) + "]"
+
+    return ref["name"]
+
+
+def _introspection_arguments(values: Optional[List[Dict[str, Any]]]) -> Dict[str, SchemaArgument]:
+    return {
+        sys.intern(value["name"]): _schema_argument(
+            _introspection_type(value["type"]), value.get("defaultValue") is not None
+        )
+        for value in values or []
+    }
+
+
+class _ValidationContext:
+    def __init__(self, operation: Operation) -> None:
+        self.errors: List[ValidationError] = []
+        self.variables: Dict[str, Variable] = {variable.name: variable for variable in operation.variables}
+        self.fragments: Dict[str, Fragment] = {fragment.name: fragment for fragment in operation.fragments}
+
+    def error(self, path: str, message: str) -> None:
+        self.errors.append(ValidationError(path=path, message=message))
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+class Schema:
+    """An indexed GraphQL schema.
+
+    Example:
+
+        >>> schema = Schema.from_sdl('''
+        ... type Query {
+        ...   hero(episode: Episode): Character
+        ... }
+        ... enum Episode { NEWHOPE EMPIRE JEDI }
+        ... type Character { name: String! }
+        ... ''')
+        >>> operation = Operation(
+        ...     queries=[Query(name="hero", arguments=[Argument(name="episode", value="JEDI")], fields=["nam"])]
+        ... )
+        >>> [str(error) for error in schema.validate(operation)]
+        ["hero.nam: Cannot query field 'nam' on type 'Character'."]
+
+    """
+
+    def __init__(
+        self,
+        root_types: Dict[str, str],
+        kinds: Dict[str, str],
+        fields: Dict[str, Dict[str, SchemaField]],
+        input_fields: Dict[str, Dict[str, SchemaArgument]],
+        enum_values: Dict[str, FrozenSet[str]],
+        possible_types: Dict[str, FrozenSet[str]],
+        directives: Dict[str, Dict[str, SchemaArgument]],
+    ) -> None:
+        self.root_types = root_types
+        self.kinds = kinds
+        self.fields = fields
+        self.input_fields = input_fields
+        self.enum_values = enum_values
+        self.possible_types = possible_types
+        self.directives = {
+            "include": {"if": SchemaArgument(type="Boolean!")},
+            "skip": {"if": SchemaArgument(type="Boolean!")},
+            "deprecated": {"reason": SchemaArgument(type="String", has_default=True)},
+            "specifiedBy": {"url": SchemaArgument(type="String!")},
+            **directives,
+        }
+
+    # loading
+
+    @classmethod
+    def from_sdl(cls, source: str) -> "Schema":
+        """Load a schema from SDL."""
+        parser = _SchemaParser(source)
+        parser.parse_schema()
+
+        root_types = parser.root_types
+        if len(root_types) == 0:
+            root_types = {
+                operation: name
+                for operation, name in (("query", "Query"), ("mutation", "Mutation"), ("subscription", "Subscription"))
+                if name in parser.kinds
+            }
+
+        possible_types: Dict[str, Set[str]] = {name: set(members) for name, members in parser.union_members.items()}
+        for name, interfaces in parser.interfaces.items():
+            if parser.kinds.get(name) == "OBJECT":
+                for interface in interfaces:
+                    possible_types.setdefault(interface, set()).add(name)
+
+        return cls(
+            root_types=root_types,
+            kinds=parser.kinds,
+            fields=parser.fields,
+            input_fields=parser.input_fields,
+            enum_values={name: frozenset(values) for name, values in parser.enum_values.items()},
+            possible_types={name: frozenset(types) for name, types in possible_types.items()},
+            directives=parser.directives,
+        )
+
+    @classmethod
+    def from_introspection(cls, data: Dict[str, Any]) -> "Schema":
+        """Load a schema from an introspection result (with or without the top-level ``data`` key)."""
+        schema = data.get("data", data)["__schema"]
+
+        root_types = {
+            operation: schema[key]["name"]
+            for operation, key in (
+                ("query", "queryType"),
+                ("mutation", "mutationType"),
+                ("subscription", "subscriptionType"),
+            )
+            if schema.get(key)
+        }
+
+        kinds: Dict[str, str] = {name: "SCALAR" for name in _BUILTIN_SCALARS}
+        fields: Dict[str, Dict[str, SchemaField]] = {}
+        input_fields: Dict[str, Dict[str, SchemaArgument]] = {}
+        enum_values: Dict[str, FrozenSet[str]] = {}
+        possible_types: Dict[str, FrozenSet[str]] = {}
+
+        for type_ in schema["types"]:
+            name = type_["name"]
+            kinds[name] = type_["kind"]
+
+            if type_.get("fields") is not None:
+                fields[name] = {
+                    sys.intern(field["name"]): SchemaField(
+                        type=sys.intern(_introspection_type(field["type"])),
+                        arguments=_introspection_arguments(field.get("args")),
+                    )
+                    for field in type_["fields"]
+                }
+
+            if type_.get("inputFields") is not None:
+                input_fields[name] = _introspection_arguments(type_["inputFields"])
+
+            if type_.get("enumValues") is not None:
+                enum_values[name] = frozenset(value["name"] for value in type_["enumValues"])
+
+            if type_.get("possibleTypes") is not None:
+                possible_types[name] = frozenset(possible["name"] for possible in type_["possibleTypes"])
+
+        directives = {
+            directive["name"]: _introspection_arguments(directive.get("args"))
+            for directive in schema.get("directives") or []
+        }
+
+        return cls(
+            root_types=root_types,
+            kinds=kinds,
+            fields=fields,
+            input_fields=input_fields,
+            enum_values=enum_values,
+            possible_types=possible_types,
+            directives=directives,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        cache_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> "Schema":
+        """Load a schema from a local file: ``*.json`` files are introspection results, other files are SDL.
+
+        Args:
+            path: A path of the schema file.
+            cache_path: A path of the binary cache file. If the cache is missing or was built from another version
+                of the schema file, the schema is parsed and the cache is written again.
+        """
+        with open(path, "rb") as file:
+            source = file.read()
+
+        digest = hashlib.sha256(source).digest()
+        if cache_path is not None:
+            schema = cls.read_cache(cache_path, digest)
+            if schema is not None:
+                return schema
+
+        text = source.decode("utf-8")
+        if os.fspath(path).endswith(".json"):
+            schema = cls.from_introspection(json.loads(text))
+        else:
+            schema = cls.from_sdl(text)
+
+        if cache_path is not None:
+            schema.write_cache(cache_path, digest)
+
+        return schema
+
+    # binary cache
+
+    def write_cache(self, path: Union[str, "os.PathLike[str]"], digest: bytes) -> None:
+        """Write the schema indexes to a binary cache file; the file is replaced atomically.
+
+        Args:
+            path: A path of the cache file.
+            digest: The sha256 digest of the schema source.
+        """
+        with _atomic_write(path) as file:
+            file.write(_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, digest))
+            pickle.dump(self.__dict__, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def read_cache(cls, path: Union[str, "os.PathLike[str]"], digest: bytes) -> Optional["Schema"]:
+        """Read the schema from a binary cache file.
+
+        The cache file is unpickled, so it must come from a trusted place (it is written by ``write_cache``).
+
+        Args:
+            path: A path of the cache file.
+            digest: The sha256 digest of the current schema source.
+
+        Returns:
+            The schema or None if the file is missing, has another format version or was built from another source.
+        """
+        try:
+            with open(path, "rb") as file:
+                header = file.read(_CACHE_HEADER.size)
+                expected = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, digest)
+                if header != expected:
+                    return None
+
+                # the cache holds a lot of small objects, the garbage collector passes while loading them are useless
+                gc_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    state = pickle.load(file)
+                finally:
+                    if gc_enabled:
+                        gc.enable()
+        except Exception:  # a missing, broken or stale file (classes of another version) is a cache miss
+            return None
+
+        if not isinstance(state, dict):
+            return None
+
+        schema = cls.__new__(cls)
+        schema.__dict__.update(state)
+        return schema
+
+    # validation
+
+    def validate(self, operation: Operation) -> List[ValidationError]:
+        """Validate the operation and return all found errors."""
+        context = _ValidationContext(operation)
+
+        for variable in operation.variables:
+            path = f"${variable.name}"
+            named = _named_type(variable.type)
+            if self.kinds.get(named) not in _INPUT_KINDS:
+                context.error(path, f"Variable '${variable.name}' has unknown or non-input type '{variable.type}'.")
+            elif variable.default is not None:
+                self._check_value(variable.default, variable.type, path, context)
+
+        root_type = self.root_types.get(operation.type)
+        if root_type is None:
+            context.error("", f"The schema does not support '{operation.type}' operations.")
+        else:
+            self._check_selection_set(root_type, operation.queries, "", context)
+
+        for fragment in operation.fragments:
+            path = f"fragment {fragment.name}"
+            if self.kinds.get(fragment.type) not in _COMPOSITE_KINDS:
+                context.error(path, f"Fragment '{fragment.name}' has unknown or non-composite type '{fragment.type}'.")
+            else:
+                self._check_selection_set(fragment.type, fragment.fields, path, context)
+
+        return context.errors
+
+    def _is_possible(self, parent_type: str, type_: str) -> bool:
+        if parent_type == type_:
+            return True
+
+        parent_types = self.possible_types.get(parent_type, frozenset((parent_type,)))
+        types = self.possible_types.get(type_, frozenset((type_,)))
+        return len(parent_types & types) > 0
+
+    def _check_selection_set(
+        self,
+        parent_type: str,
+        selections: List[Any],
+        path: str,
+        context: _ValidationContext,
+    ) -> None:
+        for selection in selections:
+            if isinstance(selection, str):
+                name = selection.strip()
+                if _NAME.fullmatch(name):
+                    self._check_field(parent_type, name, None, [], [], [], False, path, context)
+                    continue
+
+                # a raw GraphQL text in the selection set is checked as the fields which it describes
+                try:
+                    fields = parse_fields(name, fragments=context.fragments.values())
+                except GraphQLParseError as error:
+                    context.error(path, f"Invalid selection '{name}': {error}")
+                    continue
+                self._check_selection_set(parent_type, fields, path, context)
+
+            elif isinstance(selection, Fragment):
+                definition = context.fragments.get(selection.name)
+                if definition is None:
+                    context.error(path, f"Unknown fragment '{selection.name}'.")
+                elif not self._is_possible(parent_type, definition.type):
+                    context.error(
+                        path,
+                        f"Fragment '{selection.name}' can't be spread here: "
+                        f"'{definition.type}' is not '{parent_type}'.",
+                    )
+
+            elif isinstance(selection, InlineFragment):
+                fragment_path = _join(path, f"... on {selection.type}")
+                if len(selection.arguments) > 0:
+                    context.error(fragment_path, "Inline fragments can't have arguments.")
+
+                if self.kinds.get(selection.type) not in _COMPOSITE_KINDS:
+                    context.error(fragment_path, f"Unknown or non-composite type '{selection.type}'.")
+                elif not self._is_possible(parent_type, selection.type):
+                    context.error(fragment_path, f"Type '{selection.type}' is not possible for '{parent_type}'.")
+                else:
+                    self._check_selection_set(selection.type, selection.fields, fragment_path, context)
+
+            else:
+                self._check_field(
+                    parent_type,
+                    selection.name,
+                    selection.alias,
+                    selection.arguments,
+                    selection.directives if isinstance(selection, Field) else [],
+                    selection.fields,
+                    selection.typename,
+                    path,
+                    context,
+                )
+
+    def _check_field(
+        self,
+        parent_type: str,
+        name: str,
+        alias: Optional[str],
+        arguments: List[Argument],
+        directives: List[Directive],
+        fields: List[_Selection],
+        typename: bool,
+        path: str,
+        context: _ValidationContext,
+    ) -> None:
+        field_path = _join(path, alias or name)
+
+        for directive in directives:
+            self._check_directive(directive, field_path, context)
+
+        if name == "__typename":
+            return
+
+        if name in ("__schema", "__type") and parent_type == self.root_types.get("query"):
+            # introspection queries are not checked
+            return
+
+        schema_field = self.fields.get(parent_type, {}).get(name)
+        if schema_field is None:
+            context.error(field_path, f"Cannot query field '{name}' on type '{parent_type}'.")
+            return
+
+        self._check_arguments(arguments, schema_field.arguments, field_path, f"field '{parent_type}.{name}'", context)
+
+        field_type = _named_type(schema_field.type)
+        if self.kinds.get(field_type) in _COMPOSITE_KINDS:
+            if len(fields) == 0 and not typename:
+                context.error(
+                    field_path, f"Field '{name}' of type '{schema_field.type}' must have a selection of subfields."
+                )
+            else:
+                self._check_selection_set(field_type, fields, field_path, context)
+
+        elif len(fields) > 0 or typename:
+            context.error(field_path, f"Field '{name}' of type '{schema_field.type}' must not have a selection.")
+
+    def _check_directive(self, directive: Directive, path: str, context: _ValidationContext) -> None:
+        definition = self.directives.get(directive.name)
+        if definition is None:
+            context.error(path, f"Unknown directive '@{directive.name}'.")
+            return
+
+        self._check_arguments(directive.arguments, definition, path, f"directive '@{directive.name}'", context)
+
+    def _check_arguments(
+        self,
+        arguments: List[Argument],
+        definitions: Dict[str, SchemaArgument],
+        path: str,
+        owner: str,
+        context: _ValidationContext,
+    ) -> None:
+        names = set()
+        for argument in arguments:
+            names.add(argument.name)
+            definition = definitions.get(argument.name)
+            if definition is None:
+                context.error(path, f"Unknown argument '{argument.name}' on {owner}.")
+            else:
+                # fields of input objects extend the path of the argument: "field(argument.name)"
+                argument_path = f"{path[:-1]}.{argument.name})" if path.endswith(")") else f"{path}({argument.name})"
+                self._check_value(argument.value, definition.type, argument_path, context)
+
+        for name, definition in definitions.items():
+            if definition.type.endswith("!") and not definition.has_default and name not in names:
+                context.error(path, f"Argument '{name}' of type '{definition.type}' is required on {owner}.")
+
+    def _check_value(self, value: Any, type_: str, path: str, context: _ValidationContext) -> None:
+        kind = _value_kind(value)
+
+        if kind == "variable":
+            variable = context.variables.get(value.name)
+            if variable is None:
+                context.error(path, f"Variable '${value.name}' is not defined.")
+                return
+
+            variable_type = (
+                variable.type + "!" if variable.default is not None and type_.endswith("!") else variable.type
+            )
+            if not _types_compatible(variable_type.replace(" ", ""), type_):
+                context.error(path, f"Variable '${value.name}' of type '{variable.type}' can't be used as '{type_}'.")
+            return
+
+        if kind == "raw":
+            return
+
+        if kind == "null":
+            if type_.endswith("!"):
+                context.error(path, f"Expected a non-null value of type '{type_}'.")
+            return
+
+        if type_.endswith("!"):
+            type_ = type_[:-1]
+
+        if type_.startswith("["):
+            items = _list_items(value) if kind == "list" else [value]
+            for item in items:
+                self._check_value(item, type_[1:-1], path, context)
+            return
+
+        type_kind = self.kinds.get(type_)
+
+        if type_kind == "INPUT_OBJECT":
+            if kind != "object":
+                context.error(path, f"Expected an object of type '{type_}'.")
+                return
+
+            definitions = self.input_fields.get(type_, {})
+            self._check_arguments(_object_fields(value), definitions, path, f"input type '{type_}'", context)
+
+        elif type_kind == "ENUM":
+            if kind != "enum" or value.strip() not in self.enum_values.get(type_, frozenset()):
+                context.error(path, f"Expected a value of enum '{type_}'.")
+
+        elif type_ in _SCALAR_VALUE_KINDS:
+            if kind not in _SCALAR_VALUE_KINDS[type_]:
+                context.error(path, f"Expected a value of type '{type_}'.")
+
+        elif type_kind is None:
+            context.error(path, f"Unknown type '{type_}'.")
+
+
+def load_schema(
+    path: Union[str, "os.PathLike[str]"],
+    cache_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+) -> Schema:
+    """Load a schema from a local SDL or introspection JSON file, see ``Schema.load``."""
+    return Schema.load(path, cache_path)
@@ -0,0 +1,185 @@
+"""Cost-based splitting of operations and merging of partial responses.
+
+``split_operation`` partitions the queries of an operation into several operations which fit a cost budget. A query
+which doesn't fit alone is split deeper: its copies get parts of its selection set, recursively down to the fields
+which fit. Every part gets only the variables and fragments which it uses. Only ``query`` operations are split,
+they are read-only, so the parts are independent and can be sent concurrently.
+
+``merge_responses`` merges ``data`` of the responses to the parts into one result: objects are merged by keys
+and lists (which are copies of the same field) are merged item by item.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from ._walk import _with_queries
+from .complexity import analyze_complexity
+from .types import Field, Fragment, InlineFragment, Operation, Query
+
+__all__ = [
+    "split_operation",
+    "merge_responses",
+]
+
+_Node = Union[Query, Field, InlineFragment]
+_Selection = Union[str, Field, InlineFragment, Fragment]
+
+
+def _default_cost(operation: Operation) -> float:
+    return analyze_complexity(operation).cost
+
+
+class _Splitter:
+    def __init__(self, operation: Operation, max_cost: float, cost: Callable[[Operation], float], deep: bool) -> None:
+        self.operation = operation
+        self.max_cost = max_cost
+        self.cost = cost
+        self.deep = deep
+        self.definitions = {fragment.name: fragment for fragment in operation.fragments}
+
+    def part(self, queries: List[Query]) -> Operation:
+        return _with_queries(self.operation, queries, self.definitions)
+
+    def fits(self, queries: List[Query]) -> bool:
+        return self.cost(self.part(queries)) <= self.max_cost
+
+    def split_node(self, node: _Node, wrap: Callable[[_Node], Query]) -> List[_Node]:
+        """Return copies of the node with parts of its selection set, every copy fits the cost when it is wrapped."""
+        if not self.deep or self.fits([wrap(node)]):
+            return [node]
+
+        if len(node.fields) < 2 and not self._has_children(node):
+            return [node]
+
+        pieces: List[_Selection] = []
+        for child in node.fields:
+            if isinstance(child, (Field, InlineFragment)) and len(child.fields) > 0:
+                pieces.extend(
+                    self.split_node(
+                        child, lambda piece: wrap(node.model_copy(update={"fields": [piece]}))  # type: ignore
+                    )
+                )
+            else:
+                pieces.append(child)
+
+        copies: List[_Node] = []
+        current: List[_Selection] = []
+        for piece in pieces:
+            if len(current) > 0 and not self.fits([wrap(node.model_copy(update={"fields": [*current, piece]}))]):
+                copies.append(node.model_copy(update={"fields": current}))
+                current = []
+            current.append(piece)
+        copies.append(node.model_copy(update={"fields": current}))
+
+        return copies
+
+    @staticmethod
+    def _has_children(node: _Node) -> bool:
+        return any(isinstance(child, (Field, InlineFragment)) and len(child.fields) > 0 for child in node.fields)
+
+    def split(self) -> List[Operation]:
+        units: List[Query] = []
+        for query in self.operation.queries:
+            units.extend(self.split_node(query, lambda node: node))  # type: ignore
+
+        parts: List[List[Query]] = []
+        current: List[Query] = []
+        for unit in units:
+            if not self.fits([unit]):
+                raise ValueError(
+                    f"The query `{unit.alias or unit.name}` can't be split to fit the cost {self.max_cost}."
+                )
+
+            if len(current) > 0 and not self.fits([*current, unit]):
+                parts.append(current)
+                current = []
+            current.append(unit)
+
+        if len(current) > 0:
+            parts.append(current)
+
+        return [self.part(queries) for queries in parts]
+
+
+def split_operation(
+    operation: Operation,
+    max_cost: float,
+    cost: Optional[Callable[[Operation], float]] = None,
+    deep: bool = True,
+) -> List[Operation]:
+    """Split the operation into operations which cost at most ``max_cost``.
+
+    Example:
+
+        >>> operation = Operation(
+        ...     queries=[
+        ...         Query(name="hero", fields=["name", Field(name="friends", fields=["name"])]),
+        ...         Query(name="droids", fields=["name", "primaryFunction"]),
+        ...     ]
+        ... )
+        >>> for part in split_operation(operation, max_cost=4):
+        ...     print(part.render())
+        query {
+          hero {
+            name
+            friends {
+              name
+            }
+          }
+        }
+        query {
+          droids {
+            name
+            primaryFunction
+          }
+        }
+
+    Args:
+        operation: A query operation.
+        max_cost: The maximal cost of every part.
+        cost: A cost function of operations, ``analyze_complexity(operation).cost`` by default.
+        deep: Split selection sets of queries which don't fit alone. Lists inside of split selection sets are
+            merged item by item, so the server must return them in the same order for every part.
+
+    Returns:
+        Operations which keep the order of queries; the operation itself if it fits.
+    """
+    if operation.type != "query":
+        raise ValueError(f"Only query operations can be split, got `{operation.type}`.")
+
+    cost = cost or _default_cost
+    if cost(operation) <= max_cost:
+        return [operation]
+
+    return _Splitter(operation, max_cost, cost, deep).split()
+
+
+def _merge(left: Any, right: Any) -> Any:
+    if isinstance(left, dict) and isinstance(right, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+
+    if isinstance(left, list) and isinstance(right, list):
+        if len(left) != len(right):
+            raise ValueError("Lists of partial responses have different lengths.")
+        return [_merge(left_item, right_item) for left_item, right_item in zip(left, right)]
+
+    return left if right is None else right
+
+
+def merge_responses(responses: Iterable[Optional[Mapping[str, Any]]]) -> Dict[str, Any]:
+    """Merge ``data`` of the responses to parts of a split operation into one result.
+
+    Example:
+
+        >>> merge_responses([{"hero": {"name": "R2-D2"}}, {"hero": {"friends": []}, "droids": []}])
+        {'hero': {'name': 'R2-D2', 'friends': []}, 'droids': []}
+
+    """
+    result: Dict[str, Any] = {}
+    for data in responses:
+        if data is not None:
+            result = _merge(result, dict(data))
+
+    return result
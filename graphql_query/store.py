@@ -0,0 +1,188 @@
+"""A compact on-disk store of persisted GraphQL documents.
+
+The store file has three sections:
+
+- a fixed header (magic, format version, number of documents);
+- an index of fixed-size records ``(sha256 digest, blob offset, blob length)`` sorted by digest;
+- a blob with all documents as UTF-8 text.
+
+A reader maps the file with ``mmap`` and never loads it as a whole, so opening a store is O(1), lookup by hash
+is a binary search over the index and all forked workers share the same pages of the page cache.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, Optional, Union
+
+from ._files import _atomic_write
+from .types import Operation
+
+__all__ = [
+    "document_hash",
+    "DocumentStore",
+    "DocumentStoreWriter",
+]
+
+_MAGIC = b"GQLSTORE"
+_VERSION = 1
+
+# magic, format version, number of documents
+_HEADER = struct.Struct("<8sII")
+# sha256 digest, offset of a document in the blob, length of the document
+_RECORD = struct.Struct("<32sQI")
+
+_DIGEST_SIZE = 32
+
+
+def document_hash(document: str) -> str:
+    """Return the sha256 hex digest of a document text (the same hash as Apollo persisted queries use)."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def _to_digest(key: Union[str, bytes]) -> bytes:
+    if isinstance(key, bytes):
+        digest = key
+    else:
+        try:
+            digest = bytes.fromhex(key)
+        except ValueError as error:
+            raise KeyError(key) from error
+
+    if len(digest) != _DIGEST_SIZE:
+        raise KeyError(key)
+
+    return digest
+
+
+class DocumentStoreWriter:
+    """A builder of a document store file.
+
+    Example:
+
+        >>> writer = DocumentStoreWriter()
+        >>> key = writer.add(Operation(queries=[Query(name="hero", fields=["name"])]))
+        >>> writer.write("documents.gqlstore")
+
+    """
+
+    def __init__(self) -> None:
+        self._documents: Dict[bytes, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, document: Union[str, Operation]) -> str:
+        """Add a rendered operation (or an already rendered document) and return its hash."""
+        text = document.render() if isinstance(document, Operation) else document
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).digest()
+        self._documents[digest] = data
+        return digest.hex()
+
+    def write(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write the store to ``path``; the file is replaced atomically."""
+        digests = sorted(self._documents)
+
+        index = bytearray()
+        offset = 0
+        for digest in digests:
+            length = len(self._documents[digest])
+            index += _RECORD.pack(digest, offset, length)
+            offset += length
+
+        with _atomic_write(path) as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, len(digests)))
+            file.write(index)
+            for digest in digests:
+                file.write(self._documents[digest])
+
+
+class DocumentStore:
+    """A read-only document store mapped to memory.
+
+    Example:
+
+        >>> with DocumentStore("documents.gqlstore") as store:
+        ...     document = store.get("2ba6e1cf5f1a0a1a...")
+
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        with open(path, "rb") as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{os.fspath(path)!r} is not a document store.")
+
+        magic, version, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"{os.fspath(path)!r} is not a document store.")
+        if version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"Unsupported document store version {version}.")
+
+        self._count: int = count
+        self._blob_start: int = _HEADER.size + count * _RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (str, bytes)):
+            return False
+
+        try:
+            return self._find(_to_digest(key)) >= 0
+        except KeyError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._digest_at(i).hex()
+
+    def __getitem__(self, key: Union[str, bytes]) -> str:
+        position = self._find(_to_digest(key))
+        if position < 0:
+            raise KeyError(key)
+
+        _, offset, length = _RECORD.unpack_from(self._mm, _HEADER.size + position * _RECORD.size)
+        start = self._blob_start + offset
+        return self._mm[start : start + length].decode("utf-8")
+
+    def __enter__(self) -> "DocumentStore":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def get(self, key: Union[str, bytes], default: Optional[str] = None) -> Optional[str]:
+        """Return a document by its hash or ``default`` if there is no such document."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _digest_at(self, position: int) -> bytes:
+        start = _HEADER.size + position * _RECORD.size
+        return self._mm[start : start + _DIGEST_SIZE]
+
+    def _find(self, digest: bytes) -> int:
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            current = self._digest_at(middle)
+            if current < digest:
+                low = middle + 1
+            elif current > digest:
+                high = middle - 1
+            else:
+                return middle
+
+        return -1
@@ -1,7 +1,16 @@
+"""Jinja templates of nodes.
+
+Templates are loaded and compiled on the first render, and jinja2 itself is imported then, so ``import
+graphql_query`` doesn't pay for them.
+"""
+
 import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, Template
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
 
 __all__ = [
     "_template_key_value",
@@ -23,19 +32,64 @@ __all__ = [
 # templates setting for render of classes
 TEMPLATES_FOLDER = Path(os.path.join(os.path.dirname(__file__), "templates/"))
 
-template_env = Environment(loader=FileSystemLoader(searchpath=TEMPLATES_FOLDER))
-
-
-_template_key_value: Template = template_env.get_template("argument_key_value.jinja2")
-_template_key_values: Template = template_env.get_template("argument_key_values.jinja2")
-_template_key_argument: Template = template_env.get_template("argument_key_argument.jinja2")
-_template_key_variable: Template = template_env.get_template("argument_key_variable.jinja2")
-_template_key_arguments: Template = template_env.get_template("argument_key_arguments.jinja2")
-_template_key_objects: Template = template_env.get_template("argument_key_objects.jinja2")
-_template_directive: Template = template_env.get_template("directive.jinja2")
-_template_variable: Template = template_env.get_template("variable.jinja2")
-_template_operation: Template = template_env.get_template("operation.jinja2")
-_template_query: Template = template_env.get_template("query.jinja2")
-_template_fragment: Template = template_env.get_template("fragment.jinja2")
-_template_inline_fragment: Template = template_env.get_template("inline_fragment.jinja2")
-_template_field: Template = template_env.get_template("field.jinja2")
+_lock = threading.Lock()
+_template_env: Optional["Environment"] = None
+
+
+def _get_template_env() -> "Environment":
+    global _template_env
+
+    if _template_env is None:
+        from jinja2 import Environment, FileSystemLoader
+
+        with _lock:
+            if _template_env is None:
+                _template_env = Environment(loader=FileSystemLoader(searchpath=TEMPLATES_FOLDER))
+
+    return _template_env
+
+
+def __getattr__(name: str) -> Any:
+    # `template_env` is created on the first access
+    if name == "template_env":
+        return _get_template_env()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyTemplate:
+    """A template which is loaded on the first render."""
+
+    __slots__ = ("name", "_template")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._template: Optional["Template"] = None
+
+    @property
+    def template(self) -> "Template":
+        if self._template is None:
+            template = _get_template_env().get_template(self.name)
+            with _lock:
+                if self._template is None:
+                    self._template = template
+
+        return self._template
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        return (self._template or self.template).render(*args, **kwargs)
+
+
+_template_key_value = _LazyTemplate("argument_key_value.jinja2")
+_template_key_values = _LazyTemplate("argument_key_values.jinja2")
+_template_key_argument = _LazyTemplate("argument_key_argument.jinja2")
+_template_key_variable = _LazyTemplate("argument_key_variable.jinja2")
+_template_key_arguments = _LazyTemplate("argument_key_arguments.jinja2")
+_template_key_objects = _LazyTemplate("argument_key_objects.jinja2")
+_template_directive = _LazyTemplate("directive.jinja2")
+_template_variable = _LazyTemplate("variable.jinja2")
+_template_operation = _LazyTemplate("operation.jinja2")
+_template_query = _LazyTemplate("query.jinja2")
+_template_fragment = _LazyTemplate("fragment.jinja2")
+_template_inline_fragment = _LazyTemplate("inline_fragment.jinja2")
+_template_field = _LazyTemplate("field.jinja2")
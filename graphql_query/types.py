@@ -1,5 +1,5 @@
 import sys
-from typing import Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import Field as PydanticField
@@ -21,6 +21,12 @@ from .templates import (
     _template_variable,
 )
 
+if TYPE_CHECKING:
+    from graphql.language import DocumentNode
+
+    from .compiled import CompiledOperation
+    from .schema import Schema
+
 if sys.version_info >= (3, 10):
     from typing import TypeGuard
 else:
@@ -44,6 +50,8 @@ class _GraphQL2PythonQuery(PydanticBaseModel):
 
     model_config = PydanticConfigDict(
         arbitrary_types_allowed=True,
+        # validators are built on the first validation, not on import
+        defer_build=True,
     )
 
     @staticmethod
@@ -216,7 +224,7 @@ class Argument(_GraphQL2PythonQuery):
         return _template_key_value.render(name=name, value=str(value))
 
     @staticmethod
-    def _render_for_list_str(name: str, value: List[str]) -> str:
+    def _clean_list_of_str(value: List[str]) -> List[str]:
         clean_list = []
         for item in value:
             result = item.replace('"', '').split(',')
@@ -226,7 +234,11 @@ class Argument(_GraphQL2PythonQuery):
             else:
                 clean_list.append(result)
 
-        return _template_key_values.render(name=name, values=[f'''\"{v.replace('"', '')}\"''' for v in clean_list])
+        return [f'''\"{v.replace('"', '')}\"''' for v in clean_list]
+
+    @staticmethod
+    def _render_for_list_str(name: str, value: List[str]) -> str:
+        return _template_key_values.render(name=name, values=Argument._clean_list_of_str(value))
 
     @staticmethod
     def _render_for_list_int(name: str, value: List[int]) -> str:
@@ -645,3 +657,23 @@ class Operation(_GraphQL2PythonQuery):
             queries=[self._line_shift(query.render()) for query in self.queries],
             fragments=[fragment.render() for fragment in self.fragments],
         )
+
+    def to_document_node(self, cached: bool = False) -> 'DocumentNode':
+        """Build a graphql-core ``DocumentNode`` for the operation without rendering and parsing of the text.
+
+        It needs the optional dependency graphql-core. With ``cached=True`` the result is cached for the operation
+        object, so the operation must not be changed after the first call.
+        """
+        from .document_node import cached_document_node, to_document_node
+
+        return cached_document_node(self) if cached else to_document_node(self)
+
+    def compile(self, schema: Optional['Schema'] = None) -> 'CompiledOperation':
+        """Render the operation once and return an immutable ``CompiledOperation``.
+
+        The compiled operation doesn't follow changes of the operation made after the call. With a ``schema``,
+        values of enum and input types are checked against it.
+        """
+        from .compiled import CompiledOperation
+
+        return CompiledOperation(self, schema)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from graphql_query import Argument, Operation, Query, Variable
+from graphql_query.batch import AsyncBatcher, batch_body, split_batch_response
+from graphql_query.body import request_body
+
+var_id = Variable(name="id", type="ID!")
+
+operation = Operation(
+    name="User",
+    variables=[var_id],
+    queries=[Query(name="user", arguments=[Argument(name="id", value=var_id)], fields=["id"])],
+)
+
+
+def _resolve(request: Dict[str, Any]) -> Dict[str, Any]:
+    if request.get("operationName") != "User":
+        return {"errors": [{"message": "Unknown operation"}]}
+    return {"data": {"user": {"id": request["variables"]["id"]}}}
+
+
+async def _serve(batches: List[int]) -> asyncio.AbstractServer:
+    """A local stand-in GraphQL server which answers batched POST requests."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        headers = await reader.readuntil(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":")[1]) for line in headers.split(b"\r\n") if line.lower().startswith(b"content-length")
+        )
+        requests = json.loads(await reader.readexactly(length))
+        batches.append(len(requests))
+
+        body = json.dumps([_resolve(request) for request in requests]).encode("utf-8")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _post(port: int, body: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"POST /graphql HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.split(b"\r\n\r\n", 1)[1]
+
+
+def test_batch_body():
+    body = batch_body([(operation, {"id": 1}), (operation.compile(), {"id": "2"}), Operation(queries=[])])
+
+    assert json.loads(body) == [
+        json.loads(request_body(operation, {"id": 1})),
+        json.loads(request_body(operation, {"id": 2})),
+        {"query": "query {}", "variables": {}},
+    ]
+
+
+def test_split_batch_response():
+    assert split_batch_response(b'[{"data": {"a": 1}}, {"errors": []}]', 2) == [{"data": {"a": 1}}, {"errors": []}]
+
+    with pytest.raises(ValueError):
+        split_batch_response(b'[{"data": {"a": 1}}]', 2)
+
+    with pytest.raises(ValueError):
+        split_batch_response(b'{"data": {"a": 1}}', 1)
+
+
+def test_async_batcher():
+    async def main() -> None:
+        batches: List[int] = []
+        server = await _serve(batches)
+        port = server.sockets[0].getsockname()[1]
+
+        async with AsyncBatcher(lambda body: _post(port, body), max_size=4, max_wait=0.01) as batcher:
+            results = await asyncio.gather(*[batcher.execute(operation, {"id": i}) for i in range(10)])
+            unknown = await batcher.execute(Operation(name="Other", queries=[]))
+
+        server.close()
+        await server.wait_closed()
+
+        assert results == [{"data": {"user": {"id": str(i)}}} for i in range(10)]
+        assert unknown == {"errors": [{"message": "Unknown operation"}]}
+        # two full batches, the rest after max_wait and the last request alone
+        assert batches == [4, 4, 2, 1]
+
+    asyncio.run(main())
+
+
+def test_async_batcher_errors():
+    async def main() -> None:
+        async def fail(body: bytes) -> bytes:
+            raise ConnectionError("the server is down")
+
+        batcher = AsyncBatcher(fail, max_size=2)
+
+        with pytest.raises(ConnectionError):
+            await asyncio.gather(batcher.execute(operation, {"id": 1}), batcher.execute(operation, {"id": 2}))
+
+        with pytest.raises(ValueError):
+            await batcher.execute(operation, {"id": None})
+
+        async def short(body: bytes) -> bytes:
+            return b"[]"
+
+        with pytest.raises(ValueError):
+            await AsyncBatcher(short).execute(operation, {"id": 1})
+
+    asyncio.run(main())
+
+
+def test_async_batcher_cancelled():
+    async def main() -> None:
+        started = asyncio.Event()
+
+        async def hang(body: bytes) -> bytes:
+            started.set()
+            await asyncio.Event().wait()
+            return b"[]"  # pragma: no cover
+
+        batcher = AsyncBatcher(hang, max_size=2)
+        requests = asyncio.gather(
+            batcher.execute(operation, {"id": 1}), batcher.execute(operation, {"id": 2}), return_exceptions=True
+        )
+        await started.wait()
+
+        for task in list(batcher._tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(requests, timeout=1)
+        assert [type(result) for result in results] == [asyncio.CancelledError, asyncio.CancelledError]
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query import body
+from graphql_query.body import _body_segments, request_body
+
+var_login = Variable(name="login", type="String!")
+
+
+def _operation() -> Operation:
+    return Operation(
+        name="User",
+        variables=[var_login],
+        queries=[
+            Query(
+                name="user",
+                arguments=[Argument(name="login", value=var_login)],
+                fields=["name", Field(name="bio", alias="описание")],
+            )
+        ],
+    )
+
+
+def test_request_body():
+    operation = _operation()
+
+    assert json.loads(request_body(operation, {"login": "denisart"})) == {
+        "query": operation.render(),
+        "variables": {"login": "denisart"},
+        "operationName": "User",
+    }
+    assert json.loads(request_body(Operation(queries=[Query(name="viewer", fields=["login"])]))) == {
+        "query": "query {\n  viewer {\n    login\n  }\n}",
+        "variables": {},
+    }
+    assert request_body(operation.compile(), {"login": "denisart"}) == request_body(operation, {"login": "denisart"})
+
+    with pytest.raises(ValueError):
+        request_body(operation, {"login": None})
+
+
+def test_document_is_encoded_once(monkeypatch):
+    operation = _operation()
+    calls = []
+
+    def body_segments(*args):
+        calls.append(args)
+        return _body_segments(*args)
+
+    monkeypatch.setattr(body, "_body_segments", body_segments)
+
+    bodies = {request_body(operation, {"login": login}) for login in ["a", "b", "a"]}
+
+    assert len(bodies) == 2
+    assert len(calls) == 1
+
+
+def test_stdlib_fallback():
+    value = {"query": "query {\n  user {\n    описание: bio\n  }\n}", "variables": {"n": 1.5, "ok": True, "x": None}}
+
+    assert json.loads(body._json_dumps(value)) == value
+
+    pytest.importorskip("orjson")
+    assert json.loads(body._orjson_dumps(value)) == value
@@ -0,0 +1,179 @@
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.canonical import canonical_hash, canonical_render, canonicalize
+
+
+def test_order_of_fields_and_arguments():
+    op_1 = Operation(
+        name="First",
+        queries=[
+            Query(
+                name="human",
+                arguments=[Argument(name="id", value='"1000"'), Argument(name="unit", value="FOOT")],
+                fields=["name", Field(name="friends", fields=["name", "id"])],
+            )
+        ],
+    )
+    op_2 = Operation(
+        name="Second",
+        queries=[
+            Query(
+                name="human",
+                arguments=[Argument(name="unit", value="FOOT"), Argument(name="id", value='"1000"')],
+                fields=[Field(name="friends", fields=["id", "name"]), "name"],
+            )
+        ],
+    )
+
+    assert canonical_render(op_1) == 'query{human(id:"1000",unit:FOOT){friends{id name} name}}'
+    assert canonical_render(op_1) == canonical_render(op_2)
+    assert canonical_hash(op_1) == canonical_hash(op_2)
+
+
+def test_duplicate_selections_are_merged():
+    operation = Operation(
+        queries=[
+            Query(name="hero", fields=[Field(name="friends", fields=["name"]), "name"]),
+            Query(name="hero", fields=[Field(name="friends", fields=["id", "name"])], typename=True),
+        ]
+    )
+
+    assert canonical_render(operation) == "query{hero{__typename friends{id name} name}}"
+
+
+def test_aliases_and_typename():
+    operation = Operation(
+        queries=[
+            Query(
+                name="hero",
+                fields=[
+                    Field(name="hero", alias="hero"),
+                    Field(name="hero", alias="other"),
+                    "__typename",
+                    InlineFragment(type="Droid", fields=["primaryFunction"], typename=True),
+                ],
+                typename=True,
+            ),
+        ]
+    )
+
+    assert (
+        canonical_render(operation) == "query{hero{...on Droid{__typename primaryFunction} __typename hero other:hero}}"
+    )
+
+
+def test_values_and_directives():
+    var_with_friends = Variable(name="withFriends", type="Boolean!")
+    var_ep = Variable(name="ep", type="Episode", default="JEDI")
+    operation = Operation(
+        variables=[var_with_friends, var_ep],
+        queries=[
+            Query(
+                name="hero",
+                arguments=[
+                    Argument(name="episode", value=var_ep),
+                    Argument(name="ids", value=[3, 1, 2]),
+                    Argument(name="names", value=["b", "a"]),
+                    Argument(
+                        name="filter",
+                        value=[Argument(name="b", value=True), Argument(name="a", value=Argument(name="c", value=1.5))],
+                    ),
+                    Argument(name="objects", value=[[Argument(name="y", value=1), Argument(name="x", value=2)]]),
+                ],
+                fields=[
+                    Field(
+                        name="friends",
+                        directives=[
+                            Directive(name="include", arguments=[Argument(name="if", value=var_with_friends)]),
+                            Directive(name="cached"),
+                        ],
+                        fields=["name"],
+                    )
+                ],
+            )
+        ],
+    )
+
+    assert canonical_render(operation) == (
+        "query($ep:Episode=JEDI,$withFriends:Boolean!)"
+        '{hero(episode:$ep,filter:{a:{c:1.5},b:true},ids:[3,1,2],names:["b","a"],objects:[{x:2,y:1}])'
+        "{friends@include(if:$withFriends)@cached{name}}}"
+    )
+
+
+def test_fragments():
+    fragment = Fragment(name="comparisonFields", type="Character", fields=["name", "appearsIn"])
+    other = Fragment(name="a", type="Character", fields=["id"])
+    operation = Operation(
+        queries=[
+            Query(name="hero", alias="left", fields=[fragment, fragment]),
+            Query(name="hero", alias="right", fields=[other]),
+        ],
+        fragments=[fragment, other],
+    )
+
+    assert canonical_render(operation) == (
+        "query{left:hero{...comparisonFields} right:hero{...a}}"
+        " fragment a on Character{id} fragment comparisonFields on Character{appearsIn name}"
+    )
+
+
+def test_result_is_cached():
+    operation = Operation(queries=[Query(name="hero", fields=["name"])])
+
+    assert canonicalize(operation) is canonicalize(operation)
+    assert canonicalize(operation).hash == canonical_hash(operation)
+
+
+def test_string_selections_equal_field_nodes():
+    strings = Operation(
+        queries=[Query(name="hero", fields=["title: name", "friends(first: 2) { name }", "...Ref", "id"])],
+    )
+    nodes = Operation(
+        queries=[
+            Query(
+                name="hero",
+                fields=[
+                    Field(name="name", alias="title"),
+                    Field(name="friends", arguments=[Argument(name="first", value=2)], fields=["name"]),
+                    Fragment(name="Ref", type="Character", fields=["id"]),
+                    "id",
+                ],
+            )
+        ],
+    )
+
+    assert (
+        canonical_render(strings)
+        == canonical_render(nodes)
+        == ("query{hero{...Ref friends(first:2){name} id title:name}}")
+    )
+    assert canonical_render(Operation(queries=[Query(name="hero", fields=["name: name"])])) == "query{hero{name}}"
+
+
+def test_typename_without_fields_is_not_selected():
+    operation = Operation(
+        queries=[
+            Query(name="hero", fields=[Field(name="name", typename=True), InlineFragment(type="Droid", typename=True)]),
+            Query(name="viewer", typename=True),
+        ]
+    )
+
+    assert canonical_render(operation) == "query{hero{...on Droid{__typename} name} viewer}"
+
+
+def test_string_selections_with_fragments_and_unsupported_strings():
+    fragment = Fragment(name="F", type="Character", fields=["id"])
+    strings = Operation(queries=[Query(name="hero", fields=["friends { ...F name }"])], fragments=[fragment])
+    nodes = Operation(
+        queries=[Query(name="hero", fields=[Field(name="friends", fields=["name", fragment])])], fragments=[fragment]
+    )
+
+    assert (
+        canonical_render(strings)
+        == canonical_render(nodes)
+        == "query{hero{friends{...F name}}} fragment F on Character{id}"
+    )
+
+    # the parser doesn't support directives of inline fragments, the text is kept
+    raw = Operation(queries=[Query(name="hero", fields=[" ... on Droid @include(if: true) { id } "])])
+    assert canonical_render(raw) == "query{hero{... on Droid @include(if: true) { id }}}"
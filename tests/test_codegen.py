@@ -0,0 +1,203 @@
+import importlib
+import sys
+
+import pytest
+
+from graphql_query import Argument, Field, GraphQLQueryBaseModel, Query, Variable
+from graphql_query.codegen import generate_models, main, render_models
+from graphql_query.schema import Schema
+
+SDL = """
+type Query {
+  hero(episode: Episode): Character
+  search(text: String!): [SearchResult!]!
+}
+
+enum Episode { NEWHOPE EMPIRE JEDI }
+
+interface Character { id: ID! name: String! friends: [Character] }
+
+type Human implements Character {
+  id: ID!
+  name: String!
+  friends: [Character]
+  height(unit: LengthUnit!): Float
+  from: String
+  starships: [Starship!]!
+}
+
+type Droid implements Character { id: ID! name: String! friends: [Character] primaryFunction: String }
+type Starship { id: ID! length: Float coordinates: [[Float!]!] meta: JSON }
+
+union SearchResult = Human | Droid | Starship
+enum LengthUnit { METER FOOT }
+scalar JSON
+"""
+
+
+@pytest.fixture()
+def models(tmp_path):
+    generate_models(Schema.from_sdl(SDL), tmp_path / "starwars_models")
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module("starwars_models")
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [name for name in sys.modules if name.startswith("starwars_models")]:
+            del sys.modules[name]
+
+
+def test_rendered_module():
+    modules = render_models(Schema.from_sdl(SDL), max_depth=1)
+
+    assert sorted(modules) == [
+        "__init__.py",
+        "_base.py",
+        "character.py",
+        "droid.py",
+        "human.py",
+        "query.py",
+        "starship.py",
+    ]
+    assert '"Human": ("Character", "Starship"),' in modules["__init__.py"]
+
+    source = modules["human.py"]
+    assert (
+        '__graphql_selection__: ClassVar[str] = (\n        "id name friends { id name } height(unit: $height_unit) '
+        in source
+    )
+    assert "    id: str\n    name: str\n" in source
+    assert '    friends: Optional[List[Optional["Character"]]] = None\n' in source
+    assert '            "graphql_name": "from",\n            "graphql_alias": "from_",\n' in source
+    assert '    __graphql_variables__: ClassVar[Dict[str, str]] = {\n        "height_unit": "LengthUnit!",\n' in source
+    assert (
+        '"graphql_arguments": [Argument(name="unit", value=Variable(name="height_unit", type="LengthUnit!"))],\n'
+        in source
+    )
+    assert '    starships: Optional[List["Starship"]] = None\n' in source
+
+
+def test_lazy_import(models):
+    models.Human
+
+    assert "starwars_models.human" in sys.modules
+    assert "starwars_models.droid" not in sys.modules
+    assert "starwars_models.starship" not in sys.modules
+
+    with pytest.raises(AttributeError):
+        models.Planet
+
+
+def test_graphql_fields(models):
+    fields = models.Human.graphql_fields()
+
+    assert fields[:3] == [
+        "id",
+        "name",
+        Field(name="friends", fields=["id", "name"]),
+    ]
+    assert fields[3].arguments == [Argument(name="unit", value=Variable(name="height_unit", type="LengthUnit!"))]
+    assert fields[4] == Field(name="from", alias="from_")
+
+    assert Query(name="search", fields=models.Query.graphql_fields()[1].fields[:2]).render() == (
+        "search {\n"
+        "  __typename\n"
+        "  ... on Droid {\n"
+        "    id\n"
+        "    name\n"
+        "    friends {\n"
+        "      id\n"
+        "      name\n"
+        "    }\n"
+        "    primaryFunction\n"
+        "  }\n"
+        "}"
+    )
+
+    class Crew(GraphQLQueryBaseModel):
+        captain: models.Human
+        size: int
+
+    assert Crew.graphql_fields() == [Field(name="captain", fields=models.Human.graphql_fields()), Field(name="size")]
+
+
+def test_graphql_fields_of_subclass(models):
+    class Luke(models.Human):
+        pass
+
+    # without its own selection set the fields of the subclass are built from the pydantic fields
+    fields = Luke.graphql_fields()
+
+    assert Field(name="from", alias="from_") in fields
+    assert (
+        Field(name="height", arguments=[Argument(name="unit", value=Variable(name="height_unit", type="LengthUnit!"))])
+        in fields
+    )
+
+
+def test_graphql_fields_are_parsed_once(models, monkeypatch):
+    from graphql_query import parser
+
+    fields = models.Droid.graphql_fields()
+
+    def parse_fields(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("the selection set is parsed again")
+
+    monkeypatch.setattr(parser, "parse_fields", parse_fields)
+    again = models.Droid.graphql_fields()
+
+    assert again == fields
+    assert again[2] is not fields[2]
+
+
+def test_arguments_with_the_same_name():
+    sdl = """
+    type Query { post(id: ID!): Post user(id: ID!): User }
+    type Post { id: ID! comments(first: Int!): [Comment!]! author: User }
+    type User { id: ID! posts(first: Int!): [Post!]! }
+    type Comment { id: ID! }
+    """
+    source = render_models(Schema.from_sdl(sdl), max_depth=2)["query.py"]
+
+    assert '"post(id: $post_id) { id comments(first: $post_comments_first) { id } author { id } } user(id: "' in source
+    assert '"$user_id) { id posts(first: $user_posts_first) { id } }"' in source
+    for name, type_ in [
+        ("post_id", "ID!"),
+        ("user_id", "ID!"),
+        ("post_comments_first", "Int!"),
+        ("user_posts_first", "Int!"),
+    ]:
+        assert f'        "{name}": "{type_}",\n' in source
+    assert 'Argument(name="id", value=Variable(name="user_id", type="ID!"))' in source
+
+
+def test_validation_links_referenced_models(models):
+    human = models.Human.model_validate(
+        {
+            "id": "1",
+            "name": "Luke",
+            "friends": [{"id": "2", "name": "Leia"}],
+            "from_": "Tatooine",
+            "starships": [{"id": "3", "coordinates": [[1.0, 2.0]], "meta": {"any": "value"}}],
+        }
+    )
+
+    assert human.friends[0].name == "Leia"
+    assert human.from_ == "Tatooine"
+    assert human.starships[0].coordinates == [[1.0, 2.0]]
+    assert "starwars_models.droid" not in sys.modules
+
+    with pytest.raises(ValueError):
+        models.Human.model_validate({"id": "1"})
+
+
+def test_command_line(tmp_path, capsys):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(SDL)
+
+    main([str(schema_path), str(tmp_path / "out"), "--max-depth", "0"])
+
+    assert capsys.readouterr().out == f"7 files are written to {tmp_path / 'out'}\n"
+    assert 'ClassVar[str] = ""\n' in (tmp_path / "out" / "query.py").read_text()
+    assert 'ClassVar[str] = "id length coordinates meta"\n' in (tmp_path / "out" / "starship.py").read_text()
@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.compact import from_compact, to_compact
+
+var_id = Variable(name="id", type="ID!")
+var_size = Variable(name="size", type="Int", default="64")
+
+
+def _operation() -> Operation:
+    fragment = Fragment(
+        name="Avatar", type="User", fields=[Field(name="avatar", arguments=[Argument(name="size", value=var_size)])]
+    )
+    return Operation(
+        type="query",
+        name="User",
+        variables=[var_id, var_size],
+        queries=[
+            Query(
+                name="user",
+                alias="me",
+                arguments=[Argument(name="id", value=var_id)],
+                typename=True,
+                fields=[
+                    "id",
+                    Field(
+                        name="posts",
+                        alias="latest",
+                        arguments=[
+                            Argument(name="first", value=10),
+                            Argument(name="score", value=0.5),
+                            Argument(name="draft", value=False),
+                            Argument(name="tags", value=['"a"', '"b"']),
+                            Argument(name="ids", value=[1, 2]),
+                            Argument(name="where", value=Argument(name="author", value=var_id)),
+                            Argument(name="or", value=[[Argument(name="a", value=1)], [Argument(name="b", value=2)]]),
+                        ],
+                        fields=["title", InlineFragment(type="Video", fields=["duration"], typename=True)],
+                        directives=[Directive(name="include", arguments=[Argument(name="if", value=True)])],
+                    ),
+                    fragment,
+                ],
+            )
+        ],
+        fragments=[fragment],
+    )
+
+
+def test_round_trip():
+    operation = _operation()
+
+    compact = to_compact(operation)
+    node = from_compact(compact)
+
+    assert node == operation
+    assert node.render() == operation.render()
+    assert from_compact(pickle.loads(pickle.dumps(compact))).render() == operation.render()
+
+
+def test_compact_is_made_of_builtins():
+    def check(value):
+        if isinstance(value, (tuple, list)):
+            for item in value:
+                check(item)
+        else:
+            assert value is None or isinstance(value, (str, int, float, bool))
+
+    check(to_compact(_operation()))
+
+
+def test_compact_is_smaller_than_pickled_nodes():
+    operation = _operation()
+
+    assert len(pickle.dumps(to_compact(operation))) * 2 < len(pickle.dumps(operation))
+
+
+def test_shared_nodes_stay_shared():
+    compact = to_compact(_operation())
+    assert compact[3][0] is compact[4][0][3][0][2]
+
+    operation = from_compact(compact)
+    assert operation.variables[0] is operation.queries[0].arguments[0].value
+    assert operation.fragments[0] is operation.queries[0].fields[2]
+
+
+def test_built_nodes_behave_like_validated_nodes():
+    query = from_compact(to_compact(Query(name="user", fields=["id"])))
+
+    assert query.model_fields_set == {"name", "alias", "arguments", "typename", "fields"}
+    query.fields.append("login")
+    query.alias = "me"
+    assert query.render() == Query(name="user", alias="me", fields=["id", "login"]).render()
+    assert query.model_dump() == Query(name="user", alias="me", fields=["id", "login"]).model_dump()
+
+
+def test_errors():
+    class MyField(Field):
+        pass
+
+    with pytest.raises(ValueError, match="MyField"):
+        to_compact(Query(name="user", fields=[MyField(name="id")]))
+
+    with pytest.raises(ValueError):
+        from_compact(["not", "a", "node"])  # type: ignore
@@ -0,0 +1,98 @@
+import datetime
+import json
+
+import pytest
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.compiled import CompiledOperation
+from graphql_query.store import document_hash
+
+var_owner = Variable(name="owner", type="String!")
+var_first = Variable(name="first", type="Int", default="10")
+var_after = Variable(name="after", type="String")
+
+
+def _operation() -> Operation:
+    return Operation(
+        name="Issues",
+        variables=[var_owner, var_first, var_after],
+        queries=[
+            Query(
+                name="repository",
+                arguments=[Argument(name="owner", value=var_owner)],
+                fields=[
+                    Field(
+                        name="issues",
+                        arguments=[Argument(name="first", value=var_first), Argument(name="after", value=var_after)],
+                        fields=["title"],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def test_compile():
+    operation = _operation()
+    compiled = operation.compile()
+
+    assert isinstance(compiled, CompiledOperation)
+    assert compiled.document == operation.render()
+    assert compiled.hash == document_hash(operation.render())
+    assert compiled.operation_name == "Issues"
+    assert [variable.name for variable in compiled.variables] == ["owner", "first", "after"]
+
+
+def test_bind():
+    operation = _operation()
+    compiled = operation.compile()
+
+    body = compiled.bind(owner="denisart", after="Y3Vyc29y")
+
+    assert json.loads(body) == {
+        "query": operation.render(),
+        "operationName": "Issues",
+        "variables": {"owner": "denisart", "after": "Y3Vyc29y"},
+    }
+
+    anonymous = Operation(queries=[Query(name="viewer", fields=["login"])]).compile()
+    assert json.loads(anonymous.bind()) == {"query": "query {\n  viewer {\n    login\n  }\n}", "variables": {}}
+
+
+def test_bind_errors():
+    compiled = _operation().compile()
+
+    with pytest.raises(ValueError, match="owner"):
+        compiled.bind(first=5)
+
+    with pytest.raises(ValueError, match="unknown"):
+        compiled.bind(owner="denisart", unknown=1)
+
+
+def test_immutable():
+    operation = _operation()
+    compiled = operation.compile()
+
+    with pytest.raises(AttributeError):
+        compiled.document = ""  # type: ignore
+
+    operation.variables[0].name = "login"
+    assert [variable.name for variable in compiled.variables] == ["owner", "first", "after"]
+    assert "$owner" in compiled.document
+
+
+def test_bind_encodes_values():
+    operation = Operation(
+        name="Issues",
+        variables=[Variable(name="ids", type="[ID!]!"), Variable(name="since", type="DateTime")],
+        queries=[Query(name="nodes", arguments=[Argument(name="ids", value=Variable(name="ids", type="[ID!]!"))])],
+    )
+    compiled = operation.compile()
+
+    assert json.loads(compiled.bind(ids=[1, "2"], since=datetime.date(2024, 1, 1)))["variables"] == {
+        "ids": ["1", "2"],
+        "since": "2024-01-01",
+    }
+
+    with pytest.raises(ValueError, match=r"^\$ids\[0\]: "):
+        compiled.bind(ids=[None])
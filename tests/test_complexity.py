@@ -0,0 +1,100 @@
+from graphql_query import Argument, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.complexity import Complexity, analyze_complexity
+from graphql_query.schema import Schema
+
+var_first = Variable(name="first", type="Int!")
+
+issue_fields = Fragment(
+    name="issueFields",
+    type="Issue",
+    fields=["title", Field(name="labels", arguments=[Argument(name="last", value=3)], fields=["name"])],
+)
+
+
+def _operation() -> Operation:
+    return Operation(
+        variables=[var_first],
+        queries=[
+            Query(
+                name="repository",
+                alias="main",
+                fields=[
+                    Field(name="issues", arguments=[Argument(name="first", value=var_first)], fields=[issue_fields]),
+                    Field(name="pullRequests", arguments=[Argument(name="first", value=2)], fields=[issue_fields]),
+                ],
+            ),
+            Query(name="viewer", typename=True, fields=[InlineFragment(type="User", fields=[Field(name="login")])]),
+        ],
+        fragments=[issue_fields],
+    )
+
+
+def test_counts():
+    complexity = analyze_complexity(_operation(), variables={"first": 10})
+
+    # main, issues, pullRequests, title, labels, name, viewer, __typename, ... on User, login
+    assert complexity.nodes == 10
+    # the fragment is expanded twice
+    assert complexity.size == 13
+    assert complexity.aliases == 1
+    assert complexity.depth == 4
+
+
+def test_cost():
+    # repository + issues + 10 * (title + labels + 3 * name) + pullRequests + 2 * (title + labels + 3 * name)
+    # + viewer + __typename + login
+    assert analyze_complexity(_operation(), variables={"first": 10}).cost == 1 + 1 + 10 * 5 + 1 + 2 * 5 + 3
+
+    # the value of the variable is unknown
+    assert analyze_complexity(_operation(), default_list_size=100).cost == 1 + 1 + 100 * 5 + 1 + 2 * 5 + 3
+
+
+def test_string_selections():
+    def operation(fields):
+        return Operation(
+            queries=[Query(name="repositories", arguments=[Argument(name="first", value=10)], fields=fields)],
+            fragments=[issue_fields],
+        )
+
+    nodes = operation(
+        [
+            Field(name="issues", arguments=[Argument(name="first", value=50)], fields=["title", "body"]),
+            issue_fields,
+        ]
+    )
+    strings = operation(["issues(first: 50) { title body }", "...issueFields"])
+
+    assert analyze_complexity(strings) == analyze_complexity(nodes)
+    assert analyze_complexity(strings).cost == 1 + 10 * (1 + 50 * 2) + 10 * (1 + 1 + 3)
+
+
+def test_weights():
+    weights = {"Issue.labels": 0, "name": 0.5, "login": 2}
+    complexity = analyze_complexity(_operation(), variables={"first": 10}, weights=weights, default_weight=0)
+
+    assert complexity.cost == 10 * 3 * 0.5 + 2 * 3 * 0.5 + 2
+
+
+def test_weights_by_schema_types():
+    schema = Schema.from_sdl("""
+        type Query { repository: Repository viewer: User }
+        type Repository { issues(first: Int): [Issue] pullRequests(first: Int): [Issue] }
+        type Issue { title: String labels(last: Int): [Label] }
+        type Label { name: String }
+        type User { login: String }
+        """)
+    weights = {"Query.repository": 5, "Repository.issues": 2, "Label.name": 0, "Issue.title": 0}
+    complexity = analyze_complexity(_operation(), weights=weights, schema=schema, variables={"first": 1})
+
+    # repository + issues + (labels) + pullRequests + 2 * labels + viewer + __typename + login
+    assert complexity.cost == 5 + 2 + 1 + 1 + 2 + 3
+
+
+def test_raw_values_and_empty_operation():
+    operation = Operation(
+        queries=[Query(name="users", arguments=[Argument(name="limit", value="50")], fields=["id", "friends { id }"])]
+    )
+
+    # the string selection "friends { id }" is counted like nodes
+    assert analyze_complexity(operation) == Complexity(depth=3, nodes=4, aliases=0, size=4, cost=151.0)
+    assert analyze_complexity(Operation(queries=[])) == Complexity(depth=0, nodes=0, aliases=0, size=0, cost=0.0)
@@ -0,0 +1,87 @@
+import datetime
+import enum
+import io
+import json
+from typing import List, Optional, Union
+
+import pytest
+from pydantic import Field as PydanticField
+
+from graphql_query import GraphQLQueryBaseModel
+from graphql_query.decoder import compile_decoder, iter_decode
+
+
+class Episode(enum.Enum):
+    NEWHOPE = "NEWHOPE"
+    JEDI = "JEDI"
+
+
+class Droid(GraphQLQueryBaseModel):
+    primaryFunction: str
+
+
+class Human(GraphQLQueryBaseModel):
+    height: float
+
+
+class Character(GraphQLQueryBaseModel):
+    name: str
+    born: Optional[datetime.date] = None
+    appears_in: List[Episode] = PydanticField(json_schema_extra={"graphql_alias": "appearsIn"})
+    details: Union[Human, Droid]
+    friends: Optional[List[Optional["Character"]]] = None
+
+
+hero = {
+    "name": "Luke Skywalker",
+    "born": "1951-09-25",
+    "appearsIn": ["NEWHOPE", "JEDI"],
+    "details": {"height": 1.72},
+    "friends": [
+        {"name": "R2-D2", "appearsIn": ["JEDI"], "details": {"__typename": "Droid", "primaryFunction": "Astromech"}},
+        None,
+    ],
+}
+
+
+def test_decode():
+    character = compile_decoder(Character)(hero)
+
+    assert character == Character.model_validate(
+        {**hero, "appears_in": hero["appearsIn"], "friends": [{**hero["friends"][0], "appears_in": ["JEDI"]}, None]}
+    )
+    assert character.born == datetime.date(1951, 9, 25)
+    assert character.appears_in == [Episode.NEWHOPE, Episode.JEDI]
+    assert character.details == Human(height=1.72)
+    assert character.friends[0].details == Droid(primaryFunction="Astromech")
+    assert character.friends[0].born is None
+    assert character.friends[1] is None
+
+
+def test_decoder_is_cached():
+    assert compile_decoder(Character) is compile_decoder(Character)
+
+
+def test_iter_decode():
+    response = json.dumps(
+        {"errors": [{"message": "partial ]}"}], "data": {"total": 2, "characters": [hero, hero], "after": {"x": 1}}}
+    ).encode("utf-8")
+
+    characters = list(iter_decode(io.BytesIO(response), Character, "data.characters", chunk_size=5))
+    assert characters == [compile_decoder(Character)(hero)] * 2
+
+    chunks = [response[i : i + 3] for i in range(0, len(response), 3)]
+    assert len(list(iter_decode(chunks, Character, "data.characters"))) == 2
+
+    assert list(iter_decode([b'{"data": null}'], Character, "data.characters")) == []
+    assert list(iter_decode([b'{"data": {"characters": []}}'], Character, "data.characters")) == []
+    assert list(iter_decode([b'{"data": {}}'], Character, "data.characters")) == []
+    assert len(list(iter_decode([b"[", json.dumps(hero).encode("utf-8"), b"]"], Character, ""))) == 1
+
+
+def test_iter_decode_errors():
+    with pytest.raises(ValueError):
+        list(iter_decode([b'{"data": {"characters": {}}}'], Character, "data.characters"))
+
+    with pytest.raises(ValueError):
+        list(iter_decode([b'{"data": {"characters": [{"name": "R2-D2"'], Character, "data.characters"))
@@ -0,0 +1,72 @@
+import pytest
+
+from graphql_query import Argument, Field, InlineFragment, Operation, Query, Variable
+
+from .test_operation import operation_cases
+
+graphql = pytest.importorskip("graphql")
+
+
+@pytest.mark.parametrize("type, name, variables, queries, fragments, result", operation_cases)
+def test_same_as_parsed_document(type, name, variables, queries, fragments, result):
+    operation = Operation(type=type, name=name, variables=variables, queries=queries, fragments=fragments)
+
+    document = operation.to_document_node()
+
+    assert isinstance(document, graphql.DocumentNode)
+    assert graphql.print_ast(document) == graphql.print_ast(graphql.parse(result))
+
+
+def test_values_and_types():
+    var_ids = Variable(name="ids", type="[ID!]!", default='["1", "2"]')
+    operation = Operation(
+        variables=[var_ids],
+        queries=[
+            Query(
+                name="search",
+                arguments=[
+                    Argument(name="ids", value=var_ids),
+                    Argument(name="text", value='"escaped \\" quote"'),
+                    Argument(name="cursor", value="null"),
+                    Argument(name="order", value="DESC"),
+                    Argument(name="tags", value=["a", "b"]),
+                    Argument(name="ratios", value=[0.5, 1.5]),
+                    Argument(name="filter", value=Argument(name="deleted", value=False)),
+                ],
+                fields=["id", "title: name", Field(name="author", alias="writer", fields=["name"], typename=True)],
+            )
+        ],
+    )
+
+    assert graphql.print_ast(operation.to_document_node()) == graphql.print_ast(graphql.parse(operation.render()))
+
+
+def test_typename_without_fields():
+    operation = Operation(
+        queries=[
+            Query(name="hero", typename=True),
+            Query(
+                name="viewer",
+                fields=[Field(name="name", typename=True), InlineFragment(type="User", typename=True)],
+            ),
+        ]
+    )
+
+    assert graphql.print_ast(operation.to_document_node()) == graphql.print_ast(graphql.parse(operation.render()))
+    assert "hero\n" in graphql.print_ast(operation.to_document_node())
+
+
+def test_inline_fragment_with_arguments():
+    operation = Operation(
+        queries=[Query(name="hero", fields=[InlineFragment(type="Droid", arguments=[Argument(name="a", value=1)])])]
+    )
+
+    with pytest.raises(ValueError):
+        operation.to_document_node()
+
+
+def test_cached():
+    operation = Operation(queries=[Query(name="hero", fields=["name"])])
+
+    assert operation.to_document_node(cached=True) is operation.to_document_node(cached=True)
+    assert operation.to_document_node() is not operation.to_document_node()
@@ -0,0 +1,181 @@
+import datetime
+import decimal
+import enum
+import gc
+import uuid
+import weakref
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from graphql_query import Variable
+from graphql_query.encoders import encode_variables, variable_encoder
+from graphql_query.schema import Schema
+
+schema = Schema.from_sdl("""
+    type Query { reviews(stars: [Int!]): [Review] }
+    type Mutation { createReview(episode: Episode!, review: ReviewInput!): Review }
+    type Review { stars: Int! commentary: String }
+    enum Episode { NEWHOPE EMPIRE JEDI }
+    scalar DateTime
+    input ReviewInput {
+      stars: Int!
+      commentary: String
+      createdAt: DateTime
+      favoriteColor: ColorInput
+      replies: [ReviewInput!] = []
+    }
+    input ColorInput { red: Int! green: Int! blue: Int! }
+    """)
+
+
+class Episode(enum.Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+    JEDI = 6
+
+
+class Color(BaseModel):
+    red: int
+    green: int
+    blue: int
+
+
+class ReviewInput(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    stars: int
+    commentary: Optional[str] = None
+    created_at: Optional[datetime.datetime] = Field(default=None, alias="createdAt")
+    favorite_color: Optional[Color] = Field(default=None, alias="favoriteColor")
+
+
+def test_scalars():
+    assert variable_encoder("Int!")(5) == 5
+    assert variable_encoder("Float")(decimal.Decimal("1.5")) == 1.5
+    assert variable_encoder("Float")(None) is None
+    assert variable_encoder("ID")(42) == "42"
+    assert variable_encoder("ID")(uuid.UUID(int=1)) == "00000000-0000-0000-0000-000000000001"
+    assert variable_encoder("Boolean!")(False) is False
+
+    for type_, value in [("Int", True), ("Int", 2**31), ("Int", 1.0), ("String", 1), ("Boolean", 1), ("ID!", None)]:
+        with pytest.raises(ValueError):
+            variable_encoder(type_)(value)
+
+
+def test_custom_scalars_without_schema():
+    encode = variable_encoder("JSON")
+
+    assert encode(
+        {
+            "at": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            "day": datetime.date(2024, 5, 1),
+            "price": decimal.Decimal("10.10"),
+            "episode": Episode.JEDI,
+            "color": Color(red=1, green=2, blue=3),
+            "tags": ("a", "b"),
+        }
+    ) == {
+        "at": "2024-05-01T12:30:00+00:00",
+        "day": "2024-05-01",
+        "price": "10.10",
+        "episode": "JEDI",
+        "color": {"red": 1, "green": 2, "blue": 3},
+        "tags": ["a", "b"],
+    }
+
+    with pytest.raises(ValueError):
+        encode(object())
+
+
+def test_lists():
+    encode = variable_encoder("[ID!]!")
+
+    assert encode(["1", "2"]) == ["1", "2"]
+    assert encode([1, "2"]) == ["1", "2"]
+    assert encode("1") == ["1"]
+    assert encode(str(i) for i in range(3)) == ["0", "1", "2"]
+    assert variable_encoder("[Date!]")([datetime.date(2024, 1, 1)] * 2) == ["2024-01-01", "2024-01-01"]
+    assert variable_encoder("[[Int]]")([[1, None], None]) == [[1, None], None]
+
+    with pytest.raises(ValueError, match=r"^\[1\]: "):
+        encode(["1", None])
+
+    with pytest.raises(ValueError):
+        variable_encoder("[Int]")([1, 2**40])
+
+    items = ["a", "b"]
+    assert variable_encoder("[String]")(items) is not items
+
+
+def test_schema_types():
+    assert variable_encoder("Episode!", schema)(Episode.JEDI) == "JEDI"
+    assert variable_encoder("Episode!")(Episode.JEDI) == "JEDI"
+    assert variable_encoder("String")(Episode.EMPIRE) == "EMPIRE"
+    assert variable_encoder("Episode!", schema)("EMPIRE") == "EMPIRE"
+
+    review = ReviewInput(
+        stars=5,
+        created_at=datetime.datetime(2024, 1, 1),
+        favorite_color=Color(red=255, green=0, blue=0),
+    )
+    assert variable_encoder("ReviewInput!", schema)(review) == {
+        "stars": 5,
+        "commentary": None,
+        "createdAt": "2024-01-01T00:00:00",
+        "favoriteColor": {"red": 255, "green": 0, "blue": 0},
+    }
+    assert variable_encoder("ReviewInput", schema)({"stars": 1, "replies": [{"stars": 2}]}) == {
+        "stars": 1,
+        "replies": [{"stars": 2}],
+    }
+
+    with pytest.raises(ValueError):
+        variable_encoder("Episode", schema)("PHANTOM")
+
+    with pytest.raises(ValueError, match="stars"):
+        variable_encoder("ReviewInput", schema)({"commentary": "no stars"})
+
+    with pytest.raises(ValueError, match="color"):
+        variable_encoder("ReviewInput", schema)({"stars": 1, "color": "red"})
+
+    with pytest.raises(ValueError):
+        variable_encoder("Review", schema)
+
+
+def test_cache():
+    assert variable_encoder("[ID!]!") is variable_encoder(" [ ID! ]! ")
+    assert variable_encoder("ReviewInput", schema) is variable_encoder("ReviewInput", schema)
+    assert variable_encoder("ReviewInput", schema) is not variable_encoder("ReviewInput")
+
+
+def test_cache_does_not_keep_schema():
+    other = Schema.from_sdl("input PointInput { x: Int! y: Int! next: PointInput }")
+    encode = variable_encoder("PointInput!", other)
+    assert encode({"x": 1, "y": 2, "next": {"x": 3, "y": 4}}) == {"x": 1, "y": 2, "next": {"x": 3, "y": 4}}
+
+    reference = weakref.ref(other)
+    del other
+    gc.collect()
+
+    assert reference() is None
+    assert encode({"x": 1, "y": 2}) == {"x": 1, "y": 2}
+
+
+def test_encode_variables():
+    variables = [Variable(name="episode", type="Episode!"), Variable(name="review", type="ReviewInput!")]
+
+    assert encode_variables(variables, {"episode": "JEDI", "review": {"stars": 4}}, schema) == {
+        "episode": "JEDI",
+        "review": {"stars": 4},
+    }
+
+    with pytest.raises(ValueError, match=r"^\$review\.replies\[0\]\.stars: "):
+        encode_variables(variables, {"episode": "JEDI", "review": {"stars": 4, "replies": [{"stars": "5"}]}}, schema)
+
+    with pytest.raises(ValueError, match="review"):
+        encode_variables(variables, {"episode": "JEDI"}, schema)
+
+    with pytest.raises(ValueError, match="unknown"):
+        encode_variables(variables, {"unknown": 1})
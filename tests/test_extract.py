@@ -0,0 +1,77 @@
+from graphql_query import Argument, Field, Fragment, InlineFragment, Operation, Query
+from graphql_query.extract import extract_fragments
+
+
+def test_extract_repeated_field():
+    author = Field(name="author", fields=["id", "name", "avatar"])
+    operation = Operation(
+        queries=[
+            Query(name="posts", fields=["title", author]),
+            Query(name="comments", fields=["text", Field(name="author", fields=["id", "name", "avatar"])]),
+        ]
+    )
+
+    result = extract_fragments(operation, {"author": "User"})
+
+    assert result.fragments == [Fragment(name="Fragment1", type="User", fields=["id", "name", "avatar"])]
+    assert result.queries[0].fields[1] == Field(name="author", fields=[result.fragments[0]])
+    assert result.queries[1].fields[1] == Field(name="author", fields=[result.fragments[0]])
+    assert len(operation.fragments) == 0
+
+
+def test_small_unique_and_untyped_subtrees_are_kept():
+    operation = Operation(
+        queries=[
+            Query(name="a", fields=[Field(name="author", fields=["id"]), Field(name="editor", fields=["x", "y", "z"])]),
+            Query(name="b", fields=[Field(name="author", fields=["id"]), Field(name="editor", fields=["x", "y", "z"])]),
+            Query(name="c", fields=[Field(name="author", fields=["id", "name", "avatar"])]),
+        ]
+    )
+
+    assert extract_fragments(operation, {"author": "User"}) == operation
+
+
+def test_nested_repeats_are_extracted_once():
+    comments = Field(name="comments", fields=["id", "text", Field(name="author", fields=["id", "name"])])
+    post = Field(name="post", fields=["id", "title", comments])
+    operation = Operation(queries=[Query(name="a", fields=[post]), Query(name="b", fields=[post])])
+
+    result = extract_fragments(operation, {"post": "Post", "comments": "Comment", "author": "User"}, min_size=2)
+
+    assert [fragment.name for fragment in result.fragments] == ["Fragment1"]
+    assert result.fragments[0].type == "Post"
+
+
+def test_inner_repeats_inside_fragment():
+    author = Field(name="author", fields=["id", "name", "avatar"])
+    post = Field(name="post", fields=["id", Field(name="editor", fields=["id", "name", "avatar"]), author])
+    operation = Operation(
+        queries=[Query(name="a", fields=[post]), Query(name="b", fields=[post])],
+        fragments=[Fragment(name="Fragment1", type="Query", fields=["id"])],
+    )
+
+    result = extract_fragments(operation, {"post": "Post", "editor": "User", "author": "User"})
+
+    names = [fragment.name for fragment in result.fragments]
+    assert names[0] == "Fragment1"
+    assert len(names) == 3
+    assert len(set(names)) == 3
+
+    rendered = result.render()
+    assert rendered.count("avatar") == 1
+    assert len(rendered) < len(operation.render())
+
+
+def test_inline_fragments_and_type_function():
+    droid = InlineFragment(type="Droid", fields=["id", "primaryFunction", "model"])
+    operation = Operation(
+        queries=[
+            Query(name="hero", arguments=[Argument(name="episode", value="JEDI")], fields=[droid]),
+            Query(name="hero", alias="other", arguments=[Argument(name="episode", value="EMPIRE")], fields=[droid]),
+        ]
+    )
+
+    result = extract_fragments(operation, lambda field: None, prefix="Droid")
+
+    assert result.fragments == [Fragment(name="Droid1", type="Droid", fields=["id", "primaryFunction", "model"])]
+    assert result.queries[0].fields == [InlineFragment(type="Droid", fields=[result.fragments[0]])]
@@ -0,0 +1,80 @@
+import sys
+
+from graphql_query import Argument, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.footprint import footprint
+
+var_id = Variable(name="id", type="ID!")
+
+
+def _operation(argument=None) -> Operation:
+    return Operation(
+        name="Users",
+        variables=[var_id],
+        queries=[
+            Query(
+                name="user",
+                alias=f"user{i}",
+                arguments=[argument or Argument(name="id", value=var_id)],
+                fields=["id", Field(name="friends", fields=["login"])],
+            )
+            for i in range(10)
+        ],
+    )
+
+
+def test_nodes_and_rendered_size():
+    operation = _operation()
+    report = footprint(operation)
+
+    assert report.nodes == {"Operation": 1, "Variable": 1, "Query": 10, "Argument": 10, "Field": 10}
+    assert report.rendered_size == len(operation.render().encode("utf-8"))
+    assert footprint(operation, render=False).rendered_size == 0
+    assert report.size == sum(report.sizes.values())
+
+
+def test_size_counts_node_internals():
+    field = Field(name="id")
+    report = footprint(field)
+
+    assert report.size >= (
+        sys.getsizeof(field) + sys.getsizeof(field.__dict__) + sys.getsizeof(field.__pydantic_fields_set__)
+    )
+    assert footprint(Field(name="id", fields=["a" * 1000])).size > report.size + 1000
+
+
+def test_duplicate_subtrees():
+    duplicated = footprint(_operation())
+    argument = Argument(name="id", value=var_id)
+    shared = footprint(_operation(argument))
+
+    assert shared.nodes["Argument"] == 1
+    assert duplicated.duplicate_size > 0
+    # the friends fields of queries are equal too
+    assert shared.duplicate_size > 0
+    assert duplicated.size - duplicated.duplicate_size < shared.size
+    assert duplicated.size - shared.size == duplicated.duplicate_size - shared.duplicate_size
+
+
+def test_different_values_are_not_duplicates():
+    operation = Operation(
+        queries=[
+            Query(name="a", arguments=[Argument(name="x", value=1)]),
+            Query(name="b", arguments=[Argument(name="x", value=True)]),
+            Query(name="c", arguments=[Argument(name="x", value=[[Argument(name="y", value=1)]])]),
+            Query(name="d", arguments=[Argument(name="x", value=[[Argument(name="y", value=2)]])]),
+        ]
+    )
+
+    assert footprint(operation).duplicate_size == 0
+
+
+def test_fragments():
+    fragment = Fragment(name="User", type="User", fields=["id", InlineFragment(type="Admin", fields=["role"])])
+    operation = Operation(
+        queries=[Query(name="me", fields=[fragment]), Query(name="viewer", fields=[fragment])],
+        fragments=[fragment],
+    )
+
+    report = footprint(operation)
+    assert report.nodes == {"Operation": 1, "Query": 2, "Fragment": 1, "InlineFragment": 1}
+    assert report.duplicate_size == 0
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+# the budget of modules of the package (not of pydantic) in milliseconds, it is about 10 ms now
+IMPORT_BUDGET_MS = 50
+
+
+def _own_import_time() -> int:
+    """Return the sum of self times of modules of the package in microseconds (``python -X importtime``)."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import graphql_query"], capture_output=True, text=True, check=True
+    ).stderr
+
+    total = 0
+    for line in stderr.splitlines():
+        fields = line[len("import time:") :].split("|")
+        if line.startswith("import time:") and fields[2].strip().startswith("graphql_query"):
+            total += int(fields[0])
+
+    return total
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, graphql_query; from graphql_query import templates; "
+        "print('jinja2' in sys.modules, templates._template_env is None, graphql_query.Field.__pydantic_complete__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ["False", "True", "False"]
+
+
+def test_import_time_budget():
+    # the best of several runs is less noisy
+    assert min(_own_import_time() for _ in range(3)) / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.instrumentation import NodeStats, RenderProfiler
+
+var_first = Variable(name="first", type="Int!")
+
+
+def _operation() -> Operation:
+    fragment = Fragment(name="Author", type="User", fields=["login"])
+    return Operation(
+        name="Feed",
+        variables=[var_first],
+        queries=[
+            Query(
+                name="posts",
+                alias="latest",
+                arguments=[Argument(name="first", value=var_first)],
+                fields=[
+                    "id",
+                    Field(name="author", fields=[fragment]),
+                    Field(
+                        name="body", directives=[Directive(name="include", arguments=[Argument(name="if", value=True)])]
+                    ),
+                    InlineFragment(type="Video", fields=["duration"]),
+                ],
+            )
+        ],
+        fragments=[fragment],
+    )
+
+
+def test_disabled_profiler_restores_render():
+    originals = {cls: cls.__dict__["render"] for cls in (Variable, Argument, Directive, Field, Query, Operation)}
+
+    with RenderProfiler():
+        assert Field.__dict__["render"] is not originals[Field]
+
+    assert {cls: cls.__dict__["render"] for cls in originals} == originals
+
+
+def test_stats_by_node_class():
+    operation = _operation()
+    expected = operation.render()
+
+    with RenderProfiler() as profiler:
+        assert operation.render() == expected
+
+    nodes = profiler.snapshot().nodes
+    assert {name: stats.calls for name, stats in nodes.items()} == {
+        "Operation": 1,
+        "Variable": 1,
+        "Query": 1,
+        "Argument": 2,
+        "Field": 2,
+        "Directive": 1,
+        "InlineFragment": 1,
+        "Fragment": 1,
+    }
+    assert nodes["Operation"].size == len(expected)
+    assert nodes["Field"].size == len(operation.queries[0].fields[1].render()) + len(
+        operation.queries[0].fields[2].render()
+    )
+    for stats in nodes.values():
+        assert 0 <= stats.self_time <= stats.time
+    assert nodes["Operation"].time >= nodes["Query"].time
+
+
+def test_slowest_subtrees():
+    with RenderProfiler(slowest=3) as profiler:
+        _operation().render()
+
+    slowest = profiler.snapshot().slowest
+    assert len(slowest) == 3
+    assert slowest[0].path == "Operation:Feed"
+    assert slowest[1].path == "Operation:Feed.Query:latest"
+    assert [render.time for render in slowest] == sorted((render.time for render in slowest), reverse=True)
+
+
+def test_paths_and_hook():
+    paths = []
+
+    with RenderProfiler(
+        hook=lambda node, path, seconds, text: paths.append((path, type(node).__name__ in path and text != ""))
+    ):
+        _operation().render()
+
+    assert dict(paths) == {
+        "Operation:Feed.Variable:first": True,
+        "Operation:Feed.Query:latest.Argument:first": True,
+        "Operation:Feed.Query:latest.Field:author": True,
+        "Operation:Feed.Query:latest.Field:body.Directive:include.Argument:if": True,
+        "Operation:Feed.Query:latest.Field:body.Directive:include": True,
+        "Operation:Feed.Query:latest.Field:body": True,
+        "Operation:Feed.Query:latest.InlineFragment:Video": True,
+        "Operation:Feed.Query:latest": True,
+        "Operation:Feed.Fragment:Author": True,
+        "Operation:Feed": True,
+    }
+
+
+def test_snapshot_metrics_and_reset():
+    profiler = RenderProfiler()
+    with profiler:
+        Field(name="id").render()
+
+    assert profiler.snapshot().metrics()["graphql_query.render.Field.calls"] == 1
+    assert set(profiler.snapshot().metrics(prefix="app")) == {f"app.Field.{name}" for name in NodeStats._fields}
+
+    profiler.reset()
+    assert profiler.snapshot().nodes == {}
+    assert profiler.snapshot().slowest == []
+
+
+def test_one_enabled_profiler():
+    with RenderProfiler() as profiler:
+        assert profiler.enabled
+        with pytest.raises(ValueError):
+            RenderProfiler().enable()
+
+    assert not profiler.enabled
+
+
+def test_subclasses_and_errors():
+    class MyField(Field):
+        def render(self) -> str:
+            return "# my field\n" + super().render()
+
+    class BrokenField(Field):
+        def render(self) -> str:
+            raise RuntimeError("broken")
+
+    with RenderProfiler() as profiler:
+        Query(name="user", fields=[MyField(name="id")]).render()
+        with pytest.raises(RuntimeError):
+            Query(name="user", fields=[BrokenField(name="id")]).render()
+        Field(name="id").render()
+
+    snapshot = profiler.snapshot()
+    assert snapshot.nodes["MyField"].calls == 1
+    assert snapshot.nodes["Field"].calls == 1
+    assert snapshot.nodes["Query"].calls == 1
+    assert "BrokenField" not in snapshot.nodes
+    assert {render.path for render in snapshot.slowest} == {"Query:user", "Query:user.MyField:id", "Field:id"}
+
+
+def test_threads():
+    operation = _operation()
+
+    def worker():
+        for _ in range(50):
+            operation.render()
+
+    with RenderProfiler() as profiler:
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    nodes = profiler.snapshot().nodes
+    assert nodes["Operation"].calls == 200
+    assert nodes["Argument"].calls == 400
+    assert all(render.path.startswith("Operation:Feed") for render in profiler.snapshot().slowest)
@@ -0,0 +1,121 @@
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.merge import merge_fields
+
+
+def test_merge_nested_fields():
+    query = Query(
+        name="viewer",
+        fields=[
+            Field(name="user", fields=["id", Field(name="friends", fields=["name"])]),
+            "id",
+            Field(name="user", fields=["name", Field(name="friends", fields=["name", "id"])]),
+        ],
+    )
+
+    result = merge_fields(query)
+
+    assert result.node.render() == (
+        "viewer {\n  user {\n    id\n    friends {\n      name\n      id\n    }\n    name\n  }\n  id\n}"
+    )
+    assert result.removed_nodes == 3
+    assert result.removed_bytes == len(query.render()) - len(result.node.render())
+    assert result.removed_bytes > 0
+
+
+def test_different_aliases_arguments_and_directives_are_not_merged():
+    var_with_friends = Variable(name="withFriends", type="Boolean!")
+    query = Query(
+        name="hero",
+        fields=[
+            Field(name="friends", fields=["name"]),
+            Field(name="friends", alias="first", fields=["name"]),
+            Field(name="friends", arguments=[Argument(name="first", value=10)], fields=["name"]),
+            Field(
+                name="friends",
+                directives=[Directive(name="include", arguments=[Argument(name="if", value=var_with_friends)])],
+                fields=["name"],
+            ),
+        ],
+    )
+
+    result = merge_fields(query)
+
+    assert result.node == query
+    assert result.removed_nodes == 0
+    assert result.removed_bytes == 0
+
+
+def test_arguments_in_different_order_are_merged():
+    query = Query(
+        name="hero",
+        fields=[
+            Field(
+                name="friends",
+                arguments=[Argument(name="first", value=10), Argument(name="after", value='"abc"')],
+                fields=["name"],
+            ),
+            Field(
+                name="friends",
+                arguments=[Argument(name="after", value='"abc"'), Argument(name="first", value=10)],
+                fields=["id"],
+            ),
+        ],
+    )
+
+    result = merge_fields(query)
+
+    assert len(result.node.fields) == 1
+    assert result.node.fields[0].fields == ["name", "id"]
+
+
+def test_typename_duplicates():
+    query = Query(
+        name="hero",
+        typename=True,
+        fields=[
+            "__typename",
+            "name",
+            Field(name="__typename"),
+            Field(name="friends", fields=["__typename", "name"], typename=True),
+        ],
+    )
+
+    result = merge_fields(query)
+
+    assert result.node.render() == "hero {\n  __typename\n  name\n  friends {\n    __typename\n    name\n  }\n}"
+    assert result.removed_nodes == 3
+
+
+def test_inline_fragments_and_spreads():
+    fragment = Fragment(name="heroFields", type="Character", fields=["name", "name"])
+    field = Field(
+        name="hero",
+        fields=[
+            fragment,
+            InlineFragment(type="Droid", fields=["primaryFunction"]),
+            fragment,
+            InlineFragment(type="Droid", fields=["primaryFunction", "id"]),
+            InlineFragment(type="Human", fields=["height"]),
+        ],
+    )
+    operation = Operation(
+        queries=[Query(name="q", fields=[field]), Query(name="q", fields=[field])], fragments=[fragment]
+    )
+
+    result = merge_fields(operation)
+
+    assert result.node.render() == (
+        "query {\n  q {\n    hero {\n      ...heroFields\n      ... on Droid {\n        primaryFunction\n        id\n"
+        "      }\n      ... on Human {\n        height\n      }\n    }\n  }\n}\n\n"
+        "fragment heroFields on Character {\n  name\n}"
+    )
+    assert result.removed_bytes == len(operation.render()) - len(result.node.render())
+
+
+def test_source_tree_is_not_changed():
+    query = Query(name="hero", fields=[Field(name="friends", fields=["name"]), Field(name="friends", fields=["id"])])
+    copy = query.model_copy(deep=True)
+
+    merge_fields(query)
+
+    assert query == copy
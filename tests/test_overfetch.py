@@ -0,0 +1,163 @@
+import threading
+from typing import List, Optional
+
+import pytest
+from pydantic import Field as PydanticField
+
+from graphql_query import Field, Fragment, GraphQLQueryBaseModel, Operation, Query
+from graphql_query.overfetch import OverfetchProfiler
+
+
+class Author(GraphQLQueryBaseModel):
+    login: str
+    name: str
+    bio: str
+
+
+class Post(GraphQLQueryBaseModel):
+    title: str
+    body: str
+    author_: Author = PydanticField(json_schema_extra={"graphql_alias": "author"})
+    views: int
+
+
+def _responses(n: int) -> List[dict]:
+    author = {"login": "denisart", "name": "Denis", "bio": "..."}
+    return [{"title": f"post {i}", "body": "...", "author": author, "views": 1} for i in range(n)]
+
+
+def test_model_profile():
+    profiler = OverfetchProfiler(Post)
+
+    for data in _responses(3):
+        post = profiler.wrap(data)
+        assert post.title.startswith("post")
+        assert post.author_.login == "denisart"
+        assert post["author"]["login"] == "denisart"
+        assert post.views == 1
+
+    report = profiler.report()
+
+    assert report.requests == 3
+    assert report.reads == {
+        "title": 3,
+        "body": 0,
+        "author": 3,
+        "author.login": 3,
+        "author.name": 0,
+        "author.bio": 0,
+        "views": 3,
+    }
+    assert report.unused == ["body", "author.name", "author.bio"]
+    assert report.exclude == ["body", "author.name", "author.bio"]
+    assert [
+        field.name if isinstance(field, Field) else field for field in Post.graphql_fields(exclude=report.exclude)
+    ] == ["title", "author_", "views"]
+
+
+def test_exclude_unused_objects():
+    profiler = OverfetchProfiler(Post)
+    post = profiler.wrap(_responses(1)[0])
+
+    assert post.get("title") == "post 0"
+    assert post.get("unknown") is None
+    assert "body" in post
+
+    assert profiler.report().exclude == ["body", "author", "views"]
+
+    profiler.reset()
+    assert profiler.report().requests == 0
+
+
+def test_operation_profile():
+    user_fields = Fragment(name="userFields", type="User", fields=["login", "name"])
+    operation = Operation(
+        queries=[
+            Query(name="viewer", fields=[user_fields]),
+            Query(name="repository", alias="repo", fields=["name", Field(name="owner", fields=[user_fields])]),
+        ],
+        fragments=[user_fields],
+    )
+    profiler = OverfetchProfiler(operation)
+
+    data = profiler.wrap({"viewer": {"login": "a", "name": "A"}, "repo": {"name": "r", "owner": {"login": "b"}}})
+    assert data["viewer"]["login"] == "a"
+    assert [value for _, value in data["repo"].items()][0] == "r"
+
+    # items() reads all keys of the object, the owner was read and keeps a field
+    assert profiler.report().exclude == ["viewer.name", "repo.owner.name"]
+
+
+class Friend(GraphQLQueryBaseModel):
+    name: str
+    starships: List[Author]
+
+
+class Hero(GraphQLQueryBaseModel):
+    name: str
+    friends: List[Friend]
+
+
+def test_read_objects_keep_a_field():
+    profiler = OverfetchProfiler(Hero)
+
+    hero = profiler.wrap({"name": "Luke", "friends": [{"name": "Han", "starships": []}]})
+    assert len(hero.friends) == 1
+
+    report = profiler.report()
+    assert report.unused == [
+        "name",
+        "friends.name",
+        "friends.starships",
+        "friends.starships.login",
+        "friends.starships.name",
+        "friends.starships.bio",
+    ]
+    assert report.exclude == ["name", "friends.starships"]
+    assert Field(name="hero", fields=Hero.graphql_fields(exclude=report.exclude)).render() == (
+        "hero {\n  friends {\n    name\n  }\n}"
+    )
+
+
+class Order(GraphQLQueryBaseModel):
+    id: str
+    items: List[str]
+    values: Optional[List[int]] = None
+
+
+def test_fields_named_like_mapping_methods():
+    profiler = OverfetchProfiler(Order)
+
+    order = profiler.wrap({"id": "1", "items": ["apple"], "values": None})
+    assert list(order.items) == ["apple"]
+    assert order.get("id") == "1"
+
+    with pytest.raises(AttributeError):
+        profiler.wrap({"id": "2", "items": []}).values
+
+    assert profiler.report().exclude == ["values"]
+
+    # mapping methods of objects without such fields
+    data = OverfetchProfiler(["id", "name"]).wrap({"id": "1", "name": "a"})
+    assert data.items() == [("id", "1"), ("name", "a")]
+    assert list(data.keys()) == ["id", "name"]
+
+
+def test_threads():
+    profiler = OverfetchProfiler(Post)
+
+    def read(responses: List[dict], errors: List[Optional[Exception]]) -> None:
+        for data in responses:
+            post = profiler.wrap(data)
+            errors.append(None if post.title and post.author_.name else AssertionError())
+
+    errors: List[Optional[Exception]] = []
+    threads = [threading.Thread(target=read, args=(_responses(200), errors)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [None] * 1600
+    assert profiler.report().reads["author.name"] == 1600
+    assert profiler.report().requests == 1600
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.paginate import apaginate, apaginate_offsets, paginate, paginate_offsets
+
+USERS = [{"login": f"user{i}"} for i in range(25)]
+
+var_after = Variable(name="after", type="String")
+var_first = Variable(name="first", type="Int!")
+var_offset = Variable(name="offset", type="Int!")
+var_limit = Variable(name="limit", type="Int!")
+
+cursor_operation = Operation(
+    variables=[var_after, var_first],
+    queries=[
+        Query(
+            name="organization",
+            fields=[
+                Field(
+                    name="users",
+                    arguments=[Argument(name="after", value=var_after), Argument(name="first", value=var_first)],
+                    fields=["edges { node { login } }", "pageInfo { hasNextPage endCursor }"],
+                )
+            ],
+        )
+    ],
+)
+
+offset_operation = Operation(
+    variables=[var_offset, var_limit],
+    queries=[
+        Query(
+            name="users",
+            arguments=[Argument(name="offset", value=var_offset), Argument(name="limit", value=var_limit)],
+            fields=["login"],
+        )
+    ],
+)
+
+
+class Server:
+    """A stand-in server of users."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requests: List[Dict[str, Any]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def respond(self, body: bytes) -> bytes:
+        variables = json.loads(body)["variables"]
+        self.requests.append(variables)
+
+        if "offset" in variables:
+            users = USERS[variables["offset"] : variables["offset"] + variables["limit"]]
+            return json.dumps({"data": {"users": users}}).encode("utf-8")
+
+        start = int(variables.get("after", -1)) + 1
+        users = USERS[start : start + variables["first"]]
+        end = start + len(users) - 1
+        page_info = {"hasNextPage": end < len(USERS) - 1, "endCursor": str(end)}
+        connection = {"edges": [{"node": user} for user in users], "pageInfo": page_info}
+        return json.dumps({"data": {"organization": {"users": connection}}}).encode("utf-8")
+
+    def send(self, body: bytes) -> bytes:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        try:
+            return self.respond(body)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    async def asend(self, body: bytes) -> bytes:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self.respond(body)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_paginate(prefetch: bool):
+    server = Server()
+    users = list(paginate(cursor_operation, server.send, "organization.users", {"first": 10}, prefetch=prefetch))
+
+    assert users == USERS
+    assert server.requests == [{"first": 10}, {"first": 10, "after": "9"}, {"first": 10, "after": "19"}]
+
+
+def test_paginate_prefetches_next_page():
+    server = Server()
+    users = paginate(cursor_operation.compile(), server.send, "organization.users", {"first": 10, "after": "4"})
+
+    assert next(users) == USERS[5]
+    time.sleep(0.05)
+    assert len(server.requests) == 2
+
+    users.close()
+    assert len(server.requests) == 2
+
+
+def test_paginate_errors():
+    with pytest.raises(ValueError, match="after"):
+        list(paginate(offset_operation, Server().send, "users"))
+
+    with pytest.raises(ValueError, match="boom"):
+        list(
+            paginate(
+                cursor_operation, lambda body: {"data": None, "errors": [{"message": "boom"}]}, "users", {"first": 1}
+            )
+        )
+
+    with pytest.raises(ValueError):
+        list(paginate(cursor_operation, Server().send, "organization.members", {"first": 10}))
+
+
+def test_paginate_offsets():
+    server = Server(delay=0.01)
+    users = list(paginate_offsets(offset_operation, server.send, "users", page_size=4, concurrency=3))
+
+    assert users == USERS
+    assert server.max_active <= 3
+    assert sorted(request["offset"] for request in server.requests)[:7] == [0, 4, 8, 12, 16, 20, 24]
+
+
+def test_async_pagination():
+    async def main() -> None:
+        server = Server(delay=0.01)
+        users = [user async for user in apaginate(cursor_operation, server.asend, "organization.users", {"first": 7})]
+        assert users == USERS
+
+        server = Server(delay=0.01)
+        users = [
+            user
+            async for user in apaginate_offsets(offset_operation, server.asend, "users", page_size=5, concurrency=2)
+        ]
+        assert users == USERS
+        assert server.max_active == 2
+
+    asyncio.run(main())
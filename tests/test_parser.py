@@ -0,0 +1,149 @@
+import pytest
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.parser import GraphQLParseError, parse, parse_operations
+
+from .test_operation import operation_cases
+
+
+@pytest.mark.parametrize("type, name, variables, queries, fragments, result", operation_cases)
+def test_round_trip(type, name, variables, queries, fragments, result):
+    operation = Operation(type=type, name=name, variables=variables, queries=queries, fragments=fragments)
+
+    assert parse(operation.render()).render() == result
+
+
+def test_parse_nodes():
+    operation = parse("""
+        # a comment
+        query Hero($episode: Episode = JEDI, $withFriends: Boolean!) {
+          hero(episode: $episode) {
+            name
+            id: heroId
+            friends(first: 10) @include(if: $withFriends) { ...friendFields }
+            ... on Droid { primaryFunction }
+          }
+        }
+
+        fragment friendFields on Character {
+          __typename
+          name
+        }
+        """)
+
+    var_episode = Variable(name="episode", type="Episode", default="JEDI")
+    var_with_friends = Variable(name="withFriends", type="Boolean!")
+    fragment = Fragment(name="friendFields", type="Character", fields=["__typename", "name"])
+
+    assert operation == Operation(
+        type="query",
+        name="Hero",
+        variables=[var_episode, var_with_friends],
+        queries=[
+            Query(
+                name="hero",
+                arguments=[Argument(name="episode", value=var_episode)],
+                fields=[
+                    "name",
+                    Field(name="heroId", alias="id"),
+                    Field(
+                        name="friends",
+                        arguments=[Argument(name="first", value=10)],
+                        directives=[Directive(name="include", arguments=[Argument(name="if", value=var_with_friends)])],
+                        fields=[fragment],
+                    ),
+                    InlineFragment(type="Droid", fields=["primaryFunction"]),
+                ],
+            )
+        ],
+        fragments=[fragment],
+    )
+
+
+def test_parse_values():
+    operation = parse("""
+        {
+          search(
+            text: "hello, world"
+            limit: 10
+            ratio: -1.5e3
+            exact: false
+            sort: DESC
+            cursor: null
+            tags: ["a", "b"]
+            numbers: [1, 2]
+            enums: [A, B]
+            filter: {author: {name: "x"}, deleted: false}
+            objects: [{id: 1}, {id: 2}]
+            empty: {}
+          )
+        }
+        """)
+
+    assert operation.queries[0].arguments == [
+        Argument(name="text", value='"hello, world"'),
+        Argument(name="limit", value=10),
+        Argument(name="ratio", value=-1500.0),
+        Argument(name="exact", value=False),
+        Argument(name="sort", value="DESC"),
+        Argument(name="cursor", value="null"),
+        Argument(name="tags", value=["a", "b"]),
+        Argument(name="numbers", value=[1, 2]),
+        Argument(name="enums", value="[A, B]"),
+        Argument(
+            name="filter",
+            value=[
+                Argument(name="author", value=[Argument(name="name", value='"x"')]),
+                Argument(name="deleted", value=False),
+            ],
+        ),
+        Argument(name="objects", value=[[Argument(name="id", value=1)], [Argument(name="id", value=2)]]),
+        Argument(name="empty", value="{}"),
+    ]
+
+
+def test_fragment_variables_and_several_operations():
+    operations = parse_operations("""
+        query A($first: Int) { a { ...items } }
+        query B { b }
+        fragment items on Connection { items(first: $first) { id } }
+        """)
+
+    assert [operation.name for operation in operations] == ["A", "B"]
+    assert [fragment.name for fragment in operations[0].fragments] == ["items"]
+    assert operations[1].fragments == []
+
+    argument = operations[0].fragments[0].fields[0].arguments[0]
+    assert argument.value == Variable(name="first", type="Int")
+
+    with pytest.raises(ValueError):
+        parse("query A { a } query B { b }")
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "query {",
+        "query { hero { } }",
+        "query { hero(id: ) }",
+        "query { hero } }",
+        "query { hero { ...unknown } }",
+        "query @cached { hero }",
+        "query { ...heroFields }",
+        "query { hero @include(if: true) }",
+        "query { hero { ... { name } } }",
+        "query { hero(id: 1) { name } ? }",
+        "fragment on on Hero { name }",
+    ],
+)
+def test_errors(document: str):
+    with pytest.raises(GraphQLParseError):
+        parse(document)
+
+
+def test_error_position():
+    with pytest.raises(GraphQLParseError) as error:
+        parse("query {\n  hero {\n    name(\n  }\n}")
+
+    assert error.value.line == 4
+    assert error.value.column == 3
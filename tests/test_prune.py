@@ -0,0 +1,164 @@
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.prune import prune_conditions
+
+var_with_friends = Variable(name="withFriends", type="Boolean!")
+var_skip_name = Variable(name="skipName", type="Boolean!")
+var_ep = Variable(name="ep", type="Episode")
+var_first = Variable(name="first", type="Int")
+
+fragment_friend = Fragment(
+    name="friendFields",
+    type="Character",
+    fields=["name", Field(name="friendsConnection", arguments=[Argument(name="first", value=var_first)])],
+)
+
+
+def _include(variable):
+    return Directive(name="include", arguments=[Argument(name="if", value=variable)])
+
+
+def _skip(variable):
+    return Directive(name="skip", arguments=[Argument(name="if", value=variable)])
+
+
+def _operation():
+    return Operation(
+        name="Hero",
+        variables=[var_ep, var_with_friends, var_skip_name, var_first],
+        queries=[
+            Query(
+                name="hero",
+                arguments=[Argument(name="episode", value=var_ep)],
+                fields=[
+                    Field(name="name", directives=[_skip(var_skip_name)]),
+                    Field(name="friends", fields=[fragment_friend], directives=[_include(var_with_friends)]),
+                ],
+            )
+        ],
+        fragments=[fragment_friend],
+    )
+
+
+def test_exclude_subtrees():
+    result = prune_conditions(_operation(), {"withFriends": False, "skipName": False, "ep": "JEDI"})
+
+    assert result.render() == "query Hero(\n  $ep: Episode\n) {\n  hero(\n    episode: $ep\n  ) {\n    name\n  }\n}"
+
+
+def test_include_subtrees():
+    result = prune_conditions(_operation(), {"withFriends": True, "skipName": True})
+
+    assert [variable.name for variable in result.variables] == ["ep", "first"]
+    assert result.queries[0].fields == [Field(name="friends", fields=[fragment_friend])]
+    assert result.fragments == [fragment_friend]
+
+
+def test_unknown_values_are_kept():
+    operation = _operation()
+    result = prune_conditions(operation, {"withFriends": "yes"})
+
+    assert result == operation
+    assert result is not operation
+
+
+def test_literal_conditions_and_empty_selection_sets():
+    operation = Operation(
+        queries=[
+            Query(
+                name="hero",
+                fields=[
+                    Field(
+                        name="name",
+                        directives=[Directive(name="include", arguments=[Argument(name="if", value=False)])],
+                    ),
+                    InlineFragment(
+                        type="Droid",
+                        fields=[
+                            Field(
+                                name="model",
+                                directives=[
+                                    Directive(name="skip", arguments=[Argument(name="if", value="true")]),
+                                    Directive(name="deprecated"),
+                                ],
+                            )
+                        ],
+                    ),
+                ],
+            )
+        ]
+    )
+
+    result = prune_conditions(operation, {})
+
+    assert result.render() == "query {\n  hero {\n    ... on Droid {\n      __typename\n    }\n  }\n}"
+
+
+def test_result_is_cached_per_combination():
+    operation = _operation()
+
+    first = prune_conditions(operation, {"withFriends": True, "skipName": False, "ep": "JEDI"})
+    second = prune_conditions(operation, {"skipName": False, "withFriends": True, "ep": "EMPIRE"})
+    third = prune_conditions(operation, {"withFriends": False, "skipName": False})
+
+    assert first is second
+    assert first is not third
+    assert first != third
+
+
+def test_fragment_definition_with_empty_selection_set():
+    var_x = Variable(name="x", type="Boolean!")
+    fragment = Fragment(
+        name="F",
+        type="Hero",
+        fields=[
+            Field(name="name", directives=[Directive(name="include", arguments=[Argument(name="if", value=var_x)])])
+        ],
+    )
+    operation = Operation(
+        variables=[var_x], queries=[Query(name="hero", fields=["id", fragment])], fragments=[fragment]
+    )
+
+    pruned = prune_conditions(operation, {"x": False})
+
+    assert pruned.render() == ("query {\n  hero {\n    id\n    ...F\n  }\n}\n\nfragment F on Hero {\n  __typename\n}")
+    assert "name" in prune_conditions(operation, {"x": True}).render()
+
+
+def test_field_and_query_with_empty_selection_sets():
+    var_x = Variable(name="x", type="Boolean!")
+    name = Field(name="name", directives=[_include(var_x)])
+    operation = Operation(
+        variables=[var_x],
+        queries=[
+            Query(name="hero", fields=[Field(name="friends", fields=[name]), "id"]),
+            Query(name="viewer", typename=True, fields=[name]),
+        ],
+    )
+
+    pruned = prune_conditions(operation, {"x": False})
+
+    assert pruned.render() == (
+        "query {\n  hero {\n    friends {\n      __typename\n    }\n    id\n  }\n\n  viewer {\n    __typename\n  }\n}"
+    )
+
+
+def test_string_selections_keep_fragments_and_variables():
+    var_n = Variable(name="n", type="Int!")
+    var_x = Variable(name="x", type="Boolean!")
+    fragment = Fragment(name="F", type="Hero", fields=["id"])
+    operation = Operation(
+        variables=[var_n, var_x],
+        queries=[
+            Query(name="hero", fields=["...F", "pals(first: $n) { id }", Field(name="name", directives=[_skip(var_x)])])
+        ],
+        fragments=[fragment],
+    )
+
+    pruned = prune_conditions(operation, {"x": True})
+
+    assert pruned.variables == [var_n]
+    assert pruned.fragments == [fragment]
+
+    # a string which can't be parsed may use anything
+    operation = operation.model_copy(update={"queries": [Query(name="hero", fields=["... on Droid @x { id }"])]})
+    assert prune_conditions(operation, {"x": True}).variables == [var_n, var_x]
@@ -0,0 +1,145 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query import templates
+from graphql_query.body import request_body
+from graphql_query.render import render_bulk, render_many
+
+var_first = Variable(name="first", type="Int!", default="10")
+var_draft = Variable(name="draft", type="Boolean!")
+
+
+def _operation(i: int) -> Operation:
+    fragment = Fragment(name=f"Author{i}", type="User", fields=["id", "login"])
+    return Operation(
+        name=f"Feed{i}",
+        variables=[var_first, var_draft],
+        queries=[
+            Query(
+                name="posts",
+                alias=f"posts{i}",
+                arguments=[
+                    Argument(name="first", value=var_first),
+                    Argument(name="filter", value=[Argument(name="tags", value=[f'"tag{i}"', '"python"'])]),
+                ],
+                fields=[
+                    "id",
+                    Field(
+                        name="body",
+                        directives=[Directive(name="skip", arguments=[Argument(name="if", value=var_draft)])],
+                    ),
+                    Field(name="author", fields=[fragment]),
+                    InlineFragment(type="Video", fields=["duration"]),
+                ],
+            )
+        ],
+        fragments=[fragment],
+    )
+
+
+def _reset_templates():
+    for name in templates.__all__:
+        getattr(templates, name)._template = None
+
+
+def test_render_many_without_executor():
+    operations = [_operation(i) for i in range(5)]
+
+    assert render_many(operations) == [operation.render() for operation in operations]
+
+
+def test_render_many_keeps_order():
+    operations = [_operation(i) for i in range(100)]
+    expected = [operation.render() for operation in operations]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert render_many(operations, executor, chunk_size=7) == expected
+        assert render_many(operations, executor, chunk_size=1000) == expected
+        assert render_many([], executor) == []
+
+
+def test_render_many_process_pool():
+    operations = [_operation(i) for i in range(20)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert render_many(operations, executor, chunk_size=4) == [operation.render() for operation in operations]
+
+
+def test_concurrent_rendering_stress():
+    distinct = [_operation(i) for i in range(50)]
+    shared = _operation(1000)
+    expected = [operation.render() for operation in distinct]
+    expected_shared = shared.render()
+    expected_body = request_body(shared, {"draft": True})
+
+    # every thread loads templates and fills caches of nodes at the same time
+    _reset_templates()
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def worker(offset: int):
+        try:
+            barrier.wait()
+            for round in range(20):
+                order = distinct[offset:] + distinct[:offset]
+                assert [operation.render() for operation in order] == expected[offset:] + expected[:offset]
+                assert shared.render() == expected_shared
+                assert request_body(shared, {"draft": round % 2 == 0}) == expected_body.replace(
+                    b"true", b"true" if round % 2 == 0 else b"false"
+                )
+        except BaseException as error:  # pragma: no cover
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(offset * 6,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def _factory(i: int) -> Operation:
+    return _operation(i)
+
+
+class _MyField(Field):
+    pass
+
+
+def test_render_many_process_pool_with_subclasses():
+    operations = [Operation(queries=[Query(name="user", fields=[_MyField(name="id")])]), _operation(1)]
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert render_many(operations, executor) == [operation.render() for operation in operations]
+
+
+def test_render_bulk():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        documents = list(render_bulk(_factory, range(50), executor, chunk_size=3, max_pending=2))
+
+    assert documents == [_operation(i).render() for i in range(50)]
+    assert list(render_bulk(_factory, [], chunk_size=3)) == []
+
+
+def test_render_bulk_reads_inputs_lazily():
+    read = []
+
+    def inputs():
+        for i in range(1000):
+            read.append(i)
+            yield i
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        documents = render_bulk(_factory, inputs(), executor, chunk_size=10, max_pending=2)
+        assert next(documents) == _operation(0).render()
+        assert len(read) <= 30
+        documents.close()
+
+
+def test_render_bulk_errors():
+    with pytest.raises(ValueError):
+        next(render_bulk(_factory, range(3), chunk_size=0))
@@ -0,0 +1,347 @@
+import hashlib
+import json
+
+import pytest
+
+from graphql_query import Argument, Directive, Field, Fragment, InlineFragment, Operation, Query, Variable
+from graphql_query.parser import GraphQLParseError, parse
+from graphql_query.schema import (
+    _CACHE_HEADER,
+    _CACHE_MAGIC,
+    _CACHE_VERSION,
+    Schema,
+    SchemaArgument,
+    SchemaField,
+    ValidationError,
+    load_schema,
+)
+
+SDL = '''
+"""The root type."""
+schema { query: Root mutation: Mutation }
+
+directive @cached(ttl: Int!) on FIELD
+
+type Root {
+  "a hero of the episode"
+  hero(episode: Episode = JEDI): Character
+  search(text: String!, filter: SearchFilter, first: Int = 10): [SearchResult!]!
+}
+
+type Mutation {
+  createReview(episode: Episode!, review: ReviewInput!): Review
+}
+
+enum Episode { NEWHOPE EMPIRE JEDI @deprecated(reason: "old") }
+
+interface Character {
+  id: ID!
+  name: String!
+  friends(first: Int): [Character]
+}
+
+type Human implements Character { id: ID! name: String! friends(first: Int): [Character] height: Float }
+type Droid implements Character { id: ID! name: String! friends(first: Int): [Character] primaryFunction: String }
+type Starship { id: ID! length: Float }
+
+union SearchResult = | Human | Droid | Starship
+
+input SearchFilter { tags: [String!] episodes: [Episode!] after: Cursor }
+input ReviewInput { stars: Int! commentary: String }
+
+scalar Cursor
+type Review { stars: Int! }
+
+extend type Starship { name: String }
+'''
+
+
+def _type(name, kind="OBJECT"):
+    return {"kind": kind, "name": name, "ofType": None}
+
+
+def _non_null(ref):
+    return {"kind": "NON_NULL", "name": None, "ofType": ref}
+
+
+INTROSPECTION = {
+    "data": {
+        "__schema": {
+            "queryType": {"name": "Query"},
+            "mutationType": None,
+            "subscriptionType": None,
+            "types": [
+                {
+                    "kind": "OBJECT",
+                    "name": "Query",
+                    "fields": [
+                        {
+                            "name": "user",
+                            "args": [{"name": "id", "type": _non_null(_type("ID", "SCALAR")), "defaultValue": None}],
+                            "type": _type("User"),
+                        }
+                    ],
+                },
+                {
+                    "kind": "OBJECT",
+                    "name": "User",
+                    "fields": [
+                        {"name": "login", "args": [], "type": _non_null(_type("String", "SCALAR"))},
+                        {
+                            "name": "followers",
+                            "args": [{"name": "first", "type": _type("Int", "SCALAR"), "defaultValue": "10"}],
+                            "type": {"kind": "LIST", "name": None, "ofType": _type("User")},
+                        },
+                    ],
+                },
+            ],
+            "directives": [],
+        }
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def schema() -> Schema:
+    return Schema.from_sdl(SDL)
+
+
+def _messages(schema: Schema, operation: Operation):
+    return [str(error) for error in schema.validate(operation)]
+
+
+def test_sdl_indexes(schema: Schema):
+    assert schema.root_types == {"query": "Root", "mutation": "Mutation"}
+    assert schema.kinds["Character"] == "INTERFACE"
+    assert schema.kinds["Cursor"] == "SCALAR"
+    assert schema.fields["Root"]["hero"] == SchemaField(
+        type="Character", arguments={"episode": SchemaArgument(type="Episode", has_default=True)}
+    )
+    assert schema.fields["Starship"]["name"] == SchemaField(type="String", arguments={})
+    assert schema.input_fields["ReviewInput"]["stars"] == SchemaArgument(type="Int!")
+    assert schema.enum_values["Episode"] == frozenset(["NEWHOPE", "EMPIRE", "JEDI"])
+    assert schema.possible_types["Character"] == frozenset(["Human", "Droid"])
+    assert schema.possible_types["SearchResult"] == frozenset(["Human", "Droid", "Starship"])
+    assert schema.directives["cached"] == {"ttl": SchemaArgument(type="Int!")}
+
+
+def test_valid_operations(schema: Schema):
+    friend_fields = Fragment(name="friendFields", type="Character", fields=["name"])
+    var_episode = Variable(name="episode", type="Episode", default="EMPIRE")
+    var_tags = Variable(name="tags", type="[String!]")
+
+    operation = Operation(
+        variables=[var_episode, var_tags],
+        queries=[
+            Query(
+                name="hero",
+                alias="main",
+                arguments=[Argument(name="episode", value=var_episode)],
+                fields=[
+                    "id",
+                    "__typename",
+                    Field(
+                        name="friends",
+                        arguments=[Argument(name="first", value=3)],
+                        directives=[Directive(name="cached", arguments=[Argument(name="ttl", value=60)])],
+                        fields=[friend_fields],
+                    ),
+                    InlineFragment(type="Droid", fields=["primaryFunction"]),
+                ],
+            ),
+            Query(
+                name="search",
+                arguments=[
+                    Argument(name="text", value='"wing"'),
+                    Argument(
+                        name="filter",
+                        value=[
+                            Argument(name="tags", value=var_tags),
+                            Argument(name="episodes", value="[NEWHOPE, JEDI]"),
+                            Argument(name="after", value='"YXJyYXljb25uZWN0aW9uOjE="'),
+                        ],
+                    ),
+                ],
+                typename=True,
+                fields=[
+                    InlineFragment(type="Starship", fields=["length"]),
+                    InlineFragment(type="Character", fields=["id"]),
+                ],
+            ),
+        ],
+        fragments=[friend_fields],
+    )
+
+    assert schema.validate(operation) == []
+
+    mutation = Operation(
+        type="mutation",
+        queries=[
+            Query(
+                name="createReview",
+                arguments=[
+                    Argument(name="episode", value="JEDI"),
+                    Argument(name="review", value=Argument(name="stars", value=5)),
+                ],
+                fields=["stars"],
+            )
+        ],
+    )
+
+    assert schema.validate(mutation) == []
+
+
+def test_errors_have_paths(schema: Schema):
+    operation = parse("""
+        query ($text: String, $first: Int, $bad: Character) {
+          hero(episode: SITH, unknown: 1) {
+            nam
+            friends(first: "3") { id { x } name @cached }
+            ... on Starship { length }
+          }
+          search(text: $text, first: $first) { id }
+          second: hero
+        }
+        """)
+
+    assert _messages(schema, operation) == [
+        "$bad: Variable '$bad' has unknown or non-input type 'Character'.",
+        "hero(episode): Expected a value of enum 'Episode'.",
+        "hero: Unknown argument 'unknown' on field 'Root.hero'.",
+        "hero.nam: Cannot query field 'nam' on type 'Character'.",
+        "hero.friends(first): Expected a value of type 'Int'.",
+        "hero.friends.id: Field 'id' of type 'ID!' must not have a selection.",
+        "hero.friends.name: Argument 'ttl' of type 'Int!' is required on directive '@cached'.",
+        "hero.... on Starship: Type 'Starship' is not possible for 'Character'.",
+        "search(text): Variable '$text' of type 'String' can't be used as 'String!'.",
+        "search.id: Cannot query field 'id' on type 'SearchResult'.",
+        "second: Field 'hero' of type 'Character' must have a selection of subfields.",
+    ]
+
+
+def test_input_objects_and_fragments(schema: Schema):
+    operation = Operation(
+        type="mutation",
+        queries=[
+            Query(
+                name="createReview",
+                arguments=[
+                    Argument(name="episode", value="null"),
+                    Argument(name="review", value=[Argument(name="commentary", value=1)]),
+                ],
+                fields=["stars"],
+            )
+        ],
+        fragments=[Fragment(name="starship", type="Starship", fields=["size"])],
+    )
+
+    assert _messages(schema, operation) == [
+        "createReview(episode): Expected a non-null value of type 'Episode!'.",
+        "createReview(review.commentary): Expected a value of type 'String'.",
+        "createReview(review): Argument 'stars' of type 'Int!' is required on input type 'ReviewInput'.",
+        "fragment starship.size: Cannot query field 'size' on type 'Starship'.",
+    ]
+
+    missing = Fragment(name="missing", type="Character", fields=["id"])
+    assert _messages(schema, Operation(queries=[Query(name="hero", fields=[missing])])) == [
+        "hero: Unknown fragment 'missing'."
+    ]
+
+    assert _messages(schema, Operation(type="subscription", queries=[Query(name="x")])) == [
+        "The schema does not support 'subscription' operations."
+    ]
+
+
+def test_string_selections(schema: Schema):
+    character = Fragment(name="character", type="Character", fields=["name"])
+    operation = Operation(
+        variables=[Variable(name="first", type="Int")],
+        queries=[
+            Query(
+                name="hero",
+                fields=[
+                    "id",
+                    "friends(first: $first) { name height ...character }",
+                    "... on Droid { primaryFunction size }",
+                    "friends { ",
+                ],
+            )
+        ],
+        fragments=[character],
+    )
+
+    messages = _messages(schema, operation)
+
+    assert messages[:2] == [
+        "hero.friends.height: Cannot query field 'height' on type 'Character'.",
+        "hero.... on Droid.size: Cannot query field 'size' on type 'Droid'.",
+    ]
+    assert len(messages) == 3
+    assert messages[2].startswith("hero: Invalid selection 'friends {': ")
+
+
+def test_introspection(tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(INTROSPECTION))
+
+    schema = load_schema(path)
+
+    assert schema.root_types == {"query": "Query"}
+    assert schema.fields["User"]["followers"].type == "[User]"
+    assert schema.fields["Query"]["user"].arguments == {"id": SchemaArgument(type="ID!")}
+
+    operation = parse('{ user(id: 1) { login followers { login } } viewer: user { login } }')
+    assert schema.validate(operation) == [
+        ValidationError(path="viewer", message="Argument 'id' of type 'ID!' is required on field 'Query.user'.")
+    ]
+
+
+def test_load_sdl(tmp_path):
+    path = tmp_path / "schema.graphql"
+    path.write_text(SDL)
+
+    assert Schema.load(path).fields == Schema.from_sdl(SDL).fields
+
+    with pytest.raises(GraphQLParseError):
+        Schema.from_sdl("type Query { hero: }")
+
+
+def test_binary_cache(tmp_path):
+    path = tmp_path / "schema.graphql"
+    cache_path = tmp_path / "schema.cache"
+    path.write_text(SDL)
+
+    schema = load_schema(path, cache_path)
+    assert cache_path.exists()
+
+    cached = load_schema(path, cache_path)
+    assert cached.__dict__ == schema.__dict__
+    assert cached.validate(parse("{ hero { nam } }")) == [
+        ValidationError(path="hero.nam", message="Cannot query field 'nam' on type 'Character'.")
+    ]
+
+    # a changed schema rebuilds the cache
+    path.write_text(SDL + "type Planet { name: String }")
+    assert "Planet" in load_schema(path, cache_path).kinds
+    assert "Planet" in Schema.read_cache(cache_path, hashlib.sha256(path.read_bytes()).digest()).kinds
+
+    cache_path.write_bytes(b"broken")
+    assert Schema.read_cache(cache_path, hashlib.sha256(path.read_bytes()).digest()) is None
+    assert "Planet" in load_schema(path, cache_path).kinds
+
+    # writers use their own temporary files, nothing is left next to the cache
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["schema.cache", "schema.graphql"]
+
+
+def test_stale_binary_cache(tmp_path):
+    path = tmp_path / "schema.graphql"
+    cache_path = tmp_path / "schema.cache"
+    path.write_text(SDL)
+    digest = hashlib.sha256(path.read_bytes()).digest()
+    header = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, digest)
+
+    # pickles of classes and modules which don't exist anymore, and of another state
+    for state in (b"cgraphql_query.schema\n_Removed\n.", b"cgraphql_query_removed\nSchema\n.", b"I1\n."):
+        cache_path.write_bytes(header + state)
+        assert Schema.read_cache(cache_path, digest) is None
+        assert "Character" in load_schema(path, cache_path).kinds
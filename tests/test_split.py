@@ -0,0 +1,125 @@
+import pytest
+
+from graphql_query import Argument, Field, Fragment, Operation, Query, Variable
+from graphql_query.split import merge_responses, split_operation
+
+var_owner = Variable(name="owner", type="String!")
+var_first = Variable(name="first", type="Int")
+
+user_fields = Fragment(name="userFields", type="User", fields=["login", "name"])
+
+
+def _operation() -> Operation:
+    return Operation(
+        name="Dashboard",
+        variables=[var_owner, var_first],
+        queries=[
+            Query(name="viewer", fields=[user_fields]),
+            Query(
+                name="repositories",
+                arguments=[Argument(name="owner", value=var_owner)],
+                fields=["totalCount", Field(name="nodes", fields=["name", "stars"])],
+            ),
+            Query(
+                name="issues",
+                arguments=[Argument(name="first", value=var_first)],
+                fields=["title", Field(name="author", fields=[user_fields])],
+            ),
+        ],
+        fragments=[user_fields],
+    )
+
+
+def test_operation_which_fits():
+    operation = _operation()
+
+    assert split_operation(operation, max_cost=100) == [operation]
+
+
+def test_split_queries():
+    parts = split_operation(_operation(), max_cost=8)
+
+    assert [[query.name for query in part.queries] for part in parts] == [["viewer", "repositories"], ["issues"]]
+    assert [[variable.name for variable in part.variables] for part in parts] == [["owner"], ["first"]]
+    assert [[fragment.name for fragment in part.fragments] for part in parts] == [["userFields"], ["userFields"]]
+    assert all(part.name == "Dashboard" for part in parts)
+
+
+def test_custom_cost():
+    parts = split_operation(_operation(), max_cost=180, cost=lambda operation: len(operation.render()))
+
+    assert [len(part.render()) for part in parts] == [100, 140, 171]
+    assert [[query.name for query in part.queries] for part in parts] == [["viewer"], ["repositories"], ["issues"]]
+
+
+def test_string_selections():
+    operation = Operation(
+        variables=[var_owner, var_first],
+        queries=[
+            Query(name="viewer", fields=["...userFields"]),
+            Query(name="repositories", arguments=[Argument(name="owner", value=var_owner)], fields=["totalCount"]),
+            Query(name="issues", fields=["nodes(first: $first) { title }"]),
+        ],
+        fragments=[user_fields],
+    )
+
+    parts = split_operation(operation, max_cost=1, cost=lambda part: len(part.queries), deep=False)
+
+    assert [[variable.name for variable in part.variables] for part in parts] == [[], ["owner"], ["first"]]
+    assert [[fragment.name for fragment in part.fragments] for part in parts] == [["userFields"], [], []]
+
+
+def test_deep_split_and_merge():
+    operation = Operation(
+        queries=[
+            Query(
+                name="repository",
+                fields=[
+                    "name",
+                    Field(
+                        name="issues",
+                        arguments=[Argument(name="first", value=10)],
+                        fields=["title", "body", Field(name="author", fields=["login", "name"])],
+                    ),
+                ],
+            )
+        ]
+    )
+
+    parts = split_operation(operation, max_cost=35)
+
+    assert [part.render().replace(" ", "").replace("\n", "") for part in parts] == [
+        "query{repository{nameissues(first:10){titlebody}}}",
+        "query{repository{issues(first:10){author{loginname}}}}",
+    ]
+
+    responses = [
+        {
+            "repository": {
+                "name": "graphql-query",
+                "issues": [{"title": "a", "body": "b"}, {"title": "c", "body": None}],
+            }
+        },
+        {"repository": {"issues": [{"author": {"login": "x", "name": "X"}}, {"author": None}]}},
+    ]
+
+    assert merge_responses(responses) == {
+        "repository": {
+            "name": "graphql-query",
+            "issues": [
+                {"title": "a", "body": "b", "author": {"login": "x", "name": "X"}},
+                {"title": "c", "body": None, "author": None},
+            ],
+        }
+    }
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        split_operation(Operation(type="mutation", queries=[Query(name="a", fields=["b", "c"])]), max_cost=1)
+
+    with pytest.raises(ValueError):
+        split_operation(_operation(), max_cost=1)
+
+    with pytest.raises(ValueError):
+        merge_responses([{"items": [{"a": 1}]}, {"items": []}])
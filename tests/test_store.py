@@ -0,0 +1,125 @@
+import os
+import threading
+
+import pytest
+
+from graphql_query import Argument, Operation, Query
+from graphql_query.store import DocumentStore, DocumentStoreWriter, document_hash
+
+
+@pytest.fixture
+def operations():
+    return [
+        Operation(queries=[Query(name="hero", fields=["name"])]),
+        Operation(name="Human", queries=[Query(name="human", arguments=[Argument(name="id", value='"1000"')])]),
+        Operation(type="mutation", queries=[Query(name="createReview", fields=["stars"])]),
+    ]
+
+
+def test_write_and_read(tmp_path, operations):
+    path = tmp_path / "documents.gqlstore"
+
+    writer = DocumentStoreWriter()
+    keys = [writer.add(operation) for operation in operations]
+    writer.write(path)
+
+    with DocumentStore(path) as store:
+        assert len(store) == len(operations)
+        assert sorted(store) == sorted(keys)
+
+        for key, operation in zip(keys, operations):
+            assert key == document_hash(operation.render())
+            assert key in store
+            assert store[key] == operation.render()
+            assert store.get(bytes.fromhex(key)) == operation.render()
+
+
+def test_concurrent_writers(tmp_path, operations):
+    path = tmp_path / "documents.gqlstore"
+    writers = []
+    for operation in operations:
+        writer = DocumentStoreWriter()
+        writer.add(operation)
+        writers.append(writer)
+
+    threads = [threading.Thread(target=writer.write, args=(path,)) for writer in writers * 10]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # every writer writes its own temporary file, the store is one of the written ones
+    assert os.listdir(tmp_path) == ["documents.gqlstore"]
+    with DocumentStore(path) as store:
+        assert len(store) == 1
+
+
+def test_failed_write_keeps_the_store(tmp_path, operations, monkeypatch):
+    path = tmp_path / "documents.gqlstore"
+    writer = DocumentStoreWriter()
+    writer.add(operations[0])
+    writer.write(path)
+
+    def replace(*args):
+        raise OSError("disk is full")
+
+    monkeypatch.setattr(os, "replace", replace)
+    writer.add(operations[1])
+    with pytest.raises(OSError):
+        writer.write(path)
+
+    assert os.listdir(tmp_path) == ["documents.gqlstore"]
+    with DocumentStore(path) as store:
+        assert len(store) == 1
+
+
+def test_missing_keys(tmp_path, operations):
+    path = tmp_path / "documents.gqlstore"
+
+    writer = DocumentStoreWriter()
+    for operation in operations:
+        writer.add(operation)
+    writer.write(path)
+
+    with DocumentStore(path) as store:
+        assert store.get(document_hash("query { unknown }")) is None
+        assert store.get("not a hash", "default") == "default"
+        assert "0" * 64 not in store
+        assert 1 not in store
+
+        with pytest.raises(KeyError):
+            store["f" * 64]
+
+
+def test_duplicates_and_text_documents(tmp_path):
+    path = tmp_path / "documents.gqlstore"
+
+    writer = DocumentStoreWriter()
+    key_1 = writer.add("query { hero { name } }")
+    key_2 = writer.add("query { hero { name } }")
+    writer.write(path)
+
+    assert key_1 == key_2
+    assert len(writer) == 1
+
+    with DocumentStore(path) as store:
+        assert list(store) == [key_1]
+        assert store[key_1] == "query { hero { name } }"
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "documents.gqlstore"
+    DocumentStoreWriter().write(path)
+
+    with DocumentStore(path) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        assert store.get("0" * 64) is None
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "documents.json"
+    path.write_text('{"hash": "query { hero { name } }"}')
+
+    with pytest.raises(ValueError):
+        DocumentStore(path)
@@ -0,0 +1,40 @@
+from typing import List, Union
+
+from pydantic import Field as PydanticField
+
+from graphql_query import Field, GraphQLQueryBaseModel, InlineFragment
+
+
+class Droid(GraphQLQueryBaseModel):
+    name: str
+    primaryFunction: str
+
+
+class Human(GraphQLQueryBaseModel):
+    name: str
+    height: float
+
+
+class Friend(GraphQLQueryBaseModel):
+    name: str
+    height: float
+
+
+class Hero(GraphQLQueryBaseModel):
+    name: str
+    friends: List[Friend] = PydanticField(json_schema_extra={"graphql_alias": "allFriends"})
+    details: Union[Human, Droid]
+
+
+def test_exclude():
+    assert Hero.graphql_fields(exclude=[]) == Hero.graphql_fields()
+
+    assert Hero.graphql_fields(exclude=["allFriends.height", "details.name", "details.primaryFunction"]) == [
+        Field(name="name"),
+        Field(name="friends", alias="allFriends", fields=[Field(name="name")]),
+        Field(name="details", fields=[InlineFragment(type="Human", fields=[Field(name="height")])]),
+    ]
+
+
+def test_exclude_all_fields_of_object():
+    assert Hero.graphql_fields(exclude=["allFriends.name", "allFriends.height", "details"]) == [Field(name="name")]